@@ -59,7 +59,14 @@ async def run_async_migrations() -> None:
 
 
 def run_migrations_online() -> None:
-    asyncio.run(run_async_migrations())
+    # A caller that already holds a connection (the test fixtures, via
+    # ``config.attributes["connection"]``) runs the migrations on it; this
+    # also avoids ``asyncio.run`` inside an already running event loop.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
@@ -0,0 +1,63 @@
+"""add indexes for the list endpoints
+
+Composite indexes in the sort order of each ``get_all`` repository query,
+partial on the public filters (``published`` / ``featured``), so listing
+reads rows pre-sorted instead of scanning and sorting the whole table.
+
+Revision ID: a6789012345f
+Revises: f5678901234e
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6789012345f"
+down_revision: str | None = "f5678901234e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_projects_published_order",
+        "projects",
+        ["order", sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("published"),
+    )
+    op.create_index(
+        "ix_projects_featured_order",
+        "projects",
+        ["order", sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("published AND featured"),
+    )
+    op.create_index(
+        "ix_posts_published_created_at",
+        "posts",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("published"),
+    )
+    op.create_index(
+        "ix_certifications_issued_at",
+        "certifications",
+        [sa.text("issued_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_certifications_featured_issued_at",
+        "certifications",
+        [sa.text("issued_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("featured"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_certifications_featured_issued_at", table_name="certifications")
+    op.drop_index("ix_certifications_issued_at", table_name="certifications")
+    op.drop_index("ix_posts_published_created_at", table_name="posts")
+    op.drop_index("ix_projects_featured_order", table_name="projects")
+    op.drop_index("ix_projects_published_order", table_name="projects")
@@ -0,0 +1,42 @@
+"""add rate_limit_counters table
+
+Shared sliding-window counters for the Postgres mode of the login limiter
+(``LOGIN_RATE_LIMIT_BACKEND=postgres``).  One row per key; ``window`` is
+indexed so expired rows can be swept cheaply.
+
+Revision ID: e4567890123d
+Revises: d3456789012c
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4567890123d"
+down_revision: str | None = "d3456789012c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_counters",
+        sa.Column("key", sa.String(length=320), nullable=False),
+        sa.Column("window", sa.BigInteger(), nullable=False),
+        sa.Column("current_count", sa.Integer(), nullable=False),
+        sa.Column("previous_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_rate_limit_counters_window"), "rate_limit_counters", ["window"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_rate_limit_counters_window"), table_name="rate_limit_counters")
+    op.drop_table("rate_limit_counters")
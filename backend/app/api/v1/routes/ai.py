@@ -1,16 +1,31 @@
+import json
 import logging
+import time
+import uuid
 from collections.abc import AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
-from app.core.deps import get_current_superuser
+from app.core.config import settings
+from app.core.constants import AI_WRITE_QUEUE_POLL_SECONDS
+from app.core.deps import get_current_superuser, get_optional_user
 from app.core.exceptions import AIServiceError
-from app.db.session import get_db
-from app.schemas.ai import EmbedStatus, ReEmbedResult, WriteRequest
+from app.core.metrics import AI_WRITE_QUEUE_SECONDS
+from app.db.session import AsyncSessionLocal, get_db
+from app.schemas.ai import (
+    EmbedStatus,
+    MetadataJobRequest,
+    MetadataJobStatus,
+    ReEmbedResult,
+    WriteRequest,
+)
 from app.schemas.auth import UserResponse
+from app.services.ai.admission import AdmissionController, AdmissionTicket
 from app.services.ai.client import get_chat_client, get_embed_client
+from app.services.ai.metadata_service import MetadataService
 from app.services.ai.rag_service import RagService
 from app.services.ai.writing_service import WritingService
 
@@ -19,10 +34,35 @@ logger = logging.getLogger(__name__)
 
 writing_service = WritingService(get_chat_client())
 rag_service = RagService(get_embed_client())
+metadata_service = MetadataService(writing_service, AsyncSessionLocal)
+write_admission = AdmissionController(
+    max_in_flight=settings.AI_WRITE_MAX_IN_FLIGHT,
+    max_queue=settings.AI_WRITE_MAX_QUEUE,
+    retry_after=settings.AI_WRITE_RETRY_AFTER,
+)
 
 
-async def stream_response(request: WriteRequest) -> AsyncGenerator[str, None]:
+async def stream_response(
+    request: WriteRequest, ticket: AdmissionTicket
+) -> AsyncGenerator[str, None]:
     try:
+        # ── Queue — report position changes until a slot is handed over ──
+        queued_at = time.monotonic()
+        deadline = queued_at + settings.AI_WRITE_QUEUE_TIMEOUT
+        last_position = 0
+        while not ticket.granted:
+            position = write_admission.position(ticket)
+            if position != last_position:
+                yield f"event: queue\ndata: {json.dumps({'position': position})}\n\n"
+                last_position = position
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                yield "event: error\ndata: Timed out waiting for the AI writing assistant\n\n"
+                yield "data: [DONE]\n\n"
+                return
+            await write_admission.wait(ticket, timeout=min(remaining, AI_WRITE_QUEUE_POLL_SECONDS))
+        AI_WRITE_QUEUE_SECONDS.observe(time.monotonic() - queued_at)
+
         async for chunk in writing_service.stream(request):
             yield f"data: {chunk}\n\n"
         yield "data: [DONE]\n\n"
@@ -30,25 +70,47 @@ async def stream_response(request: WriteRequest) -> AsyncGenerator[str, None]:
         logger.exception("AI stream error: %s", exc.message)
         yield f"event: error\ndata: {exc.message}\n\n"
         yield "data: [DONE]\n\n"
+    finally:
+        write_admission.release(ticket)
 
 
 @router.post("/write")
-async def ai_write(request: WriteRequest) -> StreamingResponse:
+async def ai_write(
+    request: WriteRequest,
+    current_user: UserResponse | None = Depends(get_optional_user),
+) -> StreamingResponse:
+    """Stream a writing-assistant completion as Server-Sent Events.
+
+    Concurrent streams are capped by ``AI_WRITE_MAX_IN_FLIGHT``.  Requests
+    over the cap wait in a bounded queue and receive ``event: queue`` frames
+    (``data: {"position": N}``) whenever their position changes.  Superusers
+    wait in a priority lane ahead of anonymous callers.
+
+    Raises:
+        HTTPException: HTTP 422 when the prompt is blank.
+        RateLimitError: HTTP 429 with ``Retry-After`` when the queue is full.
+    """
     if not request.prompt.strip():
         raise HTTPException(status_code=422, detail="Prompt must not be empty")
+
+    priority = current_user is not None and current_user.is_superuser
+    ticket = write_admission.enqueue(priority=priority)
     return StreamingResponse(
-        stream_response(request),
+        stream_response(request, ticket),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
         },
+        # Safety net: frees the ticket even if the client disconnects before
+        # the generator body ever runs (release is idempotent).
+        background=BackgroundTask(write_admission.release, ticket),
     )
 
 
 @router.get("/embed-status")
 async def ai_embed_status(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     _: UserResponse = Depends(get_current_superuser),
 ) -> EmbedStatus:
     """Return index counts for every content table.
@@ -60,7 +122,7 @@ async def ai_embed_status(
 
 @router.post("/re-embed")
 async def ai_re_embed(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     _: UserResponse = Depends(get_current_superuser),
 ) -> ReEmbedResult:
     """Re-generate embeddings for every project, post, and certification.
@@ -69,3 +131,56 @@ async def ai_re_embed(
     depending on the number of rows and the speed of the embedding model.
     """
     return await rag_service.re_embed_all(db)
+
+
+@router.post("/metadata-jobs", status_code=202)
+async def ai_start_metadata_job(
+    request: MetadataJobRequest,
+    _: UserResponse = Depends(get_current_superuser),
+) -> MetadataJobStatus:
+    """Start a background job that generates excerpts, reading times and tags.
+
+    Returns immediately; poll ``GET /ai/metadata-jobs/{job_id}`` for progress.
+    Pass a previous job's ``cursor`` as ``resume_from`` to continue where it
+    stopped.
+
+    Protected: superuser only.
+
+    Raises:
+        ConflictError: HTTP 409 when a job is already running.
+    """
+    return metadata_service.start(request)
+
+
+@router.get("/metadata-jobs/{job_id}")
+async def ai_get_metadata_job(
+    job_id: uuid.UUID,
+    _: UserResponse = Depends(get_current_superuser),
+) -> MetadataJobStatus:
+    """Return the progress of a metadata job.
+
+    Protected: superuser only.
+
+    Raises:
+        JobNotFoundError: HTTP 404 when the job is unknown to this worker.
+    """
+    return metadata_service.get(job_id)
+
+
+@router.post("/metadata-jobs/{job_id}/cancel")
+async def ai_cancel_metadata_job(
+    job_id: uuid.UUID,
+    _: UserResponse = Depends(get_current_superuser),
+) -> MetadataJobStatus:
+    """Cancel a running metadata job.  Batches already written are kept.
+
+    Protected: superuser only.
+
+    Responds once the job has stopped, with its final status: ``cancelled``
+    (or ``completed`` / ``failed`` if it ended first — never ``running``)
+    and the ``cursor`` to pass back as ``resume_from``.
+
+    Raises:
+        JobNotFoundError: HTTP 404 when the job is unknown to this worker.
+    """
+    return await metadata_service.cancel(job_id)
@@ -14,9 +14,9 @@ frontend Hey API client ensures cross-origin requests (dev proxy) also carry it.
 The cookie is **not** accessible to JavaScript (``httpOnly=True``), so it cannot
 be stolen by XSS attacks.
 
-The ``POST /auth/logout`` endpoint clears the cookie server-side.  Because JWTs
-are stateless there is no server-side session to invalidate — the client must
-discard any in-memory copy of the token after calling this endpoint.
+The ``POST /auth/logout`` endpoint clears the cookie and revokes the token:
+its ``jti`` is added to a deny-list (see ``app.core.revocation``) so a copy
+of the token is rejected by every worker until it expires.
 
 Secure flag
 -----------
@@ -33,12 +33,13 @@ changed to ``SameSite=None; Secure``.
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.core.deps import get_access_token, get_current_user
+from app.core.rate_limit import build_login_throttle
+from app.db.session import AsyncSessionLocal, get_db
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import LoginRequest, TokenResponse, UserResponse
 from app.services.auth_service import AuthenticationError, AuthService, InactiveUserError
@@ -55,18 +56,18 @@ _COOKIE_NAME = "access_token"
 _COOKIE_MAX_AGE = settings.JWT_EXPIRE_MINUTES * 60  # seconds
 _COOKIE_SECURE = settings.ENVIRONMENT != "development"
 
+# Checked before any DB or bcrypt work — see app/core/rate_limit.py
+login_throttle = build_login_throttle(AsyncSessionLocal)
+
 
 # ---------------------------------------------------------------------------
 # Dependencies
 # ---------------------------------------------------------------------------
 
 
-def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+def get_auth_service() -> AuthService:
     """Construct an :class:`~app.services.auth_service.AuthService` for a request.
 
-    Args:
-        db: Injected async database session.
-
     Returns:
         A fresh :class:`~app.services.auth_service.AuthService` bound to a new
         :class:`~app.repositories.user_repository.UserRepository`.
@@ -86,8 +87,9 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
 )
 async def login(
     data: LoginRequest,
+    request: Request,
     response: Response,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> TokenResponse:
     """Authenticate with email + password.
@@ -98,8 +100,14 @@ async def login(
     2. Returned in the response body — used by API clients, tests, and the
        OpenAPI ``/docs`` UI.
 
+    Attempts are throttled per client IP and per (email, client IP) before
+    the user lookup or bcrypt check runs.  Behind a reverse proxy the client
+    IP comes from ``X-Forwarded-For`` when the proxy is listed in
+    ``TRUSTED_PROXIES``.
+
     Args:
         data: Login credentials — ``email`` and ``password``.
+        request: The incoming request, used for the client IP.
         response: FastAPI response object used to set the cookie.
         db: Active async database session.
         auth_service: Injected auth service.
@@ -113,6 +121,8 @@ async def login(
             is incorrect.  The error message is deliberately vague to avoid
             leaking whether the email exists.
         HTTPException: HTTP 403 when the account has been deactivated.
+        RateLimitError: HTTP 429 with ``Retry-After`` when the IP, or the
+            email from this IP, has made too many attempts.
 
     Example::
 
@@ -125,6 +135,9 @@ async def login(
         Set-Cookie: access_token=<JWT>; HttpOnly; SameSite=Lax; Path=/
         {"access_token": "<JWT>", "token_type": "bearer"}
     """
+    client_ip = request.client.host if request.client else None
+    await login_throttle.check(ip=client_ip, email=data.email)
+
     try:
         token_response = await auth_service.login(db, email=data.email, password=data.password)
     except AuthenticationError as exc:
@@ -207,25 +220,27 @@ async def me(
 )
 async def logout(
     response: Response,
+    token: str = Depends(get_access_token),
     _: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+    auth_service: AuthService = Depends(get_auth_service),
 ) -> None:
     """Log out the currently authenticated user.
 
     Clears the ``access_token`` httpOnly cookie so the browser stops sending
-    it on subsequent requests.
-
-    JWT tokens are stateless — there is no server-side session to invalidate.
-    The token technically remains valid until its ``exp`` claim is reached.
-    For the portfolio's use case (single owner, long-lived sessions) this is
-    an acceptable trade-off.  If token revocation becomes a requirement,
-    introduce a Redis-backed blocklist and check it in
-    :func:`~app.core.deps.get_current_user`.
+    it on subsequent requests, and revokes the token server-side: its
+    ``jti`` is recorded in the ``revoked_tokens`` table and every worker's
+    in-memory deny-list, so any other copy of the token is rejected with
+    HTTP 401 until it expires.
 
     Args:
         response: FastAPI response object used to delete the cookie.
+        token: The raw JWT being logged out.
         _: The authenticated user — required only to enforce that an active
             session exists before clearing it.  The value is intentionally
             discarded.
+        db: Active async database session.
+        auth_service: Injected auth service.
 
     Returns:
         ``None`` — HTTP 204 No Content.
@@ -241,6 +256,14 @@ async def logout(
         → 204 No Content
         Set-Cookie: access_token=; Max-Age=0; Path=/
     """
+    try:
+        await auth_service.logout(db, token=token)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from exc
     response.delete_cookie(
         key=_COOKIE_NAME,
         httponly=True,
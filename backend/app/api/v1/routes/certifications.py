@@ -6,11 +6,13 @@ records. Write operations are protected by superuser authentication.
 
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.constants import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
 from app.core.deps import get_current_superuser
-from app.db.session import get_db
+from app.core.responses import AdapterJSONResponse, list_adapter, page_adapter
+from app.db.session import get_db, get_read_db
 from app.repositories.certification_repository import CertificationRepository
 from app.schemas.auth import UserResponse
 from app.schemas.certification import (
@@ -18,49 +20,78 @@ from app.schemas.certification import (
     CertificationResponse,
     CertificationUpdate,
 )
+from app.schemas.pagination import Page
 from app.services.certification_service import CertificationService
 
 router = APIRouter(prefix="/certifications", tags=["certifications"])
 
 
-def get_certification_service(db: AsyncSession = Depends(get_db)) -> CertificationService:
-    """Construct a CertificationService bound to the current database session."""
-    _ = db
+def get_certification_service() -> CertificationService:
+    """Construct a CertificationService.  Sessions are passed to each method by the route."""
     return CertificationService(CertificationRepository())
 
 
 @router.get("/", response_model=list[CertificationResponse])
 async def get_certifications(
     featured_only: bool = False,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     service: CertificationService = Depends(get_certification_service),
-) -> list[CertificationResponse]:
+) -> AdapterJSONResponse:
     """Retrieve a list of certifications.
 
     Args:
         featured_only: If ``True``, returns only featured certifications.
             Defaults to ``False`` (return all certifications).
-        db: Active async database session.
+        db: Read-only session (replica when configured).
         service: Injected certification service.
 
     Returns:
         A list of :class:`~app.schemas.certification.CertificationResponse`
         objects ordered by ``issued_at`` descending (most recent first).
     """
-    return await service.get_all(db, featured_only=featured_only)
+    items = await service.get_all(db, featured_only=featured_only)
+    return AdapterJSONResponse(items, adapter=list_adapter(CertificationResponse))
+
+
+@router.get("/page", response_model=Page[CertificationResponse])
+async def get_certifications_page(
+    cursor: str | None = None,
+    limit: int = Query(default=PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+    featured_only: bool = False,
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+    service: CertificationService = Depends(get_certification_service),
+) -> AdapterJSONResponse:
+    """Retrieve one page of certifications, in the same order as ``GET /``.
+
+    Args:
+        cursor: ``next_cursor`` from the previous page; omit for the first.
+        limit: Maximum number of certifications on the page.
+        featured_only: If ``True``, only featured certifications.
+        db: Read-only session (replica when configured).
+        service: Injected certification service.
+
+    Returns:
+        A :class:`~app.schemas.pagination.Page` of certifications; its
+        ``next_cursor`` is ``null`` on the last page.
+
+    Raises:
+        HTTPException: HTTP 422 if ``cursor`` is malformed.
+    """
+    page = await service.get_page(db, cursor=cursor, limit=limit, featured_only=featured_only)
+    return AdapterJSONResponse(page, adapter=page_adapter(CertificationResponse))
 
 
 @router.get("/{cert_id}", response_model=CertificationResponse)
 async def get_certification(
     cert_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     service: CertificationService = Depends(get_certification_service),
 ) -> CertificationResponse:
     """Retrieve a single certification by its UUID.
 
     Args:
         cert_id: The UUID primary key of the certification.
-        db: Active async database session.
+        db: Read-only session (replica when configured).
         service: Injected certification service.
 
     Returns:
@@ -76,7 +107,7 @@ async def get_certification(
 async def create_certification(
     data: CertificationCreate,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: CertificationService = Depends(get_certification_service),
 ) -> CertificationResponse:
     """Create a new certification record.
@@ -100,7 +131,7 @@ async def update_certification(
     cert_id: uuid.UUID,
     data: CertificationUpdate,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: CertificationService = Depends(get_certification_service),
 ) -> CertificationResponse:
     """Update an existing certification record.
@@ -127,7 +158,7 @@ async def update_certification(
 async def delete_certification(
     cert_id: uuid.UUID,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: CertificationService = Depends(get_certification_service),
 ) -> None:
     """Delete a certification record.
@@ -4,57 +4,89 @@ Provides endpoints for creating, reading, updating, and deleting blog posts.
 Write operations are protected by superuser authentication.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.constants import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
 from app.core.deps import get_current_superuser
-from app.db.session import get_db
+from app.core.responses import AdapterJSONResponse, list_adapter, page_adapter
+from app.db.session import get_db, get_read_db
 from app.repositories.post_repository import PostRepository
 from app.schemas.auth import UserResponse
-from app.schemas.post import PostCreate, PostResponse, PostUpdate
+from app.schemas.pagination import Page
+from app.schemas.post import PostCreate, PostResponse, PostSummary, PostUpdate
 from app.services.post_service import PostService
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
 
-def get_post_service(db: AsyncSession = Depends(get_db)) -> PostService:
-    """Construct a PostService bound to the current database session."""
-    _ = db
+def get_post_service() -> PostService:
+    """Construct a PostService.  Sessions are passed to each method by the route."""
     return PostService(PostRepository())
 
 
 @router.get("/", response_model=list[PostResponse])
 async def get_posts(
     published_only: bool = True,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     service: PostService = Depends(get_post_service),
-) -> list[PostResponse]:
+) -> AdapterJSONResponse:
     """Retrieve a list of blog posts.
 
     Args:
         published_only: If ``True``, returns only published posts.
             Defaults to ``True``.
-        db: Active async database session.
+        db: Read-only session (replica when configured).
         service: Injected post service.
 
     Returns:
         A list of :class:`~app.schemas.post.PostResponse` objects ordered
         by ``created_at`` descending (newest first).
     """
-    return await service.get_all(db, published_only=published_only)
+    items = await service.get_all(db, published_only=published_only)
+    return AdapterJSONResponse(items, adapter=list_adapter(PostResponse))
+
+
+@router.get("/page", response_model=Page[PostSummary])
+async def get_posts_page(
+    cursor: str | None = None,
+    limit: int = Query(default=PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+    published_only: bool = True,
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+    service: PostService = Depends(get_post_service),
+) -> AdapterJSONResponse:
+    """Retrieve one page of posts, in the same order as ``GET /``.
+
+    Args:
+        cursor: ``next_cursor`` from the previous page; omit for the first.
+        limit: Maximum number of posts on the page.
+        published_only: If ``True`` (default), only published posts.
+        db: Read-only session (replica when configured).
+        service: Injected post service.
+
+    Returns:
+        A :class:`~app.schemas.pagination.Page` of
+        :class:`~app.schemas.post.PostSummary` items; its
+        ``next_cursor`` is ``null`` on the last page.
+
+    Raises:
+        HTTPException: HTTP 422 if ``cursor`` is malformed.
+    """
+    page = await service.get_page(db, cursor=cursor, limit=limit, published_only=published_only)
+    return AdapterJSONResponse(page, adapter=page_adapter(PostSummary))
 
 
 @router.get("/{slug}", response_model=PostResponse)
 async def get_post(
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     service: PostService = Depends(get_post_service),
 ) -> PostResponse:
     """Retrieve a single blog post by its slug.
 
     Args:
         slug: The unique URL slug of the post.
-        db: Active async database session.
+        db: Read-only session (replica when configured).
         service: Injected post service.
 
     Returns:
@@ -70,7 +102,7 @@ async def get_post(
 async def create_post(
     data: PostCreate,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: PostService = Depends(get_post_service),
 ) -> PostResponse:
     """Create a new blog post.
@@ -97,7 +129,7 @@ async def update_post(
     slug: str,
     data: PostUpdate,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: PostService = Depends(get_post_service),
 ) -> PostResponse:
     """Update an existing blog post.
@@ -124,7 +156,7 @@ async def update_post(
 async def delete_post(
     slug: str,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: PostService = Depends(get_post_service),
 ) -> None:
     """Delete a blog post.
@@ -4,73 +4,106 @@ Provides endpoints for creating, reading, updating, and deleting portfolio
 projects. Write operations are protected by superuser authentication.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.constants import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
 from app.core.deps import get_current_superuser
-from app.db.session import get_db
+from app.core.responses import AdapterJSONResponse, list_adapter, page_adapter
+from app.db.session import get_db, get_read_db
 from app.repositories.project_repository import ProjectRepository
 from app.schemas.auth import UserResponse
-from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.schemas.pagination import Page
+from app.schemas.project import ProjectCreate, ProjectResponse, ProjectSummary, ProjectUpdate
 from app.services.project_service import ProjectService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-def get_project_service(db: AsyncSession = Depends(get_db)) -> ProjectService:
-    """Construct a ProjectService bound to the current database session."""
-    _ = db
+def get_project_service() -> ProjectService:
+    """Construct a ProjectService.  Sessions are passed to each method by the route."""
     return ProjectService(ProjectRepository())
 
 
 @router.get("/", response_model=list[ProjectResponse])
 async def get_projects(
     published_only: bool = True,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     service: ProjectService = Depends(get_project_service),
-) -> list[ProjectResponse]:
+) -> AdapterJSONResponse:
     """Retrieve a list of projects.
 
     Args:
         published_only: If ``True``, returns only published projects.
             Defaults to ``True``.
-        db: Active async database session.
+        db: Read-only session (replica when configured).
         service: Injected project service.
 
     Returns:
         A list of :class:`~app.schemas.project.ProjectResponse` objects.
     """
-    return await service.get_all(db, published_only=published_only)
+    items = await service.get_all(db, published_only=published_only)
+    return AdapterJSONResponse(items, adapter=list_adapter(ProjectResponse))
 
 
 @router.get("/featured", response_model=list[ProjectResponse])
 async def get_featured_projects(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     service: ProjectService = Depends(get_project_service),
-) -> list[ProjectResponse]:
+) -> AdapterJSONResponse:
     """Retrieve a list of featured, published projects.
 
     Args:
-        db: Active async database session.
+        db: Read-only session (replica when configured).
         service: Injected project service.
 
     Returns:
         A list of :class:`~app.schemas.project.ProjectResponse` objects.
     """
-    return await service.get_featured(db)
+    items = await service.get_featured(db)
+    return AdapterJSONResponse(items, adapter=list_adapter(ProjectResponse))
+
+
+@router.get("/page", response_model=Page[ProjectSummary])
+async def get_projects_page(
+    cursor: str | None = None,
+    limit: int = Query(default=PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+    published_only: bool = True,
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+    service: ProjectService = Depends(get_project_service),
+) -> AdapterJSONResponse:
+    """Retrieve one page of projects, in the same order as ``GET /``.
+
+    Args:
+        cursor: ``next_cursor`` from the previous page; omit for the first.
+        limit: Maximum number of projects on the page.
+        published_only: If ``True`` (default), only published projects.
+        db: Read-only session (replica when configured).
+        service: Injected project service.
+
+    Returns:
+        A :class:`~app.schemas.pagination.Page` of
+        :class:`~app.schemas.project.ProjectSummary` items; its
+        ``next_cursor`` is ``null`` on the last page.
+
+    Raises:
+        HTTPException: HTTP 422 if ``cursor`` is malformed.
+    """
+    page = await service.get_page(db, cursor=cursor, limit=limit, published_only=published_only)
+    return AdapterJSONResponse(page, adapter=page_adapter(ProjectSummary))
 
 
 @router.get("/{slug}", response_model=ProjectResponse)
 async def get_project(
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     service: ProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """Retrieve a single project by its slug.
 
     Args:
         slug: The unique URL slug of the project.
-        db: Active async database session.
+        db: Read-only session (replica when configured).
         service: Injected project service.
 
     Returns:
@@ -86,7 +119,7 @@ async def get_project(
 async def create_project(
     data: ProjectCreate,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: ProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """Create a new project.
@@ -113,7 +146,7 @@ async def update_project(
     slug: str,
     data: ProjectUpdate,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: ProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """Update an existing project.
@@ -141,7 +174,7 @@ async def update_project(
 async def delete_project(
     slug: str,
     _: UserResponse = Depends(get_current_superuser),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     service: ProjectService = Depends(get_project_service),
 ) -> None:
     """Delete a project.
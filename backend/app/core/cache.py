@@ -0,0 +1,109 @@
+"""Small in-process caches.
+
+Provides :class:`TTLCache`, a bounded mapping whose entries expire a fixed
+number of seconds after they were stored, and the application-wide
+:data:`principal_cache` used by
+:meth:`~app.services.auth_service.AuthService.get_current_user`.  The
+verified-token cache in :mod:`app.core.security` is also a
+:class:`TTLCache`, with per-entry lifetimes matching each token's ``exp``.
+
+Every uvicorn worker holds its own copy.  Entries that must disappear
+before their TTL — e.g. a user whose password just changed — are removed
+explicitly with :meth:`TTLCache.invalidate`, and other workers are told to
+do the same via Postgres ``NOTIFY`` (see :mod:`app.db.notify`).
+
+Example::
+
+    cache: TTLCache[uuid.UUID, UserResponse] = TTLCache(ttl=30, maxsize=1024)
+    cache.set(user.id, user)
+    cache.get(user.id)  # -> user, until 30 s have passed
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.constants import PRINCIPAL_CACHE_MAX_SIZE
+from app.schemas.auth import UserResponse
+
+
+class TTLCache[K, V]:
+    """Mapping with per-entry expiry and least-recently-used eviction.
+
+    Not thread-safe; use from a single event loop.
+
+    Args:
+        ttl: Seconds an entry stays valid after :meth:`set`.  ``0``
+            disables the cache — :meth:`get` always misses.
+        maxsize: Maximum number of entries.  The least recently used entry
+            is evicted when the cache is full.
+    """
+
+    def __init__(self, *, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for ``key``, or ``None`` if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, *, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Lifetime of this entry in seconds; defaults to the cache's
+                ``ttl``.  Entries with a non-positive lifetime are not stored.
+        """
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+        self._data[key] = (time.monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Remove ``key`` if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+
+
+principal_cache: TTLCache[uuid.UUID, UserResponse] = TTLCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL, maxsize=PRINCIPAL_CACHE_MAX_SIZE
+)
+"""Resolved, active users keyed by id — bounds auth staleness to ``PRINCIPAL_CACHE_TTL``."""
+
+
+def invalidate_principal(payload: str | None) -> None:
+    """Drop a cached user in response to a ``NOTIFY`` on ``USER_INVALIDATED_CHANNEL``.
+
+    Args:
+        payload: The user id as a string, or ``None`` when notifications may
+            have been missed (e.g. after the listener reconnected), in which
+            case the whole cache is cleared.
+    """
+    if payload is None:
+        principal_cache.clear()
+        return
+    try:
+        principal_cache.invalidate(uuid.UUID(payload))
+    except ValueError:
+        principal_cache.clear()
@@ -8,7 +8,16 @@ Groups:
 - **AI / vLLM chat** — served model name for the writing assistant
 - **AI / vLLM embeddings** — model name and vector dimensions for RAG
 - **AI generation budgets** — token limits
-- **Auth** — JWT expiry window
+- **AI admission control** — queue polling for ``/ai/write``
+- **AI upstreams** — health-probe timeout for load-balanced AI servers
+- **AI hedging** — latency window and delay bounds for hedged embedding calls
+- **AI bulk metadata** — batch sizes and budgets for the metadata job
+- **Metrics** — histogram bucket boundaries and multi-worker snapshot interval for ``GET /metrics``
+- **Readiness** — probe timeout and staleness for ``GET /health/ready``
+- **Pagination** — default and maximum page size for keyset-paginated listings
+- **Read replica routing** — read-your-writes cookie name
+- **Auth** — JWT expiry window, principal and verified-token cache bounds
+- **Notifications** — ``LISTEN`` / ``NOTIFY`` channel names and reconnect back-off
 
 Example::
 
@@ -116,6 +125,137 @@ Higher values improve recall at the cost of a larger prompt context window
 and slightly slower LLM responses.
 """
 
+# ---------------------------------------------------------------------------
+# AI admission control
+# ---------------------------------------------------------------------------
+
+AI_WRITE_QUEUE_POLL_SECONDS: float = 1.0
+"""Upper bound on the wait between two queue checks for a parked ``/ai/write`` request.
+
+Position changes wake waiters immediately; this interval only bounds how
+late the queue timeout is noticed.
+"""
+
+# ---------------------------------------------------------------------------
+# AI upstream load balancing
+# ---------------------------------------------------------------------------
+
+AI_UPSTREAM_PROBE_TIMEOUT_SECONDS: float = 2.0
+"""Timeout for a single ``GET /models`` health probe of an AI upstream.
+
+Kept short so one hung node cannot delay re-admitting the others.
+"""
+
+# ---------------------------------------------------------------------------
+# AI request hedging
+# ---------------------------------------------------------------------------
+
+AI_HEDGE_WINDOW_SIZE: int = 256
+"""Number of recent call latencies the hedge percentile is computed over."""
+
+AI_HEDGE_MIN_SAMPLES: int = 20
+"""Latencies required before the percentile replaces the default delay."""
+
+AI_HEDGE_DEFAULT_DELAY_SECONDS: float = 0.1
+"""Hedge delay used while the latency window is still warming up."""
+
+AI_HEDGE_MIN_DELAY_SECONDS: float = 0.01
+"""Lower bound on the hedge delay.
+
+Stops a run of very fast responses from turning every call into two.
+"""
+
+# ---------------------------------------------------------------------------
+# AI bulk metadata generation
+# ---------------------------------------------------------------------------
+
+METADATA_JOB_BATCH_SIZE: int = 32
+"""Rows fetched, generated and written back per step of a metadata job.
+
+Each batch is one keyset-paginated SELECT and one bulk UPDATE.  Keep it a
+few times larger than ``AI_METADATA_CONCURRENCY`` so the vLLM batch stays
+full while stragglers at the end of a step finish.
+"""
+
+METADATA_EXCERPT_MAX_TOKENS: int = 200
+"""Generation budget for a single post excerpt."""
+
+METADATA_TAGS_MAX_TOKENS: int = 60
+"""Generation budget for a single tag-suggestion call."""
+
+METADATA_MAX_TAGS: int = 5
+"""Maximum number of suggested tags kept per row."""
+
+READING_WORDS_PER_MINUTE: int = 200
+"""Average reading speed used to estimate ``reading_time_minutes``."""
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+METRICS_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Default histogram buckets (seconds) for latency metrics.
+
+Spans single-digit milliseconds (embedding calls, inter-token gaps) up to a
+minute (queue waits and full-length completions).
+"""
+
+METRICS_TOKEN_BUCKETS: tuple[float, ...] = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+"""Histogram buckets for per-request token counts (prompt and completion)."""
+
+METRICS_TOKEN_RATE_BUCKETS: tuple[float, ...] = (5, 10, 20, 30, 40, 60, 80, 120, 200)
+"""Histogram buckets for decode throughput in tokens per second."""
+
+METRICS_BATCH_SIZE_BUCKETS: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128)
+"""Histogram buckets for the number of inputs per embeddings call."""
+
+METRICS_SNAPSHOT_SECONDS: float = 5.0
+"""Interval at which each worker writes its snapshot to ``METRICS_MULTIPROC_DIR``."""
+
+# ---------------------------------------------------------------------------
+# Readiness
+# ---------------------------------------------------------------------------
+
+READINESS_PROBE_TIMEOUT_SECONDS: float = 2.0
+"""Budget for the ``SELECT 1`` readiness probe, including waiting for a pooled connection."""
+
+READINESS_STALE_AFTER_PROBES: int = 3
+"""Probe intervals after which a cached readiness result is treated as failed."""
+
+# ---------------------------------------------------------------------------
+# Pagination
+# ---------------------------------------------------------------------------
+
+PAGE_DEFAULT_LIMIT: int = 20
+"""Items per page when a paginated listing is requested without ``limit``."""
+
+PAGE_MAX_LIMIT: int = 100
+"""Largest ``limit`` a paginated listing accepts."""
+
+# ---------------------------------------------------------------------------
+# Read replica routing
+# ---------------------------------------------------------------------------
+
+PRIMARY_READS_COOKIE: str = "read_primary"
+"""Cookie set after a write so the writer's reads skip the lagging replica.
+
+Lives for ``DB_READ_STICKY_SECONDS``; see :func:`app.db.session.get_read_db`.
+"""
+
 # ---------------------------------------------------------------------------
 # Auth
 # ---------------------------------------------------------------------------
@@ -125,3 +265,25 @@ ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
 Overridden at runtime via ``JWT_EXPIRE_MINUTES`` in ``.env``.
 """
+
+PRINCIPAL_CACHE_MAX_SIZE: int = 1024
+"""Maximum number of resolved users cached per worker by ``get_current_user``."""
+
+TOKEN_CACHE_MAX_SIZE: int = 4096
+"""Maximum number of verified JWTs remembered per worker by ``decode_access_token``."""
+
+REVOCATION_PRUNE_SECONDS: float = 60.0
+"""Minimum interval between sweeps of expired entries from the in-memory token deny-list."""
+
+# ---------------------------------------------------------------------------
+# Notifications (Postgres LISTEN / NOTIFY)
+# ---------------------------------------------------------------------------
+
+USER_INVALIDATED_CHANNEL: str = "user_invalidated"
+"""Channel notified with a user id whenever cached copies of that user must be dropped."""
+
+TOKEN_REVOKED_CHANNEL: str = "token_revoked"
+"""Channel notified with ``"<jti> <exp>"`` whenever an access token is revoked."""
+
+NOTIFY_RECONNECT_SECONDS: float = 5.0
+"""Back-off before the notification listener reconnects after losing its connection."""
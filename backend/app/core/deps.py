@@ -1,7 +1,8 @@
 """FastAPI dependency functions for authentication and authorisation.
 
 This module provides the ``get_current_user`` and ``get_current_superuser``
-dependencies that protect write endpoints.
+dependencies that protect write endpoints, plus ``get_optional_user`` for
+public endpoints that behave differently for signed-in users.
 
 Authentication strategy
 -----------------------
@@ -44,16 +45,13 @@ from app.services.auth_service import AuthService, InactiveUserError
 # ---------------------------------------------------------------------------
 
 
-def _get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+def _get_auth_service() -> AuthService:
     """Construct an :class:`~app.services.auth_service.AuthService` instance.
 
     This is a private helper used only within this module.  External callers
     should depend on :func:`get_current_user` or :func:`get_current_superuser`
     instead.
 
-    Args:
-        db: Injected async database session.
-
     Returns:
         A fresh :class:`~app.services.auth_service.AuthService` bound to a
         new :class:`~app.repositories.user_repository.UserRepository`.
@@ -102,9 +100,22 @@ async def _extract_token(
 # ---------------------------------------------------------------------------
 
 
+async def get_access_token(token: str = Depends(_extract_token)) -> str:
+    """Return the raw JWT presented with the current request.
+
+    Use it when an endpoint needs the token itself rather than the user it
+    resolves to — e.g. ``POST /auth/logout`` forgetting it from the
+    verified-token cache.
+
+    Raises:
+        HTTPException: HTTP 401 when no token is present.
+    """
+    return token
+
+
 async def get_current_user(
     token: str = Depends(_extract_token),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     auth_service: AuthService = Depends(_get_auth_service),
 ) -> UserResponse:
     """Resolve the authenticated user from a JWT token.
@@ -157,6 +168,36 @@ async def get_current_user(
         ) from exc
 
 
+async def get_optional_user(
+    request: Request,
+    access_token: str | None = Cookie(default=None),
+    db: AsyncSession = Depends(get_db, scope="function"),
+    auth_service: AuthService = Depends(_get_auth_service),
+) -> UserResponse | None:
+    """Resolve the authenticated user if a valid token is present.
+
+    Unlike :func:`get_current_user` this never rejects the request — a
+    missing, invalid, or expired token (or an inactive account) simply
+    yields ``None``.  Use it on public endpoints that grant extra treatment
+    to signed-in users, such as the priority lane of ``POST /ai/write``.
+
+    Args:
+        request: The current FastAPI request.
+        access_token: Value of the ``access_token`` httpOnly cookie.
+        db: Active async database session.
+        auth_service: Auth service for user resolution.
+
+    Returns:
+        The authenticated :class:`~app.schemas.auth.UserResponse`, or
+        ``None`` for anonymous callers.
+    """
+    try:
+        token = await _extract_token(request, access_token)
+        return await get_current_user(token, db, auth_service)
+    except HTTPException:
+        return None
+
+
 async def get_current_superuser(
     current_user: UserResponse = Depends(get_current_user),
 ) -> UserResponse:
@@ -182,7 +223,7 @@ async def get_current_superuser(
         async def create_project(
             data: ProjectCreate,
             _: UserResponse = Depends(get_current_superuser),
-            db: AsyncSession = Depends(get_db),
+            db: AsyncSession = Depends(get_db, scope="function"),
             service: ProjectService = Depends(get_project_service),
         ) -> ProjectResponse:
             return await service.create(db, data)
@@ -2,15 +2,24 @@ import logging
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
+from app.core.config import settings
 from app.core.exceptions import (
     ConflictError,
     ExternalServiceError,
     NotFoundError,
     PortfolioError,
+    RateLimitError,
     ValidationError,
 )
-from app.core.middleware import RequestIDMiddleware
+from app.core.middleware import (
+    MetricsMiddleware,
+    PrimaryReadsMiddleware,
+    QueryAuditMiddleware,
+    RequestIDMiddleware,
+    ServerTimingMiddleware,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +30,16 @@ def _request_id(request: Request) -> str:
 
 def register_middlewares(app: FastAPI) -> None:
     """Register all custom middleware. Order matters — outermost is registered last."""
+    if settings.DATABASE_READ_URL:
+        app.add_middleware(PrimaryReadsMiddleware)
+    app.add_middleware(QueryAuditMiddleware)
+    app.add_middleware(ServerTimingMiddleware)
+    app.add_middleware(MetricsMiddleware)
     app.add_middleware(RequestIDMiddleware)
+    if settings.TRUSTED_PROXIES:
+        # Outermost, so every layer — logs, metrics, login throttling —
+        # sees the real client address instead of the proxy's.
+        app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=settings.TRUSTED_PROXIES)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -46,6 +64,14 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": exc.message, "request_id": _request_id(request)},
         )
 
+    @app.exception_handler(RateLimitError)
+    async def handle_rate_limit(request: Request, exc: RateLimitError) -> JSONResponse:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": exc.message, "request_id": _request_id(request)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     @app.exception_handler(ExternalServiceError)
     async def handle_external_service(request: Request, exc: ExternalServiceError) -> JSONResponse:
         return JSONResponse(
@@ -13,10 +13,12 @@ Hierarchy::
         ├── NotFoundError       (→ 404)
         │   ├── ProjectNotFoundError
         │   ├── PostNotFoundError
-        │   └── CertificationNotFoundError
+        │   ├── CertificationNotFoundError
+        │   └── JobNotFoundError
         ├── ConflictError       (→ 409)
         │   └── SlugConflictError
         ├── ValidationError     (→ 422)
+        ├── RateLimitError      (→ 429)
         └── ExternalServiceError (→ 502)
             └── AIServiceError
 
@@ -98,6 +100,18 @@ class CertificationNotFoundError(NotFoundError):
     """
 
 
+class JobNotFoundError(NotFoundError):
+    """Raised when a background job cannot be found by ID.
+
+    Jobs are tracked in process memory, so a job started on another worker
+    (or before a restart) is reported as not found.
+
+    Example::
+
+        raise JobNotFoundError(f"Job '{job_id}' not found")
+    """
+
+
 # ---------------------------------------------------------------------------
 # 409 — Conflict
 # ---------------------------------------------------------------------------
@@ -144,6 +158,35 @@ class ValidationError(PortfolioError):
     """
 
 
+# ---------------------------------------------------------------------------
+# 429 — Too Many Requests
+# ---------------------------------------------------------------------------
+
+
+class RateLimitError(PortfolioError):
+    """Raised when a request is rejected because a capacity limit is reached.
+
+    Mapped to **HTTP 429** by the global exception handler, which also sets
+    the ``Retry-After`` response header from :attr:`retry_after`.
+
+    Args:
+        message: Human-readable description of the error.
+        retry_after: Number of seconds the client should wait before
+            retrying.
+
+    Attributes:
+        retry_after: The retry hint passed at construction time.
+
+    Example::
+
+        raise RateLimitError("AI writing assistant is busy", retry_after=5)
+    """
+
+    def __init__(self, message: str, *, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 # ---------------------------------------------------------------------------
 # 502 — External Service Errors
 # ---------------------------------------------------------------------------
@@ -1,26 +1,66 @@
 """Structured logging configuration.
 
 Provides JSON logging in production and readable console logging in
-development. The `request_id` is injected into log records by the
-`RequestIDMiddleware`.
+development. The `request_id` set by `RequestIDMiddleware` is injected into
+log records by a single `RequestIDFilter` on the handler.  Structured fields
+passed as ``extra={"fields": {...}}`` (e.g. by the access log) become
+top-level JSON keys.
+
+Non-blocking pipeline
+---------------------
+Loggers never write to stdout themselves.  Every record goes through a
+`QueueHandler` into a bounded queue (``LOG_QUEUE_SIZE``), and a
+`QueueListener` thread formats and writes it.  A slow stdout — a container
+log driver under pressure — therefore delays log output, not requests.
+
+If the queue is full the new record is dropped rather than blocking the
+caller, and counted in the ``log_records_dropped`` metric by level.  The
+request ID is read on the calling thread, before the record is queued,
+because the `ContextVar` holding it is not visible from the listener thread.
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import UTC, datetime
+import time
 from typing import Any
 
 from app.core.config import settings
+from app.core.metrics import LOG_RECORDS_DROPPED
+from app.core.middleware import RequestIDFilter
+
+
+class _UTCTimestamps:
+    """Render ``record.created`` as ISO 8601, formatting each second only once."""
+
+    def __init__(self, fmt: str) -> None:
+        self.fmt = fmt
+        self._second = -1
+        self._prefix = ""
+
+    def prefix(self, created: float) -> str:
+        second = int(created)
+        if second != self._second:
+            self._second = second
+            self._prefix = time.strftime(self.fmt, time.gmtime(second))
+        return self._prefix
 
 
 class JSONFormatter(logging.Formatter):
     """Formatter that outputs JSON strings for structured logging."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._timestamps = _UTCTimestamps("%Y-%m-%dT%H:%M:%S")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a JSON string."""
+        micros = int((record.created % 1) * 1_000_000)
         log_record: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": f"{self._timestamps.prefix(record.created)}.{micros:06d}+00:00",
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
@@ -30,6 +70,10 @@ class JSONFormatter(logging.Formatter):
         if request_id:
             log_record["request_id"] = request_id
 
+        fields = getattr(record, "fields", None)
+        if fields:
+            log_record.update(fields)
+
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
@@ -39,24 +83,79 @@ class JSONFormatter(logging.Formatter):
 class ConsoleFormatter(logging.Formatter):
     """Formatter that outputs readable text for local development."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._timestamps = _UTCTimestamps("%Y-%m-%d %H:%M:%S")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a readable string."""
-        timestamp = datetime.fromtimestamp(record.created, tz=UTC).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamps.prefix(record.created)
         req_id = getattr(record, "request_id", None)
         req_id_str = f" [{req_id}]" if req_id else ""
 
         msg = f"{timestamp} | {record.levelname:<8} | {record.name}{req_id_str} - {record.getMessage()}"
+        fields = getattr(record, "fields", None)
+        if fields:
+            msg += " " + " ".join(f"{key}={value}" for key, value in fields.items())
         if record.exc_info:
             msg += f"\n{self.formatException(record.exc_info)}"
         return msg
 
 
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """``QueueHandler`` that drops and counts records when its queue is full.
+
+    Unlike the stdlib handler, :meth:`prepare` does not format the record on
+    the calling thread — it only resolves ``msg % args`` (arguments may be
+    mutated after the call returns).  Formatting, including tracebacks, is
+    left to the listener thread.
+    """
+
+    queue: "queue.Queue[logging.LogRecord]"
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc(level=record.levelname)
+
+
+class _LogWriter(logging.handlers.QueueListener):
+    """``QueueListener`` whose stop sentinel waits for room in a full queue."""
+
+    queue: "queue.Queue[Any]"
+
+    def enqueue_sentinel(self) -> None:
+        # The writer thread is still draining, so this cannot block forever.
+        self.queue.put(None)
+
+
+_listener: _LogWriter | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def setup_logging() -> None:
     """Configure the Python logging system.
 
     Sets up the root logger with the appropriate formatter based on the
-    current environment (JSON for production, text for development).
+    current environment (JSON for production, text for development), behind
+    a bounded queue drained by a background writer thread.
     """
+    global _listener
+    _stop_listener()
+
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
 
@@ -64,12 +163,22 @@ def setup_logging() -> None:
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
 
-    handler = logging.StreamHandler(sys.stdout)
+    stream_handler = logging.StreamHandler(sys.stdout)
 
     if settings.ENVIRONMENT == "development":
-        handler.setFormatter(ConsoleFormatter())
+        stream_handler.setFormatter(ConsoleFormatter())
     else:
-        handler.setFormatter(JSONFormatter())
+        stream_handler.setFormatter(JSONFormatter())
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    handler = DroppingQueueHandler(log_queue)
+    # On the handler, not the logger: logger filters do not see records
+    # propagated from child loggers.  It must also run before the record is
+    # queued, on the thread that owns the request context.
+    handler.addFilter(RequestIDFilter())
+
+    _listener = _LogWriter(log_queue, stream_handler)
+    _listener.start()
 
     logger.addHandler(handler)
 
@@ -78,3 +187,6 @@ def setup_logging() -> None:
         ext_logger = logging.getLogger(logger_name)
         ext_logger.handlers = [handler]
         ext_logger.propagate = False
+
+
+atexit.register(_stop_listener)
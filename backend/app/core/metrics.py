@@ -0,0 +1,651 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+A deliberately small alternative to ``prometheus_client``: three instrument
+types (:class:`Counter`, :class:`Gauge`, :class:`Histogram`), label support,
+and a :meth:`MetricsRegistry.render` method that produces the Prometheus
+text format served by ``GET /metrics``.
+
+Instruments are plain Python objects updated from the event loop thread, so
+recording a sample is a dict lookup plus a few additions — cheap enough to
+call on every streamed token.
+
+All application instruments are declared at the bottom of this module so
+the full metric catalogue lives in one place.
+
+Multiple workers
+----------------
+Each uvicorn worker has its own registry, so a scrape of ``/metrics`` would
+only see whichever worker answered.  When ``METRICS_MULTIPROC_DIR`` is set,
+every worker periodically writes a JSON snapshot of its registry to
+``<dir>/metrics-<pid>.json`` (see :func:`write_snapshots`), and
+:meth:`MetricsRegistry.render_multiprocess` merges the other workers' files
+with the answering worker's live samples at scrape time: counters and histograms are summed, gauges are combined according to
+their ``aggregate`` mode and only counted for workers that are still alive.
+Point the directory at an empty location that is wiped when the container
+starts.
+
+Example::
+
+    from app.core.metrics import AI_EMBED_SECONDS
+
+    start = time.perf_counter()
+    ...
+    AI_EMBED_SECONDS.observe(time.perf_counter() - start)
+"""
+
+import asyncio
+import bisect
+import contextlib
+import json
+import math
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Literal, TypeVar
+
+from app.core.constants import (
+    METRICS_BATCH_SIZE_BUCKETS,
+    METRICS_LATENCY_BUCKETS,
+    METRICS_TOKEN_BUCKETS,
+    METRICS_TOKEN_RATE_BUCKETS,
+)
+
+LabelValues = tuple[str, ...]
+Sample = tuple[str, LabelValues, float]
+Snapshot = dict[str, list[Sample]]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    """Shared plumbing for every instrument type."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if not self.labelnames:
+            return ()
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterable[Sample]:
+        """Yield ``(suffix, label_values, value)`` for every exported series."""
+
+    def combine(self, current: float, other: float) -> float:
+        """Combine the same series from two workers (summed by default)."""
+        return current + other
+
+    def render(self, samples: Iterable[Sample] | None = None) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, label_values, value in self.samples() if samples is None else samples:
+            names = self.labelnames
+            if suffix == "_bucket":
+                names = (*self.labelnames, "le")
+            lines.append(
+                f"{self.name}{suffix}{_format_labels(names, label_values)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, e.g. number of failed AI calls."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter by ``amount`` for the given label values."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given label values."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, value in list(self._values.items()):
+            yield "_total", key, value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, e.g. streams currently in flight.
+
+    Args:
+        name: Metric name.
+        documentation: ``# HELP`` text.
+        labelnames: Names of the labels every update must supply.
+        aggregate: How values from several workers are combined — ``"sum"``
+            for per-worker quantities (in-flight requests), ``"min"`` /
+            ``"max"`` for states every worker reports independently.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        aggregate: Literal["sum", "min", "max"] = "sum",
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.aggregate = aggregate
+        self._values: dict[LabelValues, float] = {}
+
+    def combine(self, current: float, other: float) -> float:
+        if self.aggregate == "min":
+            return min(current, other)
+        if self.aggregate == "max":
+            return max(current, other)
+        return current + other
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge to ``value``."""
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge by ``amount``."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge by ``amount``."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given label values."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, value in list(self._values.items()):
+            yield "", key, value
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values, e.g. time-to-first-token.
+
+    Args:
+        name: Metric name (without the ``_bucket`` / ``_sum`` / ``_count``
+            suffix).
+        documentation: ``# HELP`` text.
+        buckets: Upper bounds of the buckets in ascending order.  A ``+Inf``
+            bucket is always appended.
+        labelnames: Names of the labels every observation must supply.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = METRICS_LATENCY_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record a single observation."""
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _HistogramSeries(len(self.buckets))
+        series.counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.sum += value
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for the given label values."""
+        series = self._series.get(self._key(labels))
+        return sum(series.counts) if series else 0
+
+    def samples(self) -> Iterable[Sample]:
+        for key, series in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series.counts, strict=True):
+                cumulative += count
+                yield "_bucket", (*key, _format_value(bound)), cumulative
+            yield "_sum", key, series.sum
+            yield "_count", key, cumulative
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Collection of instruments rendered together by ``GET /metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: _M) -> _M:
+        """Add ``metric`` to the registry and return it.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before each export.
+
+        Used for values that are cheaper to read on demand than to track,
+        such as connection pool occupancy.
+        """
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        """Run every registered collector."""
+        for collector in self._collectors:
+            collector()
+
+    def render(self) -> str:
+        """Return every registered metric in Prometheus text format."""
+        self.collect()
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    # ------------------------------------------------------------------
+    # Multi-process aggregation
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Snapshot:
+        """Return every metric's current samples, keyed by metric name.
+
+        Call from the event loop thread: instruments are updated there
+        without locks, so walking them from another thread could observe a
+        histogram mid-update.
+        """
+        self.collect()
+        return {name: list(metric.samples()) for name, metric in self._metrics.items()}
+
+    def write_snapshot(self, directory: str, snapshot: Snapshot | None = None) -> None:
+        """Write this process's samples to ``<directory>/metrics-<pid>.json``.
+
+        The JSON is written to a uniquely named temporary file that is then
+        renamed over the target, so readers never see a partial write and
+        concurrent writers cannot trip over each other's temporary file.
+
+        Args:
+            directory: The ``METRICS_MULTIPROC_DIR`` directory.
+            snapshot: Samples from :meth:`snapshot`; taken now when omitted.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        path = Path(directory) / f"metrics-{os.getpid()}.json"
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f"{path.stem}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(snapshot, file)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def render_multiprocess(self, directory: str, snapshot: Snapshot) -> str:
+        """Merge every worker's snapshot in ``directory`` and render the result.
+
+        Only reads files, so it is safe to run in a worker thread.  The
+        calling worker is represented by ``snapshot`` — taken on the event
+        loop with :meth:`snapshot` — rather than by its file, which may be
+        up to one snapshot interval old.  Gauges from workers that have
+        exited are ignored; their counters and histograms are kept so totals
+        never go backwards.
+
+        Args:
+            directory: The ``METRICS_MULTIPROC_DIR`` directory.
+            snapshot: This process's current samples.
+        """
+        merged: dict[str, dict[tuple[str, LabelValues], float]] = {
+            name: {} for name in self._metrics
+        }
+        snapshots: list[tuple[bool, Snapshot]] = [(True, snapshot)]
+        for path in sorted(Path(directory).glob("metrics-*.json")):
+            try:
+                pid = int(path.stem.removeprefix("metrics-"))
+                if pid == os.getpid():
+                    continue
+                snapshots.append((_process_alive(pid), json.loads(path.read_text())))
+            except (OSError, ValueError):
+                continue
+        for alive, worker in snapshots:
+            for name, samples in worker.items():
+                metric = self._metrics.get(name)
+                if metric is None or (isinstance(metric, Gauge) and not alive):
+                    continue
+                series = merged[name]
+                for suffix, labels, value in samples:
+                    key = (suffix, tuple(labels))
+                    current = series.get(key)
+                    series[key] = value if current is None else metric.combine(current, value)
+
+        lines: list[str] = []
+        for name, metric in self._metrics.items():
+            samples = [(suffix, labels, value) for (suffix, labels), value in merged[name].items()]
+            lines.extend(metric.render(samples))
+        return "\n".join(lines) + "\n"
+
+
+def _process_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+async def write_snapshots(registry: "MetricsRegistry", directory: str, interval: float) -> None:
+    """Write ``registry``'s snapshot to ``directory`` every ``interval`` seconds.
+
+    Runs until cancelled, then writes a final snapshot.
+    """
+    try:
+        while True:
+            with contextlib.suppress(OSError):
+                registry.write_snapshot(directory)
+            await asyncio.sleep(interval)
+    finally:
+        with contextlib.suppress(OSError):
+            registry.write_snapshot(directory)
+
+
+REGISTRY = MetricsRegistry()
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+HTTP_REQUEST_SECONDS = REGISTRY.register(
+    Histogram(
+        "http_request_seconds",
+        "Time from receiving a request to sending the last response byte, by route template.",
+        labelnames=("method", "route", "status"),
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(
+    Gauge(
+        "http_requests_in_flight",
+        "HTTP requests currently being handled.",
+    )
+)
+
+# ---------------------------------------------------------------------------
+# Database connection pool
+# ---------------------------------------------------------------------------
+
+DB_POOL_SIZE = REGISTRY.register(
+    Gauge(
+        "db_pool_size",
+        "Persistent connections the pool keeps (DB_POOL_SIZE).",
+        labelnames=("pool",),
+    )
+)
+DB_POOL_CHECKED_OUT = REGISTRY.register(
+    Gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of the pool.",
+        labelnames=("pool",),
+    )
+)
+DB_POOL_OVERFLOW = REGISTRY.register(
+    Gauge(
+        "db_pool_overflow",
+        "Connections open beyond DB_POOL_SIZE (bounded by DB_MAX_OVERFLOW).",
+        labelnames=("pool",),
+    )
+)
+DB_POOL_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time to acquire a connection from the pool, including opening a new one.",
+        labelnames=("pool",),
+    )
+)
+DB_CONNECTION_HOLD_SECONDS = REGISTRY.register(
+    Histogram(
+        "db_connection_hold_seconds",
+        "Time a connection stays checked out of the pool, from checkout to checkin.",
+        labelnames=("pool",),
+    )
+)
+
+# ---------------------------------------------------------------------------
+# AI — writing assistant (vLLM chat)
+# ---------------------------------------------------------------------------
+
+AI_WRITE_QUEUE_SECONDS = REGISTRY.register(
+    Histogram(
+        "ai_write_queue_seconds",
+        "Time an /ai/write request waited in the admission queue before streaming.",
+    )
+)
+AI_CHAT_TTFT_SECONDS = REGISTRY.register(
+    Histogram(
+        "ai_chat_time_to_first_token_seconds",
+        "Time from sending the chat request to receiving the first content token.",
+        labelnames=("mode",),
+    )
+)
+AI_CHAT_INTER_TOKEN_SECONDS = REGISTRY.register(
+    Histogram(
+        "ai_chat_inter_token_seconds",
+        "Gap between consecutive streamed content chunks.",
+        labelnames=("mode",),
+    )
+)
+AI_CHAT_STREAM_SECONDS = REGISTRY.register(
+    Histogram(
+        "ai_chat_stream_seconds",
+        "Total duration of a chat completion stream.",
+        labelnames=("mode",),
+    )
+)
+AI_CHAT_TOKENS = REGISTRY.register(
+    Histogram(
+        "ai_chat_tokens",
+        "Tokens per chat completion as reported by the server usage block.",
+        buckets=METRICS_TOKEN_BUCKETS,
+        labelnames=("mode", "kind"),
+    )
+)
+AI_CHAT_TOKENS_PER_SECOND = REGISTRY.register(
+    Histogram(
+        "ai_chat_decode_tokens_per_second",
+        "Completion tokens divided by the time between first and last token.",
+        buckets=METRICS_TOKEN_RATE_BUCKETS,
+        labelnames=("mode",),
+    )
+)
+
+# ---------------------------------------------------------------------------
+# AI — embeddings (infinity-emb)
+# ---------------------------------------------------------------------------
+
+AI_EMBED_SECONDS = REGISTRY.register(
+    Histogram(
+        "ai_embed_seconds",
+        "Latency of a single embeddings API call.",
+    )
+)
+AI_EMBED_BATCH_SIZE = REGISTRY.register(
+    Histogram(
+        "ai_embed_batch_size",
+        "Number of inputs sent in a single embeddings API call.",
+        buckets=METRICS_BATCH_SIZE_BUCKETS,
+    )
+)
+
+AI_HEDGE_CALLS = REGISTRY.register(
+    Counter(
+        "ai_hedge_calls",
+        "Calls made through a hedger (denominator for the hedge rate).",
+        labelnames=("operation",),
+    )
+)
+AI_HEDGES = REGISTRY.register(
+    Counter(
+        "ai_hedges",
+        "Calls that sent a duplicate request because the first was slow.",
+        labelnames=("operation",),
+    )
+)
+AI_HEDGE_WINS = REGISTRY.register(
+    Counter(
+        "ai_hedge_wins",
+        "Hedged calls where the duplicate request answered first.",
+        labelnames=("operation",),
+    )
+)
+
+# ---------------------------------------------------------------------------
+# AI — upstream load balancing
+# ---------------------------------------------------------------------------
+
+AI_UPSTREAM_OUTSTANDING = REGISTRY.register(
+    Gauge(
+        "ai_upstream_outstanding_requests",
+        "Requests sent to an AI upstream whose response has not been closed yet.",
+        labelnames=("service", "upstream"),
+    )
+)
+AI_UPSTREAM_HEALTHY = REGISTRY.register(
+    Gauge(
+        "ai_upstream_healthy",
+        "1 while an AI upstream is in rotation, 0 while it is ejected.",
+        labelnames=("service", "upstream"),
+        aggregate="min",
+    )
+)
+AI_UPSTREAM_REQUESTS = REGISTRY.register(
+    Counter(
+        "ai_upstream_requests",
+        "Requests sent to an AI upstream by response status class (2xx/4xx/5xx) or error.",
+        labelnames=("service", "upstream", "status"),
+    )
+)
+AI_UPSTREAM_RESPONSE_SECONDS = REGISTRY.register(
+    Histogram(
+        "ai_upstream_response_seconds",
+        "Time until an AI upstream returned response headers.",
+        labelnames=("service", "upstream"),
+    )
+)
+AI_UPSTREAM_EJECTIONS = REGISTRY.register(
+    Counter(
+        "ai_upstream_ejections",
+        "Times an AI upstream was taken out of rotation after repeated failures.",
+        labelnames=("service", "upstream"),
+    )
+)
+
+# ---------------------------------------------------------------------------
+# AI — failures
+# ---------------------------------------------------------------------------
+
+AI_CALL_ERRORS = REGISTRY.register(
+    Counter(
+        "ai_call_errors",
+        "AI API calls that raised an error.",
+        labelnames=("operation",),
+    )
+)
+
+# ---------------------------------------------------------------------------
+# Auth — bcrypt thread pool, verified-token cache and login throttling
+# ---------------------------------------------------------------------------
+
+BCRYPT_QUEUE_DEPTH = REGISTRY.register(
+    Gauge(
+        "auth_bcrypt_queue_depth",
+        "bcrypt operations waiting for a free thread in the bcrypt pool.",
+    )
+)
+BCRYPT_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "auth_bcrypt_wait_seconds",
+        "Time a bcrypt operation waited for a free thread.",
+        labelnames=("operation",),
+    )
+)
+BCRYPT_SECONDS = REGISTRY.register(
+    Histogram(
+        "auth_bcrypt_seconds",
+        "CPU time of a single bcrypt hash or check on the bcrypt pool.",
+        labelnames=("operation",),
+    )
+)
+AUTH_TOKEN_CACHE_LOOKUPS = REGISTRY.register(
+    Counter(
+        "auth_token_cache_lookups",
+        "Verified-token cache lookups in decode_access_token by result (hit/miss).",
+        labelnames=("result",),
+    )
+)
+LOGIN_THROTTLED = REGISTRY.register(
+    Counter(
+        "auth_login_throttled",
+        "Login attempts rejected by the rate limiter, by the key that tripped (ip/email).",
+        labelnames=("scope",),
+    )
+)
+
+# ---------------------------------------------------------------------------
+# Logging pipeline
+# ---------------------------------------------------------------------------
+
+LOG_RECORDS_DROPPED = REGISTRY.register(
+    Counter(
+        "log_records_dropped",
+        "Log records discarded because the background log queue was full, by level.",
+        labelnames=("level",),
+    )
+)
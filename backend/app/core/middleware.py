@@ -1,16 +1,33 @@
 import logging
+import random
+import time
 import uuid
+from contextvars import ContextVar
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import timing
+from app.core.config import settings
+from app.core.constants import PRIMARY_READS_COOKIE
+from app.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_FLIGHT
+from app.db.instrumentation import count_queries
 
 logger = logging.getLogger(__name__)
+access_logger = logging.getLogger("app.access")
 
 REQUEST_ID_HEADER = "X-Request-ID"
+_REQUEST_ID_HEADER_KEY = REQUEST_ID_HEADER.lower().encode("latin-1")
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+"""The current request's ID, set by :class:`RequestIDMiddleware`.
 
+Every task spawned while handling a request inherits a copy of the context,
+so background work started from a handler keeps logging with its ID.
+"""
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+
+class RequestIDMiddleware:
     """
     Stamps every request with a unique X-Request-ID header.
 
@@ -19,36 +36,269 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Otherwise a new UUID4 is generated.
     - The ID is always echoed back in the response headers so the client can
       correlate logs.
-    - The request ID is injected into the log context for the duration of the
-      request via a LogRecord filter so all log lines within a request carry it.
+    - The ID is stored in :data:`request_id_var` for the duration of the
+      request; :class:`RequestIDFilter` copies it onto every LogRecord.
+
+    Implemented as plain ASGI rather than ``BaseHTTPMiddleware``: it does not
+    wrap the response body in an extra task and memory stream, so SSE chunks
+    pass straight through, and the context variable needs no per-request
+    changes to the global logging configuration.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        request_id = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == _REQUEST_ID_HEADER_KEY:
+                request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = str(uuid.uuid4())
 
         # Make the request ID available downstream via request.state
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+class ServerTimingMiddleware:
+    """
+    Reports where each request spent its time.
+
+    - Opens a :class:`~app.core.timing.RequestTimings` for the request, which
+      DB, embedding, LLM and serialization code add to.
+    - Sends the totals so far as a ``Server-Timing`` header (visible in the
+      browser dev tools' network panel).  For streamed responses the header
+      leaves before the body, so LLM time only appears in the access log.
+    - Writes one ``app.access`` log line per request with the method, path,
+      status, total duration and per-phase ``*_ms`` / ``*_calls`` fields.
+      Fast successful requests are sampled at ``ACCESS_LOG_SAMPLE_RATE``;
+      errors and requests slower than ``ACCESS_LOG_SLOW_MS`` always log.
+
+    Registered inside :class:`RequestIDMiddleware` so the access log line
+    carries the request ID.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = timing.begin()
+        status_code = 500
 
-        # Add request ID to log context for this request
-        _filter = _RequestIDFilter(request_id)
-        logging.getLogger().addFilter(_filter)
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timings.server_timing())
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_timing)
         finally:
-            logging.getLogger().removeFilter(_filter)
+            timing.end(token)
+            self._log(scope, status_code, timings)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, timings: timing.RequestTimings) -> None:
+        duration_ms = timings.elapsed() * 1000
+        if (
+            status_code < 400
+            and duration_ms < settings.ACCESS_LOG_SLOW_MS
+            and random.random() >= settings.ACCESS_LOG_SAMPLE_RATE
+        ):
+            return
+        access_logger.info(
+            "%s %s %d",
+            scope["method"],
+            scope["path"],
+            status_code,
+            extra={
+                "fields": {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(duration_ms, 2),
+                    **timings.fields(),
+                }
+            },
+        )
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the full path template of the route that handled ``scope``.
+
+    The router stores the matched route in the (shared) scope.  Depending on
+    the FastAPI version, a route reached through ``include_router(prefix=...)``
+    carries either its full path or only the part below the prefix; in the
+    latter case the prefix is recovered from the request path.
+    """
+    route = scope.get("route")
+    template: str | None = getattr(route, "path", None)
+    regex = getattr(route, "path_regex", None)
+    if template is None or regex is None:
+        return "unmatched"
+    path: str = scope["path"]
+    if regex.match(path):
+        return template
+    start = path.find("/", 1)
+    while start != -1:
+        if regex.match(path[start:]):
+            return path[:start] + template
+        start = path.find("/", start + 1)
+    return template
+
+
+class MetricsMiddleware:
+    """
+    Records request latency per route template and the in-flight count.
+
+    - ``http_request_seconds`` is labelled with the matched route's path
+      template (``/api/v1/projects/{slug}``), never the raw path, so label
+      cardinality stays bounded.  Requests that match no route are grouped
+      under ``unmatched``.
+    - ``http_requests_in_flight`` counts requests between receipt and the
+      last response byte — streamed responses stay in flight until done.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        response.headers[REQUEST_ID_HEADER] = request_id
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        started = time.perf_counter()
+        status_code = 500
 
-class _RequestIDFilter(logging.Filter):
-    """Injects ``request_id`` into every LogRecord while active."""
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-    def __init__(self, request_id: str) -> None:
-        super().__init__()
-        self.request_id = request_id
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=_route_template(scope),
+                status=str(status_code),
+            )
+
+
+class QueryAuditMiddleware:
+    """
+    Flags requests that repeat the same SQL statement shape.
+
+    Counts every statement the request executes (see
+    :func:`~app.db.instrumentation.count_queries`).  When one normalized
+    statement runs more than ``DB_REPEATED_QUERY_THRESHOLD`` times — the
+    signature of an N+1 loop — a warning names the route and the statement.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as queries:
+            await self.app(scope, receive, send)
+
+        for shape, times in queries.repeated(settings.DB_REPEATED_QUERY_THRESHOLD):
+            logger.warning(
+                "Possible N+1: %s %s ran the same statement %d times (%d statements total): %s",
+                scope["method"],
+                scope["path"],
+                times,
+                queries.count,
+                shape,
+            )
+
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _has_credentials(scope: Scope) -> bool:
+    """Whether the request carries a bearer token or the ``access_token`` cookie."""
+    for key, value in scope["headers"]:
+        if key == b"authorization" or (key == b"cookie" and b"access_token=" in value):
+            return True
+    return False
+
+
+class PrimaryReadsMiddleware:
+    """
+    Pins an editor's reads to the primary database right after a write.
+
+    When an authenticated request (bearer token or ``access_token`` cookie)
+    with an unsafe method succeeds, the response sets the
+    ``PRIMARY_READS_COOKIE`` cookie for ``DB_READ_STICKY_SECONDS``.  While
+    the browser sends it back, :func:`~app.db.session.get_read_db` skips
+    the replica, so the change just made is visible on the next page load.
+
+    Only registered when ``DATABASE_READ_URL`` is set.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        cookie = (
+            f"{PRIMARY_READS_COOKIE}=1; Max-Age={settings.DB_READ_STICKY_SECONDS}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        )
+        if settings.ENVIRONMENT != "development":
+            cookie += "; Secure"
+        self._cookie = cookie
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in _SAFE_METHODS
+            or not _has_credentials(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("Set-Cookie", self._cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+class RequestIDFilter(logging.Filter):
+    """Injects the current ``request_id`` (or ``None``) into every LogRecord.
+
+    Installed once on the log handlers by :func:`~app.core.logging.setup_logging`.
+    """
 
     def filter(self, record: logging.LogRecord) -> bool:
-        record.request_id = self.request_id
+        record.request_id = request_id_var.get()
         return True
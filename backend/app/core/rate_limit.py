@@ -0,0 +1,217 @@
+"""Sliding-window rate limiting for the login endpoint.
+
+``POST /auth/login`` costs a user lookup plus a bcrypt check — hundreds of
+milliseconds of CPU.  A credential-stuffing burst would turn straight into
+CPU exhaustion, so :class:`LoginThrottle` rejects over-limit attempts with
+:class:`~app.core.exceptions.RateLimitError` (HTTP 429 + ``Retry-After``)
+*before* any of that work happens.
+
+Algorithm — sliding-window counter
+----------------------------------
+Each key keeps just two integers: the attempt counts of the current and the
+previous fixed window.  The estimated number of attempts in the last
+``window`` seconds is::
+
+    previous * (1 - elapsed_fraction_of_current_window) + current
+
+This approximates a true sliding log with O(1) memory per key and no
+timestamps to store or trim.
+
+Backends
+--------
+``memory`` (:class:`MemoryRateLimiter`)
+    Per-worker dict.  Idle keys are swept lazily once per window, so memory
+    is bounded by the keys active in the last two windows.
+
+``postgres`` (:class:`PostgresRateLimiter`)
+    Counters live in the ``rate_limit_counters`` table and are updated with
+    a single ``INSERT … ON CONFLICT DO UPDATE … RETURNING`` round trip, so
+    every worker shares the same budget.  Select with
+    ``LOGIN_RATE_LIMIT_BACKEND=postgres``.
+"""
+
+import math
+import time
+from typing import Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.exceptions import RateLimitError
+from app.core.metrics import LOGIN_THROTTLED
+from app.repositories.rate_limit_repository import RateLimitRepository
+
+
+def _estimate(current: int, previous: int, elapsed_fraction: float) -> float:
+    return previous * (1.0 - elapsed_fraction) + current
+
+
+def _retry_after(current: int, previous: int, limit: int, window: int, elapsed: float) -> int:
+    """Seconds until the sliding estimate drops back below ``limit``."""
+    # After this window ends, ``current`` becomes ``previous`` and decays linearly.
+    if current >= limit:
+        return max(1, math.ceil(window - elapsed + window * (1 - (limit - 1) / current)))
+    # Only the previous window's tail is holding the estimate above the limit.
+    needed_fraction = 1.0 - (limit - 1 - current) / previous
+    return max(1, math.ceil(needed_fraction * window - elapsed))
+
+
+class RateLimiter(Protocol):
+    """A limiter that counts an attempt and reports whether it is allowed."""
+
+    async def hit(self, key: str, *, limit: int) -> int | None:
+        """Count an attempt for ``key``.
+
+        Returns:
+            ``None`` when the attempt is within ``limit``, otherwise the
+            number of seconds after which the caller may retry.
+        """
+        ...
+
+
+class MemoryRateLimiter:
+    """In-process sliding-window counter limiter.
+
+    Not thread-safe; use from a single event loop.
+
+    Args:
+        window: Window length in seconds.
+    """
+
+    def __init__(self, *, window: int) -> None:
+        self.window = window
+        # key -> [window index, current count, previous count]
+        self._counters: dict[str, list[int]] = {}
+        self._last_sweep = 0
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    async def hit(self, key: str, *, limit: int) -> int | None:
+        now = time.time()
+        index, offset = divmod(now, self.window)
+        window = int(index)
+        if window != self._last_sweep:
+            self.sweep(window)
+
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = [window, 0, 0]
+        elif counter[0] != window:
+            counter[2] = counter[1] if counter[0] == window - 1 else 0
+            counter[1] = 0
+            counter[0] = window
+        counter[1] += 1
+
+        _, current, previous = counter
+        if _estimate(current, previous, offset / self.window) <= limit:
+            return None
+        return _retry_after(current, previous, limit, self.window, offset)
+
+    def sweep(self, window: int) -> None:
+        """Drop keys that have been idle for two full windows."""
+        self._last_sweep = window
+        stale = [key for key, counter in self._counters.items() if counter[0] < window - 1]
+        for key in stale:
+            del self._counters[key]
+
+
+class PostgresRateLimiter:
+    """Sliding-window counter limiter shared across workers via Postgres.
+
+    Args:
+        session_factory: Factory for short-lived sessions.  Counting commits
+            independently of the request's own transaction.
+        window: Window length in seconds.
+        repo: Counter repository.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        window: int,
+        repo: RateLimitRepository | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.window = window
+        self.repo = repo or RateLimitRepository()
+        self._last_sweep = 0
+
+    async def hit(self, key: str, *, limit: int) -> int | None:
+        now = time.time()
+        index, offset = divmod(now, self.window)
+        window = int(index)
+        async with self.session_factory() as db:
+            current, previous = await self.repo.hit(db, key=key, window=window)
+            if window != self._last_sweep:
+                # Each worker sweeps at most once per window.
+                self._last_sweep = window
+                await self.repo.sweep(db, before_window=window - 1)
+
+        if _estimate(current, previous, offset / self.window) <= limit:
+            return None
+        return _retry_after(current, previous, limit, self.window, offset)
+
+
+class LoginThrottle:
+    """Per-IP and per-(email, IP) login attempt limits.
+
+    Args:
+        limiter: Backend that stores the counters.
+        max_per_ip: Attempts allowed per client IP per window.
+        max_per_email: Attempts allowed per account email from one client
+            IP per window.  Without an IP the email is counted on its own.
+    """
+
+    def __init__(self, limiter: RateLimiter, *, max_per_ip: int, max_per_email: int) -> None:
+        self.limiter = limiter
+        self.max_per_ip = max_per_ip
+        self.max_per_email = max_per_email
+
+    async def check(self, *, ip: str | None, email: str) -> None:
+        """Count a login attempt and reject it if either key is over its limit.
+
+        Args:
+            ip: Client IP address, or ``None`` when unknown.
+            email: Email address the attempt is for.
+
+        Raises:
+            RateLimitError: When the IP, or the email from this IP, has
+                exceeded its limit.
+        """
+        # The email budget is per (email, IP): a shared per-email counter
+        # would let anyone lock the admin out by spraying wrong passwords.
+        email_key = f"login:email:{email.strip().lower()}"
+        if ip is not None:
+            email_key = f"{email_key}:{ip}"
+        retry_after = await self.limiter.hit(email_key, limit=self.max_per_email)
+        scope = "email"
+        if ip is not None:
+            ip_retry = await self.limiter.hit(f"login:ip:{ip}", limit=self.max_per_ip)
+            if ip_retry is not None and ip_retry > (retry_after or 0):
+                retry_after, scope = ip_retry, "ip"
+
+        if retry_after is not None:
+            LOGIN_THROTTLED.inc(scope=scope)
+            raise RateLimitError(
+                "Too many login attempts — please try again later",
+                retry_after=retry_after,
+            )
+
+
+def build_login_throttle(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> LoginThrottle:
+    """Create the :class:`LoginThrottle` selected by ``LOGIN_RATE_LIMIT_BACKEND``."""
+    window = settings.LOGIN_RATE_LIMIT_WINDOW
+    limiter: RateLimiter
+    if settings.LOGIN_RATE_LIMIT_BACKEND == "postgres":
+        limiter = PostgresRateLimiter(session_factory, window=window)
+    else:
+        limiter = MemoryRateLimiter(window=window)
+    return LoginThrottle(
+        limiter,
+        max_per_ip=settings.LOGIN_MAX_ATTEMPTS_PER_IP,
+        max_per_email=settings.LOGIN_MAX_ATTEMPTS_PER_EMAIL,
+    )
@@ -0,0 +1,165 @@
+"""Readiness checks for ``GET /health/ready``.
+
+``GET /health`` only proves the process is alive.  A load balancer also
+needs to know whether a worker can actually serve traffic — in particular
+whether it can still get a database connection.
+
+Probes never run on the request path.  :class:`ReadinessMonitor` runs them
+on a fixed schedule (``READINESS_PROBE_INTERVAL``) in a background task and
+:meth:`~ReadinessMonitor.report` only reads the cached results, so the
+endpoint costs nothing per call and a burst of health checks cannot turn
+into a burst of probes.
+
+Checks
+------
+``database`` (required)
+    ``SELECT 1`` through the application pool, bounded by
+    ``READINESS_PROBE_TIMEOUT_SECONDS``.  An exhausted pool fails the check
+    just like an unreachable server.
+``database_replica`` (optional, only with ``DATABASE_READ_URL``)
+    The same probe against the read replica.  Its result also decides
+    whether :func:`~app.db.session.get_read_db` routes reads to the replica;
+    while it fails, reads use the primary.
+AI upstreams (optional)
+    One entry per load-balanced AI service, read from the balancer, which
+    already probes ``GET /models`` on every upstream (see
+    :mod:`app.services.ai.balancer`).  A service is ok while any of its
+    upstreams is healthy.  AI outages degrade the report but do not make the
+    worker unready — every worker shares the same AI servers, and the rest
+    of the site keeps working without them.
+
+A result older than ``READINESS_STALE_AFTER_PROBES`` intervals counts as a
+failure, so a stuck monitor cannot keep reporting "ready".
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.constants import READINESS_PROBE_TIMEOUT_SECONDS, READINESS_STALE_AFTER_PROBES
+from app.db.session import ReadReplica
+from app.schemas.health import CheckResult, ReadinessResponse
+from app.services.ai.balancer import LoadBalancedTransport
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessMonitor:
+    """Background prober whose cached results back ``GET /health/ready``.
+
+    Args:
+        engine: Application engine checked with ``SELECT 1``.
+        transports: Returns the AI load-balancing transports to report on.
+        interval: Seconds between database probes.
+        replica: Read replica to probe and mark (un)healthy, if configured.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        transports: Callable[[], list[LoadBalancedTransport]],
+        *,
+        interval: float,
+        replica: ReadReplica | None = None,
+    ) -> None:
+        self.engine = engine
+        self.transports = transports
+        self.interval = interval
+        self.replica = replica
+        self._results: dict[str, tuple[CheckResult, float]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def probe_databases(self) -> None:
+        """Run the database checks once and cache their results."""
+        await self._probe("database", self.engine, required=True)
+        if self.replica is not None:
+            result = await self._probe("database_replica", self.replica.engine, required=False)
+            self.replica.healthy = result.ok
+
+    async def _probe(self, name: str, engine: AsyncEngine, *, required: bool) -> CheckResult:
+        started = time.perf_counter()
+        error: str | None = None
+        try:
+            async with asyncio.timeout(READINESS_PROBE_TIMEOUT_SECONDS):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except TimeoutError:
+            error = f"timed out after {READINESS_PROBE_TIMEOUT_SECONDS:g}s"
+        except Exception as exc:
+            error = str(exc) or type(exc).__name__
+
+        previous = self._results.get(name)
+        if error is not None and (previous is None or previous[0].ok):
+            logger.warning("Readiness: %s check failed: %s", name, error)
+        result = CheckResult(
+            ok=error is None,
+            required=required,
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
+            checked_at=datetime.now(UTC),
+            error=error,
+        )
+        self._results[name] = (result, time.monotonic())
+        return result
+
+    def report(self) -> ReadinessResponse:
+        """Assemble the readiness report from cached results (no I/O)."""
+        checks = {"database": CheckResult(ok=False, required=True, error="not checked yet")}
+        stale_after = self.interval * READINESS_STALE_AFTER_PROBES
+        for name, (result, checked) in self._results.items():
+            if time.monotonic() - checked > stale_after:
+                result = result.model_copy(update={"ok": False, "error": "result is stale"})
+            checks[name] = result
+        for transport in self.transports():
+            checks[transport.name] = self._upstream_check(transport)
+
+        status: Literal["ready", "degraded", "unavailable"]
+        if not all(check.ok for check in checks.values() if check.required):
+            status = "unavailable"
+        elif all(check.ok for check in checks.values()):
+            status = "ready"
+        else:
+            status = "degraded"
+        return ReadinessResponse(status=status, checks=checks)
+
+    @staticmethod
+    def _upstream_check(transport: LoadBalancedTransport) -> CheckResult:
+        healthy = [u for u in transport.upstreams if u.healthy]
+        probed = [u for u in transport.upstreams if u.probed_at is not None]
+        latencies = [u.probe_seconds for u in healthy if u.probe_seconds is not None]
+        ejected = [u.base_url for u in transport.upstreams if not u.healthy]
+        return CheckResult(
+            ok=bool(healthy),
+            required=False,
+            latency_ms=round(min(latencies) * 1000, 2) if latencies else None,
+            checked_at=(
+                datetime.fromtimestamp(max(u.probed_at or 0.0 for u in probed), UTC)
+                if probed
+                else None
+            ),
+            error=f"ejected: {', '.join(ejected)}" if ejected else None,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe_databases()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start probing in a background task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
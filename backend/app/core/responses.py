@@ -0,0 +1,120 @@
+"""Response classes shared by the API.
+
+:class:`TimedJSONResponse` is the application's default response class.  It
+behaves exactly like :class:`fastapi.responses.JSONResponse` but records the
+time spent encoding the body to JSON bytes under the ``encode`` phase of
+:mod:`app.core.timing`.  That is only the final step: FastAPI validates the
+return value against ``response_model`` and runs ``jsonable_encoder`` before
+the response is built, and that time is not part of ``encode``.
+
+:class:`AdapterJSONResponse` is the fast path for list endpoints.  By default
+FastAPI validates a handler's return value against ``response_model`` again,
+converts it to plain Python objects and only then encodes it with
+:func:`json.dumps`.  For a list the service has just validated (see
+:func:`validate_rows`), that repeats the whole validation.  Returning an
+:class:`AdapterJSONResponse` skips that step: the list is encoded straight to
+JSON bytes by pydantic-core through a cached :func:`list_adapter` (or
+:func:`page_adapter` for keyset-paginated pages).  Keep ``response_model`` on
+the route, because it still drives the OpenAPI schema.
+
+Example::
+
+    @router.get("/", response_model=list[PostResponse])
+    async def get_posts(...) -> AdapterJSONResponse:
+        posts = await service.get_all(db)
+        return AdapterJSONResponse(posts, adapter=list_adapter(PostResponse))
+"""
+
+import functools
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+
+from app.core.timing import record
+from app.schemas.pagination import Page
+
+
+class TimedJSONResponse(JSONResponse):
+    """``JSONResponse`` that records body rendering time as ``encode``."""
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        try:
+            return super().render(content)
+        finally:
+            record("encode", time.perf_counter() - started)
+
+
+@functools.cache
+def list_adapter[T: BaseModel](model: type[T]) -> TypeAdapter[list[T]]:
+    """Return the shared ``TypeAdapter`` for ``list[model]``.
+
+    Building an adapter compiles a pydantic-core schema, so it is done once
+    per model and reused by every request.
+
+    Args:
+        model: The response schema of the list items.
+
+    Returns:
+        A cached ``TypeAdapter(list[model])``.
+    """
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+@functools.cache
+def page_adapter[T: BaseModel](model: type[T]) -> TypeAdapter[Page[T]]:
+    """Return the shared ``TypeAdapter`` for ``Page[model]``.
+
+    Args:
+        model: The response schema of the page items.
+
+    Returns:
+        A cached ``TypeAdapter(Page[model])``.
+    """
+    return TypeAdapter(Page[model])  # type: ignore[valid-type]
+
+
+def validate_rows[T: BaseModel](model: type[T], rows: Sequence[Row[Any]]) -> list[T]:
+    """Validate Core rows as a ``list[model]`` in one pydantic-core call.
+
+    Rows are turned into plain dicts first: pydantic-core reads dicts
+    several times faster than it reads attributes from ``Row`` objects
+    (``from_attributes``), and zipping with the column names is much cheaper
+    than ``Row._asdict()``.
+
+    Args:
+        model: The response schema; its fields must be the row's columns.
+        rows: Rows selected by a repository.
+
+    Returns:
+        The validated models, in row order.
+    """
+    if not rows:
+        return []
+    keys = rows[0]._fields
+    return list_adapter(model).validate_python([dict(zip(keys, row, strict=True)) for row in rows])
+
+
+class AdapterJSONResponse(JSONResponse):
+    """``JSONResponse`` whose body is rendered by a pydantic ``TypeAdapter``.
+
+    Args:
+        content: Already-validated value matching ``adapter``'s type.
+        adapter: Adapter whose ``dump_json`` renders ``content``.
+        **kwargs: Passed on to :class:`~fastapi.responses.JSONResponse`.
+    """
+
+    def __init__(self, content: Any, *, adapter: TypeAdapter[Any], **kwargs: Any) -> None:
+        self.adapter = adapter
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        try:
+            return self.adapter.dump_json(content)
+        finally:
+            record("encode", time.perf_counter() - started)
@@ -0,0 +1,156 @@
+"""In-memory JWT deny-list.
+
+Logging out writes the token's ``jti`` to the ``revoked_tokens`` table.
+Reading that table on every request would add a query to
+``get_current_user``, so each worker mirrors the live rows in
+:data:`revoked_tokens` instead — a dict of ``jti → exp`` checked by
+:func:`~app.core.security.decode_access_token` with a single lookup.
+
+Keeping it in sync
+------------------
+- Whenever the notification listener connects — at startup and after any
+  reconnect, when notifications may have been missed —
+  :func:`load_revocations` reloads the list from the table (and prunes
+  expired rows).  The reload merges into the list, so a notification
+  handled while its query is in flight is never lost.
+- :meth:`~app.repositories.revoked_token_repository.RevokedTokenRepository.revoke`
+  sends ``NOTIFY token_revoked, '<jti> <exp>'``; every worker's
+  :func:`revocation_notification_handler` callback adds the entry.
+
+Entries are pruned once their token has expired — an expired token is
+rejected by the signature check anyway — so the list only ever holds
+revocations for tokens that are still otherwise valid.
+
+A plain dict is used rather than a Bloom filter: the list is small (one
+entry per logout within the token lifetime) and must support pruning and
+exact answers.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.constants import REVOCATION_PRUNE_SECONDS
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """Set of revoked ``jti`` values with per-entry expiry.
+
+    Not thread-safe; use from a single event loop.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, float] = {}
+        self._next_prune = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, jti: object) -> bool:
+        return jti in self._entries
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """Revoke ``jti`` until the Unix timestamp ``expires_at``."""
+        now = time.time()
+        if expires_at > now:
+            self._entries[jti] = expires_at
+        self._maybe_prune(now)
+
+    def merge(self, entries: dict[str, float]) -> None:
+        """Add every entry of ``entries``, e.g. after reloading from the database.
+
+        Existing entries are kept rather than replaced: a notification
+        handled while the reload's query was in flight may be for a row
+        committed after its snapshot, and revocations are only ever removed
+        by expiry anyway.
+        """
+        self._entries.update(entries)
+        self.prune()
+
+    def is_revoked(self, jti: str | None) -> bool:
+        """Return ``True`` when ``jti`` has been revoked."""
+        if jti is None or not self._entries:
+            return False
+        self._maybe_prune(time.time())
+        return jti in self._entries
+
+    def prune(self) -> None:
+        """Drop every entry whose token has expired."""
+        now = time.time()
+        self._next_prune = now + REVOCATION_PRUNE_SECONDS
+        expired = [jti for jti, expires_at in self._entries.items() if expires_at <= now]
+        for jti in expired:
+            del self._entries[jti]
+
+    def _maybe_prune(self, now: float) -> None:
+        if now >= self._next_prune:
+            self.prune()
+
+
+revoked_tokens = RevocationList()
+"""Per-process deny-list consulted by ``decode_access_token``."""
+
+
+async def load_revocations(
+    session_factory: async_sessionmaker[AsyncSession],
+    repo: RevokedTokenRepository | None = None,
+) -> None:
+    """Merge the table's active rows into :data:`revoked_tokens` and prune expired rows.
+
+    Args:
+        session_factory: Factory for a short-lived session.
+        repo: Revoked-token repository.
+    """
+    repo = repo or RevokedTokenRepository()
+    async with session_factory() as db:
+        await repo.delete_expired(db)
+        active = await repo.get_active(db)
+    revoked_tokens.merge({jti: expires_at.timestamp() for jti, expires_at in active})
+    logger.info("Loaded %d token revocations", len(revoked_tokens))
+
+
+def _parse(payload: str) -> tuple[str, float]:
+    jti, expires_at = payload.split(" ", 1)
+    return jti, float(expires_at)
+
+
+_reloads: set[asyncio.Task[None]] = set()
+
+
+def revocation_notification_handler(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> Callable[[str | None], None]:
+    """Build the ``TOKEN_REVOKED_CHANNEL`` callback for the notification listener.
+
+    A payload adds one entry; ``None`` (listener reconnected) schedules a
+    full reload via :func:`load_revocations`.
+
+    Args:
+        session_factory: Factory used for reloads.
+    """
+
+    def handle(payload: str | None) -> None:
+        if payload is not None:
+            try:
+                revoked_tokens.add(*_parse(payload))
+                return
+            except ValueError:
+                logger.warning("Malformed revocation notification: %r", payload)
+        task = asyncio.get_running_loop().create_task(_reload(session_factory))
+        _reloads.add(task)
+        task.add_done_callback(_reloads.discard)
+
+    return handle
+
+
+async def _reload(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    try:
+        await load_revocations(session_factory)
+    except Exception:
+        logger.exception("Could not reload token revocations")
@@ -2,14 +2,56 @@
 
 Uses ``bcrypt`` directly (no passlib) for full compatibility with bcrypt 5.x.
 ``python-jose`` handles JWT signing and verification.
+
+bcrypt and the event loop
+-------------------------
+A single bcrypt hash or check takes hundreds of milliseconds of CPU.  Called
+from an ``async`` handler it freezes every other request on the worker —
+including open SSE streams — for that long.  Request handlers therefore use
+:func:`hash_password_async` / :func:`verify_password_async`, which run bcrypt
+on a dedicated thread pool of ``BCRYPT_MAX_WORKERS`` threads (bcrypt releases
+the GIL while hashing).  The synchronous variants remain for scripts and
+fixtures that run outside the event loop.
+
+Verified-token cache
+--------------------
+Browsers send the same token with every request.  :func:`decode_access_token`
+remembers recently verified tokens in a bounded LRU keyed by the token's
+SHA-256 digest (the token itself is never stored), holding ``sub`` and
+``jti`` and ``exp``.  An entry expires at the token's own ``exp``, and
+:func:`forget_access_token` drops it on logout.
+
+Revocation
+----------
+Every token carries a random ``jti``.  Logging out adds it to the
+per-worker deny-list in :mod:`app.core.revocation`, which
+:func:`decode_access_token` consults on cache hits and misses alike — a
+dict lookup, no database round trip.  Tokens issued before ``jti`` was
+introduced cannot be revoked and simply run until ``exp``.
 """
 
+import asyncio
+import hashlib
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
 
 import bcrypt
 from jose import JWTError, jwt
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.constants import TOKEN_CACHE_MAX_SIZE
+from app.core.metrics import (
+    AUTH_TOKEN_CACHE_LOOKUPS,
+    BCRYPT_QUEUE_DEPTH,
+    BCRYPT_SECONDS,
+    BCRYPT_WAIT_SECONDS,
+)
+from app.core.revocation import revoked_tokens
 
 # ---------------------------------------------------------------------------
 # Password hashing
@@ -17,7 +59,7 @@ from app.core.config import settings
 
 
 def hash_password(plain: str) -> str:
-    """Hash a plain-text password using bcrypt.
+    """Hash a plain-text password using bcrypt at cost ``settings.BCRYPT_ROUNDS``.
 
     Args:
         plain: The raw password string to hash.
@@ -25,7 +67,28 @@ def hash_password(plain: str) -> str:
     Returns:
         A bcrypt-hashed string suitable for storage.
     """
-    return bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(plain.encode("utf-8"), salt).decode("utf-8")
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """Return ``True`` when ``hashed`` was not produced at ``settings.BCRYPT_ROUNDS``.
+
+    bcrypt hashes embed their cost: ``$2b$<cost>$<salt+hash>``.  A stored
+    hash whose cost differs from the configured one (or that cannot be
+    parsed) should be replaced the next time the plain password is known.
+
+    Args:
+        hashed: A stored bcrypt hash.
+
+    Returns:
+        ``True`` if the hash should be regenerated.
+    """
+    try:
+        cost = int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return cost != settings.BCRYPT_ROUNDS
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -41,6 +104,59 @@ def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
 
 
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_MAX_WORKERS, thread_name_prefix="bcrypt"
+)
+_bcrypt_pending = 0
+
+
+async def _run_bcrypt[T](operation: str, func: Callable[[], T]) -> T:
+    """Run ``func`` on the bcrypt pool, recording queue depth and timings."""
+    global _bcrypt_pending
+    submitted = time.perf_counter()
+    started = submitted
+
+    def timed() -> T:
+        nonlocal started
+        started = time.perf_counter()
+        return func()
+
+    _bcrypt_pending += 1
+    BCRYPT_QUEUE_DEPTH.set(max(0, _bcrypt_pending - settings.BCRYPT_MAX_WORKERS))
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor, timed)
+    finally:
+        _bcrypt_pending -= 1
+        BCRYPT_QUEUE_DEPTH.set(max(0, _bcrypt_pending - settings.BCRYPT_MAX_WORKERS))
+        BCRYPT_WAIT_SECONDS.observe(started - submitted, operation=operation)
+        BCRYPT_SECONDS.observe(time.perf_counter() - started, operation=operation)
+
+
+async def hash_password_async(plain: str) -> str:
+    """Hash a password on the bcrypt thread pool without blocking the event loop.
+
+    Args:
+        plain: The raw password string to hash.
+
+    Returns:
+        A bcrypt-hashed string suitable for storage.
+    """
+    return await _run_bcrypt("hash", lambda: hash_password(plain))
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """Verify a password on the bcrypt thread pool without blocking the event loop.
+
+    Args:
+        plain: The raw password to check.
+        hashed: The stored bcrypt hash to check against.
+
+    Returns:
+        ``True`` if the password matches the hash, ``False`` otherwise.
+    """
+    return await _run_bcrypt("verify", lambda: verify_password(plain, hashed))
+
+
 # ---------------------------------------------------------------------------
 # JWT
 # ---------------------------------------------------------------------------
@@ -57,10 +173,77 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
         Encoded JWT string.
     """
     expire = datetime.now(UTC) + (expires_delta or timedelta(minutes=settings.JWT_EXPIRE_MINUTES))
-    payload = {"sub": subject, "exp": expire, "iat": datetime.now(UTC)}
+    payload = {
+        "sub": subject,
+        "exp": expire,
+        "iat": datetime.now(UTC),
+        "jti": uuid.uuid4().hex,
+    }
     return str(jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM))
 
 
+class TokenClaims(NamedTuple):
+    """The verified claims of an access token."""
+
+    sub: str
+    jti: str | None
+    exp: float
+
+
+_verified_tokens: TTLCache[bytes, TokenClaims] = TTLCache(
+    ttl=settings.JWT_EXPIRE_MINUTES * 60, maxsize=TOKEN_CACHE_MAX_SIZE
+)
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def decode_token_claims(token: str) -> TokenClaims:
+    """Verify a JWT access token and return its claims.
+
+    Tokens verified earlier are answered from the verified-token cache
+    without re-checking the signature, until their ``exp``.  Revocation is
+    checked on every call.
+
+    Args:
+        token: The raw JWT string.
+
+    Returns:
+        The token's ``sub``, ``jti`` and ``exp`` claims.
+
+    Raises:
+        ValueError: If the token is invalid, expired, revoked, or missing the
+            ``sub`` claim.
+    """
+    digest = _token_digest(token)
+    claims = _verified_tokens.get(digest)
+    if claims is not None and claims.exp > time.time():
+        AUTH_TOKEN_CACHE_LOOKUPS.inc(result="hit")
+    else:
+        AUTH_TOKEN_CACHE_LOOKUPS.inc(result="miss")
+        try:
+            payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        except JWTError as exc:
+            raise ValueError("Invalid or expired token") from exc
+
+        subject = payload.get("sub")
+        if subject is None:
+            raise ValueError("Token is missing 'sub' claim")
+
+        jti = payload.get("jti")
+        claims = TokenClaims(
+            sub=str(subject),
+            jti=str(jti) if jti is not None else None,
+            exp=float(payload.get("exp", 0)),
+        )
+        _verified_tokens.set(digest, claims, ttl=claims.exp - time.time())
+
+    if revoked_tokens.is_revoked(claims.jti):
+        raise ValueError("Token has been revoked")
+    return claims
+
+
 def decode_access_token(token: str) -> str:
     """Decode and verify a JWT access token.
 
@@ -71,14 +254,16 @@ def decode_access_token(token: str) -> str:
         The ``sub`` claim (user ID) if the token is valid.
 
     Raises:
-        ValueError: If the token is invalid, expired, or missing the ``sub`` claim.
+        ValueError: If the token is invalid, expired, revoked, or missing the
+            ``sub`` claim.
     """
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-    except JWTError as exc:
-        raise ValueError("Invalid or expired token") from exc
-
-    subject: str | None = payload.get("sub")
-    if subject is None:
-        raise ValueError("Token is missing 'sub' claim")
-    return subject
+    return decode_token_claims(token).sub
+
+
+def forget_access_token(token: str) -> None:
+    """Drop ``token`` from the verified-token cache (called on logout).
+
+    Args:
+        token: The raw JWT string.
+    """
+    _verified_tokens.invalidate(_token_digest(token))
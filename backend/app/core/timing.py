@@ -0,0 +1,110 @@
+"""Per-request time accounting.
+
+:class:`~app.core.middleware.ServerTimingMiddleware` opens a
+:class:`RequestTimings` for every HTTP request and stores it in a
+``ContextVar``.  Instrumented code adds to it with :func:`record` or
+:func:`timed`:
+
+``db``
+    Time inside the database driver, from the engine's cursor events
+    (see :mod:`app.db.instrumentation`).
+``embed``
+    Embedding calls in :class:`~app.services.ai.rag_service.RagService`.
+``llm``
+    Chat completions in
+    :class:`~app.services.ai.writing_service.WritingService`.
+``encode``
+    Encoding response bodies to JSON bytes
+    (:class:`~app.core.responses.TimedJSONResponse`,
+    :class:`~app.core.responses.AdapterJSONResponse`).  FastAPI's
+    ``response_model`` validation and ``jsonable_encoder`` run before this
+    and are not included; they only show up in ``total``.
+
+The totals are sent as a ``Server-Timing`` response header and written to
+the access log.  Outside a request (scripts, background jobs) recording is a
+no-op.
+
+Example::
+
+    from app.core.timing import timed
+
+    with timed("embed"):
+        response = await client.embeddings.create(...)
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+
+class RequestTimings:
+    """Accumulated duration and call count per phase for one request."""
+
+    __slots__ = ("counts", "durations", "started")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add one call of ``seconds`` to ``phase``."""
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Render the ``Server-Timing`` header value (durations in ms)."""
+        metrics = [
+            f'{phase};dur={seconds * 1000:.1f};desc="{self.counts[phase]} calls"'
+            for phase, seconds in self.durations.items()
+        ]
+        metrics.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def fields(self) -> dict[str, float | int]:
+        """Return ``<phase>_ms`` and ``<phase>_calls`` fields for the access log."""
+        fields: dict[str, float | int] = {}
+        for phase, seconds in self.durations.items():
+            fields[f"{phase}_ms"] = round(seconds * 1000, 2)
+            fields[f"{phase}_calls"] = self.counts[phase]
+        return fields
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def begin() -> tuple[RequestTimings, Token[RequestTimings | None]]:
+    """Start accounting for a new request in the current context.
+
+    Returns:
+        The new :class:`RequestTimings` and the token for :func:`end`.
+    """
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end(token: Token[RequestTimings | None]) -> None:
+    """Stop accounting started by :func:`begin`."""
+    _current.reset(token)
+
+
+def record(phase: str, seconds: float) -> None:
+    """Add ``seconds`` to ``phase`` for the current request, if any."""
+    timings = _current.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Record the duration of the ``with`` block under ``phase``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - started)
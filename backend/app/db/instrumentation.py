@@ -0,0 +1,244 @@
+"""SQLAlchemy engine instrumentation.
+
+:func:`instrument_engine` hooks the engine's cursor events.  For every
+statement it:
+
+- adds the driver time to the ``db`` phase of the current request (see
+  :mod:`app.core.timing`);
+- records it in every active :class:`QueryCounter` (savepoint statements
+  excluded) — opened per request by
+  :class:`~app.core.middleware.QueryAuditMiddleware` to flag statements
+  repeated more than ``DB_REPEATED_QUERY_THRESHOLD`` times (the N+1
+  pattern), and by tests to assert query budgets;
+- logs it with normalized SQL when it takes ``DB_SLOW_QUERY_MS`` or longer.
+
+:func:`export_pool_metrics` publishes the connection pool's occupancy as
+gauges on every ``/metrics`` scrape and records how long each connection
+stays checked out in ``db_connection_hold_seconds`` (also added to the
+request's ``db_conn`` phase).  :class:`InstrumentedAsyncPool` — the
+engine's pool class — records how long each checkout waited in
+``db_pool_wait_seconds``.
+
+Sessions check out a connection lazily, on their first statement, and
+return it when their transaction ends — on commit, rollback or close.  The
+hold times therefore show how long requests actually occupy the pool: by
+Little's law, ``DB_POOL_SIZE`` should cover the request rate times the mean
+hold time, with headroom for peaks.
+
+The events fire inside SQLAlchemy's greenlet bridge, which shares the
+calling task's ``contextvars`` context, so they see the request that issued
+the query.
+
+Example::
+
+    with count_queries() as queries:
+        await repo.get_all(db)
+    assert queries.count == 1
+"""
+
+import functools
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, cast
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import (
+    DB_CONNECTION_HOLD_SECONDS,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_WAIT_SECONDS,
+    REGISTRY,
+)
+from app.core.timing import record
+
+logger = logging.getLogger(__name__)
+
+_STARTED_KEY = "query_started"
+_CHECKED_OUT_KEY = "checked_out_at"
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|(?<![\w.:]):\w+|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+# Transaction control, not queries: sessions bound to a connection that is
+# already in a transaction (e.g. the test fixtures) wrap their work in these.
+_SAVEPOINTS = re.compile(r"\s*(?:SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b", re.I)
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """Reduce ``statement`` to its shape: literals and parameters become ``?``.
+
+    ``IN`` lists of any length collapse to ``(...)`` and whitespace is
+    squeezed, so the same query with different arguments normalizes to the
+    same string.  Cached — SQLAlchemy's compiled cache means the same
+    statement strings recur.
+
+    Args:
+        statement: SQL as sent to the driver.
+
+    Returns:
+        The normalized statement.
+    """
+    shape = _LITERALS.sub("?", statement)
+    shape = _IN_LISTS.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryCounter:
+    """Statements executed while the counter is active (see :func:`count_queries`).
+
+    Attributes:
+        count: Number of statements.
+        seconds: Total driver time.
+        shapes: Statements per normalized SQL shape.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def add(self, shape: str, seconds: float) -> None:
+        """Record one statement; savepoint statements are ignored."""
+        if _SAVEPOINTS.match(shape):
+            return
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[shape] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Return shapes executed more than ``threshold`` times, most frequent first."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+_counters: ContextVar[tuple[QueryCounter, ...]] = ContextVar("query_counters", default=())
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Count the statements executed in the current context within the block.
+
+    Counters nest: a statement is recorded in every counter that is active.
+    """
+    counter = QueryCounter()
+    token = _counters.set((*_counters.get(), counter))
+    try:
+        yield counter
+    finally:
+        _counters.reset(token)
+
+
+def _before_cursor_execute(conn: Connection, *_args: Any) -> None:
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _finish(statement: str, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    record("db", elapsed)
+    counters = _counters.get()
+    slow = elapsed * 1000 >= settings.DB_SLOW_QUERY_MS
+    if not counters and not slow:
+        return
+    shape = normalize_sql(statement)
+    for counter in counters:
+        counter.add(shape, elapsed)
+    if slow:
+        logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, shape)
+
+
+def _after_cursor_execute(conn: Connection, _cursor: Any, statement: str, *_args: Any) -> None:
+    _finish(statement, conn.info[_STARTED_KEY].pop())
+
+
+def _handle_error(context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute.
+    if context.connection is not None:
+        stack = context.connection.info.get(_STARTED_KEY)
+        if stack:
+            _finish(context.statement or "", stack.pop())
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records checkout wait time.
+
+    Attributes:
+        metrics_name: ``pool`` label of its metrics, set by
+            :func:`export_pool_metrics`.
+    """
+
+    metrics_name = "primary"
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started, pool=self.metrics_name)
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        pool = cast("InstrumentedAsyncPool", super().recreate())
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+def _collect_pool(pool: Pool, name: str) -> None:
+    if isinstance(pool, QueuePool):
+        DB_POOL_SIZE.set(pool.size(), pool=name)
+        DB_POOL_CHECKED_OUT.set(pool.checkedout(), pool=name)
+        # ``overflow()`` counts up from ``-pool_size`` while the pool fills.
+        DB_POOL_OVERFLOW.set(max(0, pool.overflow()), pool=name)
+
+
+def _on_checkout(_dbapi_conn: Any, entry: ConnectionPoolEntry, _proxy: Any) -> None:
+    entry.info[_CHECKED_OUT_KEY] = time.perf_counter()
+
+
+def _hold_timer(name: str) -> Callable[[Any, ConnectionPoolEntry], None]:
+    def on_checkin(_dbapi_conn: Any, entry: ConnectionPoolEntry) -> None:
+        checked_out = entry.info.pop(_CHECKED_OUT_KEY, None)
+        if checked_out is not None:
+            held = time.perf_counter() - checked_out
+            DB_CONNECTION_HOLD_SECONDS.observe(held, pool=name)
+            record("db_conn", held)
+
+    return on_checkin
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Register statement timing, counting and slow-query listeners on ``engine``.
+
+    Args:
+        engine: The async engine to instrument.
+    """
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def export_pool_metrics(engine: AsyncEngine, name: str = "primary") -> None:
+    """Publish ``engine``'s pool occupancy as gauges on every metrics export.
+
+    Args:
+        engine: An engine using :class:`InstrumentedAsyncPool`.
+        name: ``pool`` label of the engine's metrics (``primary`` or
+            ``replica``).
+    """
+    sync_engine = engine.sync_engine
+    if isinstance(sync_engine.pool, InstrumentedAsyncPool):
+        sync_engine.pool.metrics_name = name
+    event.listen(sync_engine, "checkout", _on_checkout)
+    event.listen(sync_engine, "checkin", _hold_timer(name))
+    # Read the pool on each export — ``dispose()`` replaces it.
+    REGISTRY.add_collector(lambda: _collect_pool(sync_engine.pool, name))
@@ -0,0 +1,138 @@
+"""Postgres ``LISTEN`` / ``NOTIFY`` helpers for cross-worker signalling.
+
+Each uvicorn worker keeps in-process caches (see :mod:`app.core.cache`).
+When one worker changes a row those caches depend on, it emits
+``NOTIFY <channel>, '<payload>'`` in the same transaction; Postgres delivers
+the notification to every listening connection only once that transaction
+commits.
+
+:class:`NotificationListener` holds one dedicated ``asyncpg`` connection per
+worker (outside the SQLAlchemy pool) that ``LISTEN``\\ s on every subscribed
+channel and dispatches payloads to callbacks.  If the connection drops it
+reconnects with a fixed back-off and calls every callback with ``None`` —
+notifications sent while disconnected are lost, so subscribers must treat
+``None`` as "reset everything".
+
+Usage::
+
+    from app.db.notify import listener, notify
+
+    listener.subscribe("user_invalidated", invalidate_principal)
+    await listener.start()               # in the app lifespan
+
+    await notify(db, "user_invalidated", str(user.id))   # before commit
+"""
+
+import asyncio
+import contextlib
+import functools
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.constants import NOTIFY_RECONNECT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+NotificationCallback = Callable[[str | None], None]
+
+
+async def notify(db: AsyncSession, channel: str, payload: str) -> None:
+    """Queue a notification on ``channel``, delivered when ``db`` commits.
+
+    Args:
+        db: Active async database session whose transaction carries the
+            notification.
+        channel: Channel name.
+        payload: Notification payload (Postgres limits it to 8000 bytes).
+    """
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": channel, "payload": payload},
+    )
+
+
+def _set_event(event: asyncio.Event, _conn: Any) -> None:
+    event.set()
+
+
+class NotificationListener:
+    """Dedicated ``LISTEN`` connection dispatching notifications to callbacks.
+
+    Args:
+        database_url: SQLAlchemy-style URL; the ``+asyncpg`` driver suffix
+            is stripped before connecting.
+    """
+
+    def __init__(self, database_url: str) -> None:
+        self.dsn = database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self._callbacks: dict[str, list[NotificationCallback]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def subscribe(self, channel: str, callback: NotificationCallback) -> None:
+        """Register ``callback`` for ``channel``.
+
+        Subscriptions must be registered before :meth:`start`.
+        """
+        self._callbacks.setdefault(channel, []).append(callback)
+
+    async def start(self) -> None:
+        """Start listening in a background task (no-op without subscriptions)."""
+        if self._callbacks and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _dispatch(self, _conn: Any, _pid: int, channel: str, payload: str) -> None:
+        for callback in self._callbacks.get(channel, ()):
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception("Notification callback for %r failed", channel)
+
+    def _reset(self) -> None:
+        for channel, callbacks in self._callbacks.items():
+            for callback in callbacks:
+                try:
+                    callback(None)
+                except Exception:
+                    logger.exception("Notification reset for %r failed", channel)
+
+    async def _run(self) -> None:
+        while True:
+            conn: asyncpg.Connection | None = None
+            try:
+                conn = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                conn.add_termination_listener(functools.partial(_set_event, lost))
+                for channel in self._callbacks:
+                    await conn.add_listener(channel, self._dispatch)
+                # Anything sent before LISTEN took effect was missed.
+                self._reset()
+                logger.info("Listening for notifications on %s", ", ".join(self._callbacks))
+                await lost.wait()
+                logger.warning("Notification connection lost — reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Notification listener unavailable: %s", exc)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            self._reset()
+            await asyncio.sleep(NOTIFY_RECONNECT_SECONDS)
+
+
+listener = NotificationListener(settings.DATABASE_URL)
+"""Per-process listener started from the application lifespan."""
@@ -1,18 +1,59 @@
+"""Database engines, session factories and session dependencies.
+
+Writes — and every read that must see them — use the primary engine through
+:func:`get_db`.  Public, read-only routes use :func:`get_read_db`, which
+goes to the read replica configured by ``DATABASE_READ_URL``:
+
+- without ``DATABASE_READ_URL`` it is the same as :func:`get_db`;
+- after a successful write, :class:`~app.core.middleware.PrimaryReadsMiddleware`
+  sets the ``PRIMARY_READS_COOKIE`` cookie for ``DB_READ_STICKY_SECONDS``,
+  and requests carrying it read from the primary, so an editor immediately
+  sees their own change despite replication lag;
+- while the replica is unhealthy — a connection to it was lost, or the
+  readiness probe (see :mod:`app.core.readiness`) failed — reads fall back
+  to the primary until the next successful probe.
+
+Sessions are lazy: a connection is checked out on the first statement, not
+when the dependency runs.  Routes declare both dependencies with
+``scope="function"`` so the session closes — and returns its connection to
+the pool — as soon as the handler returns, rather than after the response
+has been sent to the client.
+"""
+
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import settings
+from app.core.constants import PRIMARY_READS_COOKIE
+from app.db.instrumentation import InstrumentedAsyncPool, export_pool_metrics, instrument_engine
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-)
+
+def _create_engine(url: str, pool_name: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        poolclass=InstrumentedAsyncPool,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    instrument_engine(engine)
+    export_pool_metrics(engine, pool_name)
+    return engine
+
+
+engine = _create_engine(settings.DATABASE_URL, "primary")
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -21,9 +62,65 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+class ReadReplica:
+    """A read-only engine and whether reads may currently be routed to it.
+
+    Args:
+        url: Async SQLAlchemy connection string of the replica.
+
+    Attributes:
+        engine: Engine connected to the replica.
+        sessionmaker: Session factory bound to :attr:`engine`.
+        healthy: ``False`` after a lost connection or a failed probe; set
+            back by the next successful probe.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.engine = _create_engine(url, "replica")
+        self.sessionmaker = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        self.healthy = True
+        event.listen(self.engine.sync_engine, "handle_error", self._handle_error)
+
+    def _handle_error(self, context: Any) -> None:
+        if context.is_disconnect:
+            self.healthy = False
+
+    async def dispose(self) -> None:
+        """Close the replica's pooled connections."""
+        await self.engine.dispose()
+
+
+read_replica = ReadReplica(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session for read-only work, on the replica when possible.
+
+    Only for routes that never write: the session may be bound to a
+    read-only server.  See the module docstring for when the primary is
+    used instead.
+    """
+    factory = AsyncSessionLocal
+    if (
+        read_replica is not None
+        and read_replica.healthy
+        and PRIMARY_READS_COOKIE not in request.cookies
+    ):
+        factory = read_replica.sessionmaker
+    async with factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -1,23 +1,74 @@
+import asyncio
+import contextlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.v1.router import api_router
+from app.core.cache import invalidate_principal
 from app.core.config import settings
+from app.core.constants import (
+    METRICS_SNAPSHOT_SECONDS,
+    TOKEN_REVOKED_CHANNEL,
+    USER_INVALIDATED_CHANNEL,
+)
 from app.core.error_handlers import register_exception_handlers, register_middlewares
 from app.core.logging import setup_logging
-from app.db.session import engine
+from app.core.metrics import REGISTRY, write_snapshots
+from app.core.readiness import ReadinessMonitor
+from app.core.responses import TimedJSONResponse
+from app.core.revocation import revocation_notification_handler
+from app.db.notify import listener
+from app.db.session import AsyncSessionLocal, engine, read_replica
+from app.schemas.health import ReadinessResponse
+from app.services.ai.client import (
+    start_upstream_probes,
+    stop_upstream_probes,
+    upstream_transports,
+)
 
 setup_logging()
 
+readiness = ReadinessMonitor(
+    engine,
+    upstream_transports,
+    interval=settings.READINESS_PROBE_INTERVAL,
+    replica=read_replica,
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Startup — re-probe ejected AI upstreams in the background
+    start_upstream_probes()
+    # Startup — probe the database in the background for /health/ready
+    readiness.start()
+    # Startup — drop cached users changed by other workers
+    listener.subscribe(USER_INVALIDATED_CHANNEL, invalidate_principal)
+    # Startup — mirror revoked JWTs; (re)loaded from the table on every connect
+    listener.subscribe(TOKEN_REVOKED_CHANNEL, revocation_notification_handler(AsyncSessionLocal))
+    await listener.start()
+    # Startup — publish this worker's metrics for multi-worker aggregation
+    snapshots: asyncio.Task[None] | None = None
+    if settings.METRICS_MULTIPROC_DIR:
+        snapshots = asyncio.create_task(
+            write_snapshots(REGISTRY, settings.METRICS_MULTIPROC_DIR, METRICS_SNAPSHOT_SECONDS)
+        )
     yield
-    # Shutdown — dispose DB connection pool
+    if snapshots is not None:
+        snapshots.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await snapshots
+    await listener.stop()
+    await readiness.stop()
+    await stop_upstream_probes()
+    # Shutdown — dispose DB connection pools
     await engine.dispose()
+    if read_replica is not None:
+        await read_replica.dispose()
 
 
 app = FastAPI(
@@ -25,6 +76,7 @@ app = FastAPI(
     version="0.1.0",
     description="Personal portfolio backend API",
     lifespan=lifespan,
+    default_response_class=TimedJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -47,3 +99,38 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok", "version": "0.1.0"}
+
+
+@app.get("/health/ready", response_model=ReadinessResponse)
+async def health_ready() -> JSONResponse:
+    """Report whether this worker can serve traffic.
+
+    Served from results cached by the background
+    :class:`~app.core.readiness.ReadinessMonitor` — no probe runs per call.
+    Returns 200 when the database check passes (AI outages only mark the
+    report ``degraded``) and 503 otherwise.
+    """
+    report = readiness.report()
+    return JSONResponse(
+        report.model_dump(mode="json"),
+        status_code=503 if report.status == "unavailable" else 200,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Expose metrics in the Prometheus text format.
+
+    With ``METRICS_MULTIPROC_DIR`` set, the snapshots of every worker are
+    merged (off the event loop) so any worker can answer the scrape.
+    """
+    if settings.METRICS_MULTIPROC_DIR:
+        # Read this worker's instruments here on the loop; only the file
+        # merge runs in the thread.
+        snapshot = REGISTRY.snapshot()
+        body = await asyncio.to_thread(
+            REGISTRY.render_multiprocess, settings.METRICS_MULTIPROC_DIR, snapshot
+        )
+    else:
+        body = REGISTRY.render()
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
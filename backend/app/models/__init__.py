@@ -9,6 +9,8 @@ must be imported at module level in this file.
 from app.models.certification import Certification
 from app.models.post import Post
 from app.models.project import Project
+from app.models.rate_limit import RateLimitCounter
+from app.models.revoked_token import RevokedToken
 from app.models.user import User
 
-__all__ = ["Certification", "Post", "Project", "User"]
+__all__ = ["Certification", "Post", "Project", "RateLimitCounter", "RevokedToken", "User"]
@@ -21,7 +21,7 @@ Example::
 from datetime import date
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Boolean, Date, String, Text
+from sqlalchemy import Boolean, Date, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.constants import EMBEDDING_DIMENSIONS
@@ -38,7 +38,9 @@ class Certification(Base, UUIDMixin, TimestampMixin):
     The ``content_embedding`` column stores a pgvector
     ``vector(EMBEDDING_DIMENSIONS)`` value generated by the RAG service from
     the certification's name, issuer, and description.  It is ``NULL`` until
-    the embedding pipeline runs for the first time.
+    the embedding pipeline runs for the first time.  The column is
+    deferred: ORM queries never load it (reading it on an instance raises),
+    only the RAG service's SQL touches it.
 
     Attributes:
         name: Full name of the certification
@@ -75,5 +77,16 @@ class Certification(Base, UUIDMixin, TimestampMixin):
     badge_image_url: Mapped[str | None] = mapped_column(String(500))
     featured: Mapped[bool] = mapped_column(Boolean, default=False)
     content_embedding: Mapped[list[float] | None] = mapped_column(
-        Vector(EMBEDDING_DIMENSIONS), nullable=True
+        Vector(EMBEDDING_DIMENSIONS), nullable=True, deferred=True, deferred_raiseload=True
     )
+
+
+# Indexes matching CertificationRepository.get_all: every certification (the
+# default list) and the featured ones, newest first.
+Index("ix_certifications_issued_at", Certification.issued_at.desc(), Certification.id.desc())
+Index(
+    "ix_certifications_featured_issued_at",
+    Certification.issued_at.desc(),
+    Certification.id.desc(),
+    postgresql_where=Certification.featured,
+)
@@ -20,7 +20,7 @@ Example::
 """
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import ARRAY, Boolean, String, Text
+from sqlalchemy import ARRAY, Boolean, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.constants import EMBEDDING_DIMENSIONS
@@ -37,7 +37,9 @@ class Post(Base, UUIDMixin, TimestampMixin):
     The ``content_embedding`` column stores a pgvector
     ``vector(EMBEDDING_DIMENSIONS)`` value generated by the RAG service from
     the post's title, excerpt, and body.  It is ``NULL`` until the embedding
-    pipeline runs for the first time.
+    pipeline runs for the first time.  The column is
+    deferred: ORM queries never load it (reading it on an instance raises),
+    only the RAG service's SQL touches it.
 
     Attributes:
         title: Display title of the post (max 255 chars).
@@ -69,5 +71,14 @@ class Post(Base, UUIDMixin, TimestampMixin):
     published: Mapped[bool] = mapped_column(Boolean, default=False)
     reading_time_minutes: Mapped[int | None] = mapped_column(nullable=True)
     content_embedding: Mapped[list[float] | None] = mapped_column(
-        Vector(EMBEDDING_DIMENSIONS), nullable=True
+        Vector(EMBEDDING_DIMENSIONS), nullable=True, deferred=True, deferred_raiseload=True
     )
+
+
+# Partial index matching PostRepository.get_all for the public (published) list.
+Index(
+    "ix_posts_published_created_at",
+    Post.created_at.desc(),
+    Post.id.desc(),
+    postgresql_where=Post.published,
+)
@@ -20,7 +20,7 @@ Example::
 """
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import ARRAY, Boolean, String, Text
+from sqlalchemy import ARRAY, Boolean, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.constants import EMBEDDING_DIMENSIONS
@@ -37,7 +37,9 @@ class Project(Base, UUIDMixin, TimestampMixin):
     The ``content_embedding`` column stores a pgvector
     ``vector(EMBEDDING_DIMENSIONS)`` value generated by the RAG service from
     the project's title, description, and content.  It is ``NULL`` until the
-    embedding pipeline runs for the first time.
+    embedding pipeline runs for the first time.  The column is
+    deferred: ORM queries never load it (reading it on an instance raises),
+    only the RAG service's SQL touches it.
 
     Attributes:
         title: Display name of the project (max 255 chars).
@@ -77,5 +79,24 @@ class Project(Base, UUIDMixin, TimestampMixin):
     published: Mapped[bool] = mapped_column(Boolean, default=False)
     order: Mapped[int] = mapped_column(default=0)
     content_embedding: Mapped[list[float] | None] = mapped_column(
-        Vector(EMBEDDING_DIMENSIONS), nullable=True
+        Vector(EMBEDDING_DIMENSIONS), nullable=True, deferred=True, deferred_raiseload=True
     )
+
+
+# Partial indexes matching ProjectRepository.get_all: the public list
+# (published) and the homepage featured list (published and featured), both in
+# the list's sort order so Postgres reads rows pre-sorted and stops at LIMIT.
+Index(
+    "ix_projects_published_order",
+    Project.order,
+    Project.created_at.desc(),
+    Project.id.desc(),
+    postgresql_where=Project.published,
+)
+Index(
+    "ix_projects_featured_order",
+    Project.order,
+    Project.created_at.desc(),
+    Project.id.desc(),
+    postgresql_where=Project.published & Project.featured,
+)
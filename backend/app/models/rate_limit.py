@@ -0,0 +1,36 @@
+"""ORM model for shared rate-limit counters.
+
+Backs the Postgres mode of the login limiter in :mod:`app.core.rate_limit`.
+Each row holds a sliding-window *counter* for one key — the attempt counts
+of the current and the previous fixed window — so a key costs one small row
+no matter how many attempts it makes.
+
+Rows are written exclusively through
+:class:`~app.repositories.rate_limit_repository.RateLimitRepository` with a
+single ``INSERT … ON CONFLICT DO UPDATE … RETURNING`` statement, which keeps
+concurrent workers consistent without explicit locking.
+"""
+
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class RateLimitCounter(Base):
+    """Sliding-window counter for one rate-limit key.
+
+    Attributes:
+        key: Limiter key, e.g. ``"login:ip:203.0.113.7"``.
+        window: Index of the current fixed window
+            (``floor(unix_time / window_seconds)``).
+        current_count: Attempts counted in ``window``.
+        previous_count: Attempts counted in ``window - 1``.
+    """
+
+    __tablename__ = "rate_limit_counters"
+
+    key: Mapped[str] = mapped_column(String(320), primary_key=True)
+    window: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
+    current_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    previous_count: Mapped[int] = mapped_column(Integer, nullable=False)
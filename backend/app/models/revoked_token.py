@@ -0,0 +1,33 @@
+"""ORM model for revoked access tokens.
+
+A row is written when a user logs out, keyed by the token's ``jti`` claim.
+Rows are only needed until the token would have expired anyway; expired rows
+are pruned by :func:`~app.core.revocation.load_revocations`.
+
+Every worker mirrors the live rows in memory
+(:data:`~app.core.revocation.revoked_tokens`), so the table is never read
+on the request path.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class RevokedToken(Base):
+    """A JWT that must no longer be accepted.
+
+    Attributes:
+        jti: The token's unique ``jti`` claim.
+        expires_at: The token's ``exp`` — the row can be deleted after it.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(String(64), primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -21,12 +21,23 @@ Typical usage::
 """
 
 import uuid
+from datetime import date
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.certification import Certification
-from app.schemas.certification import CertificationCreate, CertificationUpdate
+from app.schemas.certification import (
+    CertificationCreate,
+    CertificationResponse,
+    CertificationUpdate,
+)
+
+# Columns returned by writes: exactly what the API responds with.
+_RESPONSE_COLUMNS = tuple(
+    getattr(Certification, name) for name in CertificationResponse.model_fields
+)
 
 
 class CertificationRepository:
@@ -46,11 +57,12 @@ class CertificationRepository:
         db: AsyncSession,
         *,
         featured_only: bool = False,
-    ) -> list[Certification]:
+    ) -> list[Row[Any]]:
         """Return a list of certifications, with an optional featured filter.
 
         Results are ordered by ``issued_at`` descending (most recently issued
-        certifications appear first).
+        certifications appear first), with ``id`` as a tiebreaker — the order
+        of the indexes declared on the model.
 
         Args:
             db: Active async database session.
@@ -58,14 +70,55 @@ class CertificationRepository:
                 ``featured = TRUE`` are returned.
 
         Returns:
-            A (possibly empty) list of
-            :class:`~app.models.certification.Certification` ORM instances.
+            A (possibly empty) list of rows holding the
+            :class:`~app.schemas.certification.CertificationResponse` columns.  Plain Core rows:
+            nothing is added to the session's identity map.
+        """
+        query = select(*_RESPONSE_COLUMNS).order_by(
+            Certification.issued_at.desc(), Certification.id.desc()
+        )
+        if featured_only:
+            query = query.where(Certification.featured)
+        result = await db.execute(query)
+        return list(result.all())
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        after: tuple[date, uuid.UUID] | None,
+        limit: int,
+        featured_only: bool = False,
+    ) -> list[Row[Any]]:
+        """Return up to ``limit`` certifications that sort after ``after``.
+
+        Keyset pagination in the :meth:`get_all` order: the row comparison
+        ``(issued_at, id) < (:issued_at, :id)`` is answered straight from the
+        list index, so every page costs the same however deep it is.
+
+        Args:
+            db: Active async database session.
+            after: ``(issued_at, id)`` of the last certification on the previous page,
+                or ``None`` for the first page.
+            limit: Maximum number of certifications to return.
+            featured_only: When ``True``, only featured certifications
+                are returned.
+
+        Returns:
+            A (possibly empty) list of rows holding the
+            :class:`~app.schemas.certification.CertificationResponse` columns.
         """
-        query = select(Certification).order_by(Certification.issued_at.desc())
+        query = (
+            select(*_RESPONSE_COLUMNS)
+            .order_by(Certification.issued_at.desc(), Certification.id.desc())
+            .limit(limit)
+        )
         if featured_only:
-            query = query.where(Certification.featured.is_(True))
+            query = query.where(Certification.featured)
+        if after is not None:
+            query = query.where(tuple_(Certification.issued_at, Certification.id) < after)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def get_by_id(self, db: AsyncSession, cert_id: uuid.UUID) -> Certification | None:
         """Look up a certification by its UUID primary key.
@@ -100,45 +153,58 @@ class CertificationRepository:
         return cert
 
     async def update(
-        self,
-        db: AsyncSession,
-        cert: Certification,
-        data: CertificationUpdate,
-    ) -> Certification:
-        """Apply a partial update to an existing certification.
+        self, db: AsyncSession, cert_id: uuid.UUID, data: CertificationUpdate
+    ) -> Row[Any] | None:
+        """Apply a partial update to the cert with the given id in one statement.
 
         Only fields that are explicitly set in ``data`` (i.e. present in
-        ``model_dump(exclude_unset=True)``) are written to the database.
-        Fields not included in the update payload are left unchanged.
+        ``model_dump(exclude_unset=True)``) are written, with a single
+        ``UPDATE ... RETURNING`` of the response columns — the row (and its
+        embedding) is never loaded.  An empty patch is answered with a
+        ``SELECT`` of the same columns instead.
 
         Args:
             db: Active async database session.
-            cert: The ORM instance to update.  Must already be attached
-                to ``db`` (typically retrieved via :meth:`get_by_id` in the
-                same session).
+            cert_id: UUID of the certification.
             data: Partial update payload.  Only non-``None`` / explicitly
                 set fields are applied.
 
         Returns:
-            The updated :class:`~app.models.certification.Certification`
-            instance with refreshed field values from the database.
+            The updated row with the :class:`~app.schemas.certification.CertificationResponse`
+            columns, or ``None`` if no cert matches.
         """
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(cert, key, value)
+        values = data.model_dump(exclude_unset=True)
+        if not values:
+            result = await db.execute(select(*_RESPONSE_COLUMNS).where(Certification.id == cert_id))
+            return result.one_or_none()
+        result = await db.execute(
+            update(Certification)
+            .where(Certification.id == cert_id)
+            .values(**values)
+            .returning(*_RESPONSE_COLUMNS)
+        )
+        row = result.one_or_none()
         await db.commit()
-        await db.refresh(cert)
-        return cert
+        return row
+
+    async def delete(self, db: AsyncSession, cert_id: uuid.UUID) -> bool:
+        """Permanently delete the cert with the given id.
 
-    async def delete(self, db: AsyncSession, cert: Certification) -> None:
-        """Permanently delete a certification from the database.
+        Issues a single ``DELETE ... RETURNING id`` without loading the row.
 
         Args:
             db: Active async database session.
-            cert: The ORM instance to delete.  Must already be attached
-                to ``db``.
+            cert_id: UUID of the certification to delete.
+
+        Returns:
+            ``True`` if a row was deleted, ``False`` if no cert matches.
         """
-        await db.delete(cert)
+        result = await db.execute(
+            delete(Certification).where(Certification.id == cert_id).returning(Certification.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
+        return deleted
 
     async def update_embedding(
         self,
@@ -159,8 +225,9 @@ class CertificationRepository:
             embedding: A list of floats of length
                 :data:`~app.core.constants.EMBEDDING_DIMENSIONS` (1 536).
         """
-        cert = await self.get_by_id(db, cert_id)
-        if not cert:
-            return
-        cert.content_embedding = embedding
+        await db.execute(
+            update(Certification)
+            .where(Certification.id == cert_id)
+            .values(content_embedding=embedding)
+        )
         await db.commit()
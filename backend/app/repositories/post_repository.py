@@ -21,12 +21,21 @@ Typical usage::
 """
 
 import uuid
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.post import Post
-from app.schemas.post import PostCreate, PostUpdate
+from app.schemas.post import PostCreate, PostResponse, PostSummary, PostUpdate
+
+# Columns returned by writes: exactly what the API responds with.
+_RESPONSE_COLUMNS = tuple(getattr(Post, name) for name in PostResponse.model_fields)
+# Columns for list views: no long-form text, no embedding.
+_SUMMARY_COLUMNS = tuple(getattr(Post, name) for name in PostSummary.model_fields)
 
 
 class PostRepository:
@@ -46,10 +55,12 @@ class PostRepository:
         db: AsyncSession,
         *,
         published_only: bool = True,
-    ) -> list[Post]:
+    ) -> list[Row[Any]]:
         """Return a list of posts, with an optional published filter.
 
-        Results are ordered by ``created_at`` descending (newest first).
+        Results are ordered by ``created_at`` descending (newest first), with
+        ``id`` as a tiebreaker.  The filter is the bare boolean column so the
+        planner can match the partial index declared on the model.
 
         Args:
             db: Active async database session.
@@ -58,14 +69,15 @@ class PostRepository:
                 admin CMS which must show drafts.
 
         Returns:
-            A (possibly empty) list of :class:`~app.models.post.Post`
-            ORM instances.
+            A (possibly empty) list of rows holding the
+            :class:`~app.schemas.post.PostResponse` columns.  Plain Core rows:
+            nothing is added to the session's identity map.
         """
-        query = select(Post).order_by(Post.created_at.desc())
+        query = select(*_RESPONSE_COLUMNS).order_by(Post.created_at.desc(), Post.id.desc())
         if published_only:
-            query = query.where(Post.published.is_(True))
+            query = query.where(Post.published)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def get_by_id(self, db: AsyncSession, post_id: uuid.UUID) -> Post | None:
         """Look up a post by its UUID primary key.
@@ -81,6 +93,42 @@ class PostRepository:
         result = await db.execute(select(Post).where(Post.id == post_id))
         return result.scalar_one_or_none()
 
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        after: tuple[datetime, uuid.UUID] | None,
+        limit: int,
+        published_only: bool = True,
+    ) -> list[Row[Any]]:
+        """Return up to ``limit`` posts that sort after ``after``.
+
+        Keyset pagination in the :meth:`get_all` order: the row comparison
+        ``(created_at, id) < (:created_at, :id)`` is answered straight from the
+        list index, so every page costs the same however deep it is.
+
+        Args:
+            db: Active async database session.
+            after: ``(created_at, id)`` of the last post on the previous page,
+                or ``None`` for the first page.
+            limit: Maximum number of posts to return.
+            published_only: When ``True`` (default), only published
+                posts are returned.
+
+        Returns:
+            A (possibly empty) list of rows holding only the
+            :class:`~app.schemas.post.PostSummary` columns.
+        """
+        query = (
+            select(*_SUMMARY_COLUMNS).order_by(Post.created_at.desc(), Post.id.desc()).limit(limit)
+        )
+        if published_only:
+            query = query.where(Post.published)
+        if after is not None:
+            query = query.where(tuple_(Post.created_at, Post.id) < after)
+        result = await db.execute(query)
+        return list(result.all())
+
     async def get_by_slug(self, db: AsyncSession, slug: str) -> Post | None:
         """Look up a post by its URL slug.
 
@@ -99,8 +147,14 @@ class PostRepository:
         result = await db.execute(select(Post).where(Post.slug == slug))
         return result.scalar_one_or_none()
 
-    async def create(self, db: AsyncSession, data: PostCreate) -> Post:
-        """Insert a new post row into the database.
+    async def create(self, db: AsyncSession, data: PostCreate) -> Post | None:
+        """Insert a new post row unless its slug is already taken.
+
+        Issues a single ``INSERT ... ON CONFLICT (slug) DO NOTHING RETURNING``
+        followed by ``COMMIT``.  Checking the slug and inserting in one
+        statement means two concurrent creates with the same slug cannot both
+        succeed, and the returned row already carries the server-generated
+        fields, so no ``SELECT`` or ``db.refresh()`` is needed.
 
         The slug is expected to be present on ``data`` — the
         :class:`~app.schemas.post.PostCreate` validator auto-generates
@@ -113,49 +167,73 @@ class PostRepository:
         Returns:
             The newly inserted :class:`~app.models.post.Post` instance
             with all server-generated fields (``id``, ``created_at``,
-            ``updated_at``) populated via ``db.refresh()``.
+            ``updated_at``) populated, or ``None`` if a post with the same
+            slug already exists.
         """
-        post = Post(**data.model_dump())
-        db.add(post)
+        stmt = (
+            insert(Post)
+            .values(**data.model_dump())
+            .on_conflict_do_nothing(index_elements=[Post.slug])
+            .returning(Post)
+        )
+        post = (await db.scalars(stmt)).one_or_none()
         await db.commit()
-        await db.refresh(post)
         return post
 
-    async def update(self, db: AsyncSession, post: Post, data: PostUpdate) -> Post:
-        """Apply a partial update to an existing post.
+    async def update(self, db: AsyncSession, slug: str, data: PostUpdate) -> Row[Any] | None:
+        """Apply a partial update to the post with the given slug in one statement.
 
         Only fields that are explicitly set in ``data`` (i.e. present in
-        ``model_dump(exclude_unset=True)``) are written to the database.
-        Fields not included in the update payload are left unchanged.
+        ``model_dump(exclude_unset=True)``) are written, with a single
+        ``UPDATE ... RETURNING`` of the response columns — the row (and its
+        embedding) is never loaded.  An empty patch is answered with a
+        ``SELECT`` of the same columns instead.
 
         Args:
             db: Active async database session.
-            post: The ORM instance to update.  Must already be attached
-                to ``db`` (typically retrieved via :meth:`get_by_slug` or
-                :meth:`get_by_id` in the same session).
+            slug: URL slug of the post.
             data: Partial update payload.  Only non-``None`` / explicitly
                 set fields are applied.
 
         Returns:
-            The updated :class:`~app.models.post.Post` instance with
-            refreshed field values from the database.
-        """
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(post, key, value)
-        await db.commit()
-        await db.refresh(post)
-        return post
+            The updated row with the :class:`~app.schemas.post.PostResponse`
+            columns, or ``None`` if no post matches.
 
-    async def delete(self, db: AsyncSession, post: Post) -> None:
-        """Permanently delete a post from the database.
+        Raises:
+            IntegrityError: If the new slug is already taken.  The session
+                is rolled back first.
+        """
+        values = data.model_dump(exclude_unset=True)
+        if not values:
+            result = await db.execute(select(*_RESPONSE_COLUMNS).where(Post.slug == slug))
+            return result.one_or_none()
+        try:
+            result = await db.execute(
+                update(Post).where(Post.slug == slug).values(**values).returning(*_RESPONSE_COLUMNS)
+            )
+            row = result.one_or_none()
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise
+        return row
+
+    async def delete(self, db: AsyncSession, slug: str) -> bool:
+        """Permanently delete the post with the given slug.
+
+        Issues a single ``DELETE ... RETURNING id`` without loading the row.
 
         Args:
             db: Active async database session.
-            post: The ORM instance to delete.  Must already be attached
-                to ``db``.
+            slug: URL slug of the post to delete.
+
+        Returns:
+            ``True`` if a row was deleted, ``False`` if no post matches.
         """
-        await db.delete(post)
+        result = await db.execute(delete(Post).where(Post.slug == slug).returning(Post.id))
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
+        return deleted
 
     async def update_embedding(
         self,
@@ -176,8 +254,100 @@ class PostRepository:
             embedding: A list of floats of length
                 :data:`~app.core.constants.EMBEDDING_DIMENSIONS` (1 536).
         """
-        post = await self.get_by_id(db, post_id)
-        if not post:
+        await db.execute(update(Post).where(Post.id == post_id).values(content_embedding=embedding))
+        await db.commit()
+
+    # ------------------------------------------------------------------
+    # Bulk metadata generation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _metadata_filters(
+        *, after: uuid.UUID | None, missing_only: bool
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
+        if after is not None:
+            filters.append(Post.id > after)
+        if missing_only:
+            filters.append(
+                or_(
+                    Post.excerpt == "",
+                    func.coalesce(func.cardinality(Post.tags), 0) == 0,
+                    Post.reading_time_minutes.is_(None),
+                )
+            )
+        return filters
+
+    async def count_metadata_candidates(
+        self,
+        db: AsyncSession,
+        *,
+        after: uuid.UUID | None = None,
+        missing_only: bool = True,
+    ) -> int:
+        """Count the posts a metadata job would still visit.
+
+        Args:
+            db: Active async database session.
+            after: Only count rows whose ``id`` sorts after this value.
+            missing_only: Only count rows with an empty ``excerpt``, no ``tags``, or no
+                ``reading_time_minutes``.
+
+        Returns:
+            The number of matching rows.
+        """
+        query = (
+            select(func.count())
+            .select_from(Post)
+            .where(*self._metadata_filters(after=after, missing_only=missing_only))
+        )
+        return int((await db.execute(query)).scalar_one())
+
+    async def get_metadata_batch(
+        self,
+        db: AsyncSession,
+        *,
+        after: uuid.UUID | None,
+        limit: int,
+        missing_only: bool = True,
+    ) -> list[Row[Any]]:
+        """Return the next batch of posts for the metadata job.
+
+        Rows are keyset-paginated by ``id`` so a job can resume from the last
+        id it processed.  Only the text and metadata columns are selected —
+        never the embedding.
+
+        Args:
+            db: Active async database session.
+            after: Return rows whose ``id`` sorts after this value (``None``
+                starts from the beginning).
+            limit: Maximum number of rows to return.
+            missing_only: Only return rows with an empty ``excerpt``, no ``tags``, or no
+                ``reading_time_minutes``.
+
+        Returns:
+            Rows ordered by ``id`` ascending.
+        """
+        query = (
+            select(
+                Post.id, Post.title, Post.excerpt, Post.body, Post.tags, Post.reading_time_minutes
+            )
+            .where(*self._metadata_filters(after=after, missing_only=missing_only))
+            .order_by(Post.id)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return list(result.all())
+
+    async def bulk_update_metadata(self, db: AsyncSession, values: list[dict[str, Any]]) -> None:
+        """Write generated metadata for many posts in one executemany UPDATE.
+
+        Args:
+            db: Active async database session.
+            values: One dict per row, each containing ``id`` plus the
+                columns to overwrite.
+        """
+        if not values:
             return
-        post.content_embedding = embedding
+        await db.execute(update(Post), values)
         await db.commit()
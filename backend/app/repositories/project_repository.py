@@ -21,12 +21,21 @@ Typical usage::
 """
 
 import uuid
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, and_, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project import ProjectCreate, ProjectResponse, ProjectSummary, ProjectUpdate
+
+# Columns returned by writes: exactly what the API responds with.
+_RESPONSE_COLUMNS = tuple(getattr(Project, name) for name in ProjectResponse.model_fields)
+# Columns for list views: no long-form text, no embedding.
+_SUMMARY_COLUMNS = tuple(getattr(Project, name) for name in ProjectSummary.model_fields)
 
 
 class ProjectRepository:
@@ -47,12 +56,14 @@ class ProjectRepository:
         *,
         published_only: bool = True,
         featured_only: bool = False,
-    ) -> list[Project]:
+    ) -> list[Row[Any]]:
         """Return a list of projects, with optional published / featured filters.
 
         Results are ordered by ``order`` ascending (lower numbers appear
         first), then by ``created_at`` descending (newest within the same
-        order value appears first).
+        order value appears first), then by ``id`` so ties sort the same way
+        every time.  The filters are bare boolean columns so the planner can
+        match the partial indexes declared on the model.
 
         Args:
             db: Active async database session.
@@ -63,16 +74,65 @@ class ProjectRepository:
                 ``published_only``.
 
         Returns:
-            A (possibly empty) list of :class:`~app.models.project.Project`
-            ORM instances.
+            A (possibly empty) list of rows holding the
+            :class:`~app.schemas.project.ProjectResponse` columns.  Plain Core rows:
+            nothing is added to the session's identity map.
         """
-        query = select(Project).order_by(Project.order, Project.created_at.desc())
+        query = select(*_RESPONSE_COLUMNS).order_by(
+            Project.order, Project.created_at.desc(), Project.id.desc()
+        )
         if published_only:
-            query = query.where(Project.published.is_(True))
+            query = query.where(Project.published)
         if featured_only:
-            query = query.where(Project.featured.is_(True))
+            query = query.where(Project.featured)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        after: tuple[int, datetime, uuid.UUID] | None,
+        limit: int,
+        published_only: bool = True,
+    ) -> list[Row[Any]]:
+        """Return up to ``limit`` projects that sort after ``after``.
+
+        Keyset pagination in the :meth:`get_all` order.  The leading
+        ``order >= :order`` bound lets Postgres start the index scan at the
+        cursor, so every page costs the same however deep it is.
+
+        Args:
+            db: Active async database session.
+            after: ``(order, created_at, id)`` of the last project on the
+                previous page, or ``None`` for the first page.
+            limit: Maximum number of projects to return.
+            published_only: When ``True`` (default), only published
+                projects are returned.
+
+        Returns:
+            A (possibly empty) list of rows holding only the
+            :class:`~app.schemas.project.ProjectSummary` columns.
+        """
+        query = (
+            select(*_SUMMARY_COLUMNS)
+            .order_by(Project.order, Project.created_at.desc(), Project.id.desc())
+            .limit(limit)
+        )
+        if published_only:
+            query = query.where(Project.published)
+        if after is not None:
+            order, created_at, project_id = after
+            query = query.where(
+                Project.order >= order,
+                or_(
+                    Project.order > order,
+                    Project.created_at < created_at,
+                    and_(Project.created_at == created_at, Project.id < project_id),
+                ),
+            )
+        result = await db.execute(query)
+        return list(result.all())
 
     async def get_by_id(self, db: AsyncSession, project_id: uuid.UUID) -> Project | None:
         """Look up a project by its UUID primary key.
@@ -105,7 +165,7 @@ class ProjectRepository:
         result = await db.execute(select(Project).where(Project.slug == slug))
         return result.scalar_one_or_none()
 
-    async def get_featured(self, db: AsyncSession) -> list[Project]:
+    async def get_featured(self, db: AsyncSession) -> list[Row[Any]]:
         """Return all projects that are both published and featured.
 
         Convenience wrapper around :meth:`get_all` with both
@@ -115,13 +175,19 @@ class ProjectRepository:
             db: Active async database session.
 
         Returns:
-            A (possibly empty) list of featured, published
-            :class:`~app.models.project.Project` instances.
+            A (possibly empty) list of rows of featured, published
+            projects, as returned by :meth:`get_all`.
         """
         return await self.get_all(db, published_only=True, featured_only=True)
 
-    async def create(self, db: AsyncSession, data: ProjectCreate) -> Project:
-        """Insert a new project row into the database.
+    async def create(self, db: AsyncSession, data: ProjectCreate) -> Project | None:
+        """Insert a new project row unless its slug is already taken.
+
+        Issues a single ``INSERT ... ON CONFLICT (slug) DO NOTHING RETURNING``
+        followed by ``COMMIT``.  Checking the slug and inserting in one
+        statement means two concurrent creates with the same slug cannot both
+        succeed, and the returned row already carries the server-generated
+        fields, so no ``SELECT`` or ``db.refresh()`` is needed.
 
         The slug is expected to be present on ``data`` — the
         :class:`~app.schemas.project.ProjectCreate` validator auto-generates
@@ -134,49 +200,76 @@ class ProjectRepository:
         Returns:
             The newly inserted :class:`~app.models.project.Project` instance
             with all server-generated fields (``id``, ``created_at``,
-            ``updated_at``) populated via ``db.refresh()``.
+            ``updated_at``) populated, or ``None`` if a project with the same
+            slug already exists.
         """
-        project = Project(**data.model_dump())
-        db.add(project)
+        stmt = (
+            insert(Project)
+            .values(**data.model_dump())
+            .on_conflict_do_nothing(index_elements=[Project.slug])
+            .returning(Project)
+        )
+        project = (await db.scalars(stmt)).one_or_none()
         await db.commit()
-        await db.refresh(project)
         return project
 
-    async def update(self, db: AsyncSession, project: Project, data: ProjectUpdate) -> Project:
-        """Apply a partial update to an existing project.
+    async def update(self, db: AsyncSession, slug: str, data: ProjectUpdate) -> Row[Any] | None:
+        """Apply a partial update to the project with the given slug in one statement.
 
         Only fields that are explicitly set in ``data`` (i.e. present in
-        ``model_dump(exclude_unset=True)``) are written to the database.
-        Fields not included in the update payload are left unchanged.
+        ``model_dump(exclude_unset=True)``) are written, with a single
+        ``UPDATE ... RETURNING`` of the response columns — the row (and its
+        embedding) is never loaded.  An empty patch is answered with a
+        ``SELECT`` of the same columns instead.
 
         Args:
             db: Active async database session.
-            project: The ORM instance to update.  Must already be attached
-                to ``db`` (typically retrieved via :meth:`get_by_slug` or
-                :meth:`get_by_id` in the same session).
+            slug: URL slug of the project.
             data: Partial update payload.  Only non-``None`` / explicitly
                 set fields are applied.
 
         Returns:
-            The updated :class:`~app.models.project.Project` instance with
-            refreshed field values from the database.
-        """
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(project, key, value)
-        await db.commit()
-        await db.refresh(project)
-        return project
+            The updated row with the :class:`~app.schemas.project.ProjectResponse`
+            columns, or ``None`` if no project matches.
 
-    async def delete(self, db: AsyncSession, project: Project) -> None:
-        """Permanently delete a project from the database.
+        Raises:
+            IntegrityError: If the new slug is already taken.  The session
+                is rolled back first.
+        """
+        values = data.model_dump(exclude_unset=True)
+        if not values:
+            result = await db.execute(select(*_RESPONSE_COLUMNS).where(Project.slug == slug))
+            return result.one_or_none()
+        try:
+            result = await db.execute(
+                update(Project)
+                .where(Project.slug == slug)
+                .values(**values)
+                .returning(*_RESPONSE_COLUMNS)
+            )
+            row = result.one_or_none()
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise
+        return row
+
+    async def delete(self, db: AsyncSession, slug: str) -> bool:
+        """Permanently delete the project with the given slug.
+
+        Issues a single ``DELETE ... RETURNING id`` without loading the row.
 
         Args:
             db: Active async database session.
-            project: The ORM instance to delete.  Must already be attached
-                to ``db``.
+            slug: URL slug of the project to delete.
+
+        Returns:
+            ``True`` if a row was deleted, ``False`` if no project matches.
         """
-        await db.delete(project)
+        result = await db.execute(delete(Project).where(Project.slug == slug).returning(Project.id))
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
+        return deleted
 
     async def update_embedding(
         self,
@@ -197,8 +290,92 @@ class ProjectRepository:
             embedding: A list of floats of length
                 :data:`~app.core.constants.EMBEDDING_DIMENSIONS` (1 536).
         """
-        project = await self.get_by_id(db, project_id)
-        if not project:
+        await db.execute(
+            update(Project).where(Project.id == project_id).values(content_embedding=embedding)
+        )
+        await db.commit()
+
+    # ------------------------------------------------------------------
+    # Bulk metadata generation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _metadata_filters(
+        *, after: uuid.UUID | None, missing_only: bool
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
+        if after is not None:
+            filters.append(Project.id > after)
+        if missing_only:
+            filters.append(func.coalesce(func.cardinality(Project.tags), 0) == 0)
+        return filters
+
+    async def count_metadata_candidates(
+        self,
+        db: AsyncSession,
+        *,
+        after: uuid.UUID | None = None,
+        missing_only: bool = True,
+    ) -> int:
+        """Count the projects a metadata job would still visit.
+
+        Args:
+            db: Active async database session.
+            after: Only count rows whose ``id`` sorts after this value.
+            missing_only: Only count rows with no ``tags``.
+
+        Returns:
+            The number of matching rows.
+        """
+        query = (
+            select(func.count())
+            .select_from(Project)
+            .where(*self._metadata_filters(after=after, missing_only=missing_only))
+        )
+        return int((await db.execute(query)).scalar_one())
+
+    async def get_metadata_batch(
+        self,
+        db: AsyncSession,
+        *,
+        after: uuid.UUID | None,
+        limit: int,
+        missing_only: bool = True,
+    ) -> list[Row[Any]]:
+        """Return the next batch of projects for the metadata job.
+
+        Rows are keyset-paginated by ``id`` so a job can resume from the last
+        id it processed.  Only the text and metadata columns are selected —
+        never the embedding.
+
+        Args:
+            db: Active async database session.
+            after: Return rows whose ``id`` sorts after this value (``None``
+                starts from the beginning).
+            limit: Maximum number of rows to return.
+            missing_only: Only return rows with no ``tags``.
+
+        Returns:
+            Rows ordered by ``id`` ascending.
+        """
+        query = (
+            select(Project.id, Project.title, Project.description, Project.content, Project.tags)
+            .where(*self._metadata_filters(after=after, missing_only=missing_only))
+            .order_by(Project.id)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return list(result.all())
+
+    async def bulk_update_metadata(self, db: AsyncSession, values: list[dict[str, Any]]) -> None:
+        """Write generated metadata for many projects in one executemany UPDATE.
+
+        Args:
+            db: Active async database session.
+            values: One dict per row, each containing ``id`` plus the
+                columns to overwrite.
+        """
+        if not values:
             return
-        project.content_embedding = embedding
+        await db.execute(update(Project), values)
         await db.commit()
@@ -0,0 +1,73 @@
+"""Database access layer for shared rate-limit counters.
+
+This module provides the :class:`RateLimitRepository` which encapsulates the
+queries against :class:`~app.models.rate_limit.RateLimitCounter` used by the
+Postgres mode of :mod:`app.core.rate_limit`.
+"""
+
+from sqlalchemy import case, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rate_limit import RateLimitCounter
+
+
+class RateLimitRepository:
+    """Repository for sliding-window rate-limit counters."""
+
+    async def hit(self, db: AsyncSession, *, key: str, window: int) -> tuple[int, int]:
+        """Count one attempt for ``key`` in ``window`` and return both window counts.
+
+        A single upsert rolls the row forward when ``window`` has advanced:
+        the old current count becomes the previous count if the windows are
+        adjacent, otherwise both reset.
+
+        Args:
+            db: Active async database session.
+            key: Limiter key.
+            window: Index of the current fixed window.
+
+        Returns:
+            ``(current_count, previous_count)`` after counting this attempt.
+        """
+        table = RateLimitCounter.__table__
+        stmt = (
+            insert(RateLimitCounter)
+            .values(key=key, window=window, current_count=1, previous_count=0)
+            .on_conflict_do_update(
+                index_elements=[RateLimitCounter.key],
+                set_={
+                    "previous_count": case(
+                        (table.c.window == window, table.c.previous_count),
+                        (table.c.window == window - 1, table.c.current_count),
+                        else_=0,
+                    ),
+                    "current_count": case(
+                        (table.c.window == window, table.c.current_count + 1),
+                        else_=1,
+                    ),
+                    "window": window,
+                },
+            )
+            .returning(RateLimitCounter.current_count, RateLimitCounter.previous_count)
+        )
+        result = await db.execute(stmt)
+        current, previous = result.one()
+        await db.commit()
+        return int(current), int(previous)
+
+    async def sweep(self, db: AsyncSession, *, before_window: int) -> int:
+        """Delete counters whose current window is older than ``before_window``.
+
+        Args:
+            db: Active async database session.
+            before_window: Rows with ``window < before_window`` are removed.
+
+        Returns:
+            The number of deleted rows.
+        """
+        result = await db.execute(
+            delete(RateLimitCounter).where(RateLimitCounter.window < before_window)
+        )
+        await db.commit()
+        return int(getattr(result, "rowcount", 0) or 0)
@@ -0,0 +1,65 @@
+"""Database access layer for revoked tokens.
+
+This module provides the :class:`RevokedTokenRepository` which encapsulates
+all queries against :class:`~app.models.revoked_token.RevokedToken`.
+Revocations ``NOTIFY`` :data:`~app.core.constants.TOKEN_REVOKED_CHANNEL` in
+the same transaction so every worker updates its in-memory deny-list once
+the row is committed.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import TOKEN_REVOKED_CHANNEL
+from app.db.notify import notify
+from app.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    """Repository for the JWT deny-list."""
+
+    async def revoke(self, db: AsyncSession, *, jti: str, expires_at: datetime) -> None:
+        """Record ``jti`` as revoked until ``expires_at`` and notify every worker.
+
+        Revoking the same ``jti`` twice is a no-op.
+
+        Args:
+            db: Active async database session.
+            jti: The token's ``jti`` claim.
+            expires_at: The token's expiry.
+        """
+        await db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+        await notify(db, TOKEN_REVOKED_CHANNEL, f"{jti} {expires_at.timestamp()}")
+        await db.commit()
+
+    async def get_active(self, db: AsyncSession) -> list[tuple[str, datetime]]:
+        """Return every revocation whose token has not expired yet.
+
+        Args:
+            db: Active async database session.
+
+        Returns:
+            ``(jti, expires_at)`` pairs.
+        """
+        result = await db.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at).where(
+                RevokedToken.expires_at > datetime.now(UTC)
+            )
+        )
+        return [(jti, expires_at) for jti, expires_at in result.all()]
+
+    async def delete_expired(self, db: AsyncSession) -> None:
+        """Delete revocations whose tokens have expired.
+
+        Args:
+            db: Active async database session.
+        """
+        await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(UTC)))
+        await db.commit()
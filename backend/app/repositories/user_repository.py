@@ -2,6 +2,11 @@
 
 This module provides the :class:`UserRepository` which encapsulates all
 SQLAlchemy queries related to the :class:`~app.models.user.User` model.
+
+Writes that change who a user *is* to the auth layer (password, active flag)
+drop the user from :data:`~app.core.cache.principal_cache` in this worker
+and ``NOTIFY`` :data:`~app.core.constants.USER_INVALIDATED_CHANNEL` so every
+other worker does the same once the transaction commits.
 """
 
 import uuid
@@ -9,6 +14,9 @@ import uuid
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import principal_cache
+from app.core.constants import USER_INVALIDATED_CHANNEL
+from app.db.notify import notify
 from app.models.user import User
 
 
@@ -71,7 +79,7 @@ class UserRepository:
         return user
 
     async def update_password(self, db: AsyncSession, user: User, hashed_password: str) -> User:
-        """Update a user's password.
+        """Update a user's password and invalidate cached copies of the user.
 
         Args:
             db: Active async database session.
@@ -82,14 +90,18 @@ class UserRepository:
             The updated :class:`~app.models.user.User` instance.
         """
         user.hashed_password = hashed_password
+        user_id = user.id
+        await notify(db, USER_INVALIDATED_CHANNEL, str(user_id))
         await db.commit()
+        principal_cache.invalidate(user_id)
         await db.refresh(user)
         return user
 
     async def deactivate(self, db: AsyncSession, user: User) -> User:
         """Deactivate a user account.
 
-        Sets ``is_active=False`` on the user record.
+        Sets ``is_active=False`` on the user record and invalidates cached
+        copies of the user in every worker.
 
         Args:
             db: Active async database session.
@@ -99,6 +111,9 @@ class UserRepository:
             The updated :class:`~app.models.user.User` instance.
         """
         user.is_active = False
+        user_id = user.id
+        await notify(db, USER_INVALIDATED_CHANNEL, str(user_id))
         await db.commit()
+        principal_cache.invalidate(user_id)
         await db.refresh(user)
         return user
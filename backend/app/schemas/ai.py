@@ -1,4 +1,6 @@
+from datetime import datetime
 from enum import StrEnum
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -42,3 +44,50 @@ class ReEmbedResult(BaseModel):
 
     indexed: int
     errors: int
+
+
+# ---------------------------------------------------------------------------
+# Bulk metadata generation
+# ---------------------------------------------------------------------------
+
+
+class MetadataTarget(StrEnum):
+    POSTS = "posts"
+    PROJECTS = "projects"
+
+
+class MetadataJobState(StrEnum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class MetadataJobCursor(BaseModel):
+    """Last row id processed per table — pass back as ``resume_from`` to resume."""
+
+    posts: UUID | None = None
+    projects: UUID | None = None
+
+
+class MetadataJobRequest(BaseModel):
+    """Body of POST /ai/metadata-jobs."""
+
+    targets: list[MetadataTarget] = [MetadataTarget.POSTS, MetadataTarget.PROJECTS]
+    overwrite: bool = False
+    resume_from: MetadataJobCursor | None = None
+
+
+class MetadataJobStatus(BaseModel):
+    """Progress of a bulk metadata job returned by the /ai/metadata-jobs endpoints."""
+
+    id: UUID
+    state: MetadataJobState
+    total: int
+    processed: int
+    updated: int
+    errors: int
+    cursor: MetadataJobCursor
+    started_at: datetime
+    finished_at: datetime | None = None
+    detail: str | None = None
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class CheckResult(BaseModel):
+    """Latest result of one readiness check."""
+
+    ok: bool
+    required: bool
+    latency_ms: float | None = None
+    checked_at: datetime | None = None
+    error: str | None = None
+
+
+class ReadinessResponse(BaseModel):
+    """Payload of GET /health/ready.
+
+    ``status`` is ``ready`` when every check passed, ``degraded`` when only
+    optional checks (AI upstreams) failed, and ``unavailable`` when a
+    required check failed, is stale, or has not run yet.
+    """
+
+    status: Literal["ready", "degraded", "unavailable"]
+    checks: dict[str, CheckResult]
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class Page[T](BaseModel):
+    """One page of a keyset-paginated listing.
+
+    Pass ``next_cursor`` back as ``cursor`` to fetch the following page;
+    it is ``None`` on the last page.  Cursors are opaque — clients must not
+    build or parse them.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
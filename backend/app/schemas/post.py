@@ -8,7 +8,7 @@ import re
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ValidationInfo, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 
 class PostBase(BaseModel):
@@ -30,7 +30,8 @@ class PostCreate(PostBase):
     ``title`` field.
     """
 
-    slug: str | None = None
+    # validate_default: an omitted slug must still reach generate_slug.
+    slug: str | None = Field(default=None, validate_default=True)
 
     @field_validator("slug", mode="before")
     @classmethod
@@ -70,3 +71,24 @@ class PostResponse(PostBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class PostSummary(BaseModel):
+    """Schema for a post in list views (post cards).
+
+    :class:`PostResponse` without ``body``, which is only needed on the post
+    page and is by far the largest field.
+    """
+
+    id: UUID
+    slug: str
+    title: str
+    excerpt: str
+    tags: list[str] = []
+    cover_image_url: str | None = None
+    published: bool = False
+    reading_time_minutes: int | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -8,7 +8,7 @@ import re
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ValidationInfo, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 
 class ProjectBase(BaseModel):
@@ -34,7 +34,8 @@ class ProjectCreate(ProjectBase):
     ``title`` field.
     """
 
-    slug: str | None = None
+    # validate_default: an omitted slug must still reach generate_slug.
+    slug: str | None = Field(default=None, validate_default=True)
 
     @field_validator("slug", mode="before")
     @classmethod
@@ -78,3 +79,28 @@ class ProjectResponse(ProjectBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ProjectSummary(BaseModel):
+    """Schema for a project in list views (project cards).
+
+    :class:`ProjectResponse` without the long-form ``content``, which is only
+    rendered on the project page.
+    """
+
+    id: UUID
+    slug: str
+    title: str
+    description: str
+    tags: list[str] = []
+    tech_stack: list[str] = []
+    live_url: str | None = None
+    repo_url: str | None = None
+    image_url: str | None = None
+    featured: bool = False
+    published: bool = False
+    order: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,201 @@
+"""Admission control for the AI streaming endpoints.
+
+A single vLLM instance serves every writing-assistant stream.  Admitting
+more concurrent streams than the model can decode efficiently does not
+increase throughput — it only pushes every client's time-to-first-token up.
+:class:`AdmissionController` caps the number of streams in flight and parks
+the overflow in a bounded wait queue.
+
+Lanes
+-----
+Waiting requests are held in two FIFO lanes:
+
+``priority``
+    Superuser (CMS) requests.  Always granted before the normal lane.
+
+``normal``
+    Everyone else.
+
+Each lane is bounded by ``max_queue``.  A request arriving at a full lane is
+rejected immediately with :class:`~app.core.exceptions.RateLimitError`
+(HTTP 429 + ``Retry-After``), so the decision is made *before* the SSE
+response starts.
+
+Slot hand-off
+-------------
+When a stream finishes, its slot is handed directly to the next waiter
+instead of being returned to the pool, so a newly arriving request can never
+overtake a queued one.
+
+Usage::
+
+    admission = AdmissionController(max_in_flight=4, max_queue=16, retry_after=5)
+
+    ticket = admission.enqueue(priority=user_is_superuser)  # may raise 429
+    try:
+        while not ticket.granted:
+            await admission.wait(ticket, timeout=1.0)
+        ...  # stream
+    finally:
+        admission.release(ticket)
+"""
+
+import asyncio
+from collections import deque
+from typing import Any
+
+from app.core.exceptions import RateLimitError
+
+
+class AdmissionTicket:
+    """A request's place in the admission queue.
+
+    Attributes:
+        priority: ``True`` when the ticket waits in the priority lane.
+        granted: ``True`` once the ticket holds an in-flight slot.
+        released: ``True`` once :meth:`AdmissionController.release` has run
+            for this ticket.  Releasing is idempotent.
+    """
+
+    __slots__ = ("_future", "granted", "priority", "released")
+
+    def __init__(self, *, priority: bool, granted: bool) -> None:
+        self.priority = priority
+        self.granted = granted
+        self.released = False
+        self._future: asyncio.Future[None] | None = None
+
+
+class AdmissionController:
+    """Bounded in-flight limit with a two-lane wait queue.
+
+    The controller is not thread-safe; it is meant to be used from a single
+    event loop (one instance per uvicorn worker).
+
+    Args:
+        max_in_flight: Maximum number of concurrently granted tickets.
+        max_queue: Maximum number of waiting tickets per lane.
+        retry_after: ``Retry-After`` hint (seconds) attached to the
+            :class:`~app.core.exceptions.RateLimitError` raised when a lane
+            is full.
+    """
+
+    def __init__(self, *, max_in_flight: int, max_queue: int, retry_after: int) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._in_flight = 0
+        self._priority: deque[AdmissionTicket] = deque()
+        self._normal: deque[AdmissionTicket] = deque()
+        self._changed = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of tickets currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of tickets waiting across both lanes."""
+        return len(self._priority) + len(self._normal)
+
+    def enqueue(self, *, priority: bool = False) -> AdmissionTicket:
+        """Request a slot, either granting it immediately or queueing.
+
+        Args:
+            priority: Place the ticket in the priority lane.
+
+        Returns:
+            An :class:`AdmissionTicket`.  Check ``ticket.granted`` — when
+            ``False`` the caller must :meth:`wait` until it becomes ``True``.
+
+        Raises:
+            RateLimitError: If the ticket's lane already holds
+                ``max_queue`` waiters.
+        """
+        if self._in_flight < self.max_in_flight and not self.queued:
+            self._in_flight += 1
+            return AdmissionTicket(priority=priority, granted=True)
+
+        lane = self._priority if priority else self._normal
+        if len(lane) >= self.max_queue:
+            raise RateLimitError(
+                "The AI writing assistant is at capacity — please retry shortly",
+                retry_after=self.retry_after,
+            )
+
+        ticket = AdmissionTicket(priority=priority, granted=False)
+        ticket._future = asyncio.get_running_loop().create_future()
+        lane.append(ticket)
+        return ticket
+
+    def position(self, ticket: AdmissionTicket) -> int:
+        """Return the 1-based queue position of ``ticket`` (``0`` once granted).
+
+        Priority tickets are counted ahead of every normal ticket.
+        """
+        if ticket.granted or ticket.released:
+            return 0
+        if ticket.priority:
+            return self._priority.index(ticket) + 1
+        return len(self._priority) + self._normal.index(ticket) + 1
+
+    async def wait(self, ticket: AdmissionTicket, *, timeout: float) -> None:
+        """Wait until ``ticket`` is granted, the queue moves, or ``timeout`` elapses.
+
+        Returns early whenever any queue position changes so the caller can
+        report the new :meth:`position` to the client.
+
+        Args:
+            ticket: A ticket returned by :meth:`enqueue`.
+            timeout: Maximum number of seconds to wait.
+        """
+        if ticket.granted or ticket._future is None:
+            return
+        changed = asyncio.ensure_future(self._changed.wait())
+        waiters: set[asyncio.Future[Any]] = {asyncio.shield(ticket._future), changed}
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            changed.cancel()
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Give up a ticket — either its in-flight slot or its queue position.
+
+        A freed slot is handed straight to the next waiter (priority lane
+        first).  Calling this more than once for the same ticket is a no-op.
+        """
+        if ticket.released:
+            return
+        ticket.released = True
+
+        if not ticket.granted:
+            lane = self._priority if ticket.priority else self._normal
+            lane.remove(ticket)
+            self._notify()
+            return
+
+        next_ticket = self._pop_next()
+        if next_ticket is None:
+            self._in_flight -= 1
+        else:
+            next_ticket.granted = True
+            if next_ticket._future is not None and not next_ticket._future.done():
+                next_ticket._future.set_result(None)
+        self._notify()
+
+    def _pop_next(self) -> AdmissionTicket | None:
+        if self._priority:
+            return self._priority.popleft()
+        if self._normal:
+            return self._normal.popleft()
+        return None
+
+    def _notify(self) -> None:
+        # Wake every waiter once, then start a fresh generation.
+        self._changed.set()
+        self._changed = asyncio.Event()
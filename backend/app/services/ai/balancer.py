@@ -0,0 +1,299 @@
+"""Client-side load balancing across several OpenAI-compatible upstreams.
+
+:class:`LoadBalancedTransport` is an ``httpx`` transport that plugs into
+``AsyncOpenAI(http_client=...)``.  The SDK keeps building requests against a
+single virtual base URL; the transport rewrites each request to one of the
+configured upstreams just before it is sent, so every OpenAI-compatible
+server (vLLM, infinity-emb, or a local stand-in) works unchanged.
+
+Routing
+-------
+Each request goes to the healthy upstream with the **fewest outstanding
+requests**.  A request stays outstanding until its response body is fully
+read or closed, so a long SSE stream keeps counting against its node for its
+whole duration.  Ties are broken round-robin.
+
+Passive health checks
+---------------------
+Connection errors and ``5xx`` responses count as failures.
+``max_failures`` consecutive failures eject the upstream from rotation.
+Requests that fail to *connect* are retried immediately on the next
+candidate — nothing has been sent yet, so this is always safe.
+
+Re-probing
+----------
+While running, :meth:`LoadBalancedTransport.start` re-probes every
+``probe_interval`` seconds with ``GET {base_url}/models``.  A successful
+probe brings an ejected upstream back.  If every upstream is ejected,
+requests are still routed to all of them rather than failing outright.
+
+Example::
+
+    transport = LoadBalancedTransport(
+        "vllm-chat",
+        ["http://vllm-a:8000/v1", "http://vllm-b:8000/v1"],
+        max_failures=3,
+        probe_interval=10,
+    )
+    client = AsyncOpenAI(
+        base_url=VIRTUAL_BASE_URL,
+        api_key="...",
+        http_client=httpx.AsyncClient(transport=transport, timeout=AI_HTTP_TIMEOUT),
+    )
+"""
+
+import asyncio
+import contextlib
+import functools
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+
+import httpx
+
+from app.core.constants import AI_UPSTREAM_PROBE_TIMEOUT_SECONDS
+from app.core.metrics import (
+    AI_UPSTREAM_EJECTIONS,
+    AI_UPSTREAM_HEALTHY,
+    AI_UPSTREAM_OUTSTANDING,
+    AI_UPSTREAM_REQUESTS,
+    AI_UPSTREAM_RESPONSE_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+VIRTUAL_BASE_URL = "http://ai-upstream"
+"""Base URL handed to the ``AsyncOpenAI`` client; replaced per request by the transport."""
+
+AI_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+"""Client timeout matching the ``openai`` SDK default (long reads for streams)."""
+
+
+class Upstream:
+    """Runtime state of a single upstream server.
+
+    Attributes:
+        base_url: Upstream base URL including the API prefix (e.g. ``/v1``).
+        outstanding: Requests sent to this upstream whose response has not
+            been closed yet.
+        failures: Consecutive failed requests.
+        healthy: ``False`` while the upstream is ejected.
+        probe_seconds: Duration of the last health probe, ``None`` until the
+            first probe.
+        probed_at: Unix time of the last health probe.
+    """
+
+    __slots__ = ("base_url", "failures", "healthy", "outstanding", "probe_seconds", "probed_at")
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.outstanding = 0
+        self.failures = 0
+        self.healthy = True
+        self.probe_seconds: float | None = None
+        self.probed_at: float | None = None
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body wrapper that runs ``on_close`` exactly once."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class LoadBalancedTransport(httpx.AsyncBaseTransport):
+    """Least-outstanding-requests transport with passive ejection and re-probing.
+
+    Args:
+        name: Service label used in logs and metrics (e.g. ``"vllm-chat"``).
+        base_urls: Upstream base URLs, each including the API prefix.
+        max_failures: Consecutive failures after which an upstream is ejected.
+        probe_interval: Seconds between health probes of every upstream.
+        transport: Inner transport that performs the actual I/O.  Defaults
+            to an :class:`httpx.AsyncHTTPTransport` with the same connection
+            limits the ``openai`` SDK uses.
+
+    Raises:
+        ValueError: If ``base_urls`` is empty.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_urls: Sequence[str],
+        *,
+        max_failures: int,
+        probe_interval: float,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if not base_urls:
+            raise ValueError(f"No upstream URLs configured for '{name}'")
+        self.name = name
+        self.upstreams = [Upstream(url) for url in base_urls]
+        self.max_failures = max_failures
+        self.probe_interval = probe_interval
+        self._transport = transport or httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+        )
+        self._rotation = itertools.count()
+        self._probe_task: asyncio.Task[None] | None = None
+        for upstream in self.upstreams:
+            self._export(upstream)
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def candidates(self) -> list[Upstream]:
+        """Return upstreams in the order a new request should try them.
+
+        Healthy upstreams come first, sorted by outstanding requests with a
+        rotating tie-break.  Ejected upstreams follow as a last resort.
+        """
+        offset = next(self._rotation)
+        size = len(self.upstreams)
+        rotated = [self.upstreams[(offset + i) % size] for i in range(size)]
+        return sorted(rotated, key=lambda u: (not u.healthy, u.outstanding))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode("ascii")
+        candidates = self.candidates()
+        for attempt, upstream in enumerate(candidates, start=1):
+            url = httpx.URL(upstream.base_url + path)
+            request.url = url
+            request.headers["Host"] = url.netloc.decode("ascii")
+
+            service, base_url = self.name, upstream.base_url
+            upstream.outstanding += 1
+            self._export(upstream)
+            started = time.perf_counter()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.ConnectError:
+                AI_UPSTREAM_REQUESTS.inc(service=service, upstream=base_url, status="error")
+                self._finish(upstream, failed=True)
+                if attempt == len(candidates):
+                    raise
+                continue
+            except httpx.TransportError:
+                AI_UPSTREAM_REQUESTS.inc(service=service, upstream=base_url, status="error")
+                self._finish(upstream, failed=True)
+                raise
+            except BaseException:
+                # Cancellation says nothing about the upstream's health.
+                upstream.outstanding -= 1
+                self._export(upstream)
+                raise
+
+            AI_UPSTREAM_RESPONSE_SECONDS.observe(
+                time.perf_counter() - started, service=service, upstream=base_url
+            )
+            AI_UPSTREAM_REQUESTS.inc(
+                service=service, upstream=base_url, status=f"{response.status_code // 100}xx"
+            )
+            assert isinstance(response.stream, httpx.AsyncByteStream)
+            on_close = functools.partial(self._finish, upstream, failed=response.status_code >= 500)
+            return httpx.Response(
+                status_code=response.status_code,
+                headers=response.headers,
+                stream=_TrackedStream(response.stream, on_close),
+                extensions=response.extensions,
+            )
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _finish(self, upstream: Upstream, *, failed: bool) -> None:
+        upstream.outstanding -= 1
+        if failed:
+            self._mark_failure(upstream)
+        else:
+            self._mark_success(upstream)
+        self._export(upstream)
+
+    def _mark_failure(self, upstream: Upstream) -> None:
+        upstream.failures += 1
+        if upstream.healthy and upstream.failures >= self.max_failures:
+            upstream.healthy = False
+            AI_UPSTREAM_EJECTIONS.inc(service=self.name, upstream=upstream.base_url)
+            logger.warning(
+                "Ejecting %s upstream %s after %d consecutive failures",
+                self.name,
+                upstream.base_url,
+                upstream.failures,
+            )
+
+    def _mark_success(self, upstream: Upstream) -> None:
+        upstream.failures = 0
+        if not upstream.healthy:
+            upstream.healthy = True
+            logger.info("Restoring %s upstream %s", self.name, upstream.base_url)
+
+    def _export(self, upstream: Upstream) -> None:
+        labels = {"service": self.name, "upstream": upstream.base_url}
+        AI_UPSTREAM_OUTSTANDING.set(upstream.outstanding, **labels)
+        AI_UPSTREAM_HEALTHY.set(1 if upstream.healthy else 0, **labels)
+
+    # ------------------------------------------------------------------
+    # Active re-probing
+    # ------------------------------------------------------------------
+
+    async def probe(self, upstream: Upstream) -> bool:
+        """Send ``GET {base_url}/models`` and update the upstream's health.
+
+        The probe's duration is kept on the upstream for ``/health/ready``.
+
+        Returns:
+            ``True`` when the upstream answered with a non-5xx status.
+        """
+        request = httpx.Request("GET", upstream.base_url + "/models")
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(AI_UPSTREAM_PROBE_TIMEOUT_SECONDS):
+                response = await self._transport.handle_async_request(request)
+                await response.aclose()
+            ok = response.status_code < 500
+        except (httpx.HTTPError, TimeoutError):
+            ok = False
+        upstream.probe_seconds = time.perf_counter() - started
+        upstream.probed_at = time.time()
+
+        if ok:
+            self._mark_success(upstream)
+        elif upstream.healthy:
+            # An explicit probe failure ejects straight away.
+            upstream.failures = max(upstream.failures, self.max_failures - 1)
+            self._mark_failure(upstream)
+        self._export(upstream)
+        return ok
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            await asyncio.gather(*(self.probe(upstream) for upstream in self.upstreams))
+
+    def start(self) -> None:
+        """Start the periodic re-probe task on the running event loop."""
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def aclose(self) -> None:
+        """Stop re-probing and close the inner transport."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._probe_task
+            self._probe_task = None
+        await self._transport.aclose()
@@ -18,6 +18,15 @@ Both containers expose an OpenAI-compatible ``/v1`` API, so the same
 ``openai`` SDK works for both — only the ``base_url`` and ``model``
 differ.
 
+Load balancing
+--------------
+Each client sends its requests through a
+:class:`~app.services.ai.balancer.LoadBalancedTransport`, which routes them
+to the least-busy healthy replica in ``settings.chat_upstreams`` /
+``settings.embed_upstreams``.  With a single configured URL this behaves
+exactly like a direct connection.  :func:`start_upstream_probes` and
+:func:`stop_upstream_probes` are called from the application lifespan.
+
 Singleton pattern
 -----------------
 Each getter lazily constructs the client on first call and caches it for
@@ -25,9 +34,29 @@ the lifetime of the process.  Call the corresponding ``reset_*`` helper in
 tests to force re-initialisation with different settings.
 """
 
+import httpx
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.services.ai.balancer import AI_HTTP_TIMEOUT, VIRTUAL_BASE_URL, LoadBalancedTransport
+
+
+def _balanced_client(name: str, base_urls: list[str]) -> AsyncOpenAI:
+    transport = LoadBalancedTransport(
+        name,
+        base_urls,
+        max_failures=settings.AI_UPSTREAM_MAX_FAILURES,
+        probe_interval=settings.AI_UPSTREAM_PROBE_INTERVAL,
+    )
+    _transports[name] = transport
+    return AsyncOpenAI(
+        api_key=settings.LLM_API_KEY,
+        base_url=VIRTUAL_BASE_URL,
+        http_client=httpx.AsyncClient(transport=transport, timeout=AI_HTTP_TIMEOUT),
+    )
+
+
+_transports: dict[str, LoadBalancedTransport] = {}
 
 # ---------------------------------------------------------------------------
 # Chat client — vLLM (Qwen2.5-7B-Instruct-AWQ)
@@ -39,7 +68,7 @@ _chat_client: AsyncOpenAI | None = None
 def get_chat_client() -> AsyncOpenAI:
     """Return the singleton chat client pointed at the vLLM chat container.
 
-    Lazily constructed on first call using ``settings.VLLM_CHAT_BASE_URL``
+    Lazily constructed on first call using ``settings.chat_upstreams``
     and ``settings.LLM_API_KEY``.
 
     Returns:
@@ -48,10 +77,7 @@ def get_chat_client() -> AsyncOpenAI:
     """
     global _chat_client
     if _chat_client is None:
-        _chat_client = AsyncOpenAI(
-            api_key=settings.LLM_API_KEY,
-            base_url=settings.VLLM_CHAT_BASE_URL,
-        )
+        _chat_client = _balanced_client("vllm-chat", settings.chat_upstreams)
     return _chat_client
 
 
@@ -75,7 +101,7 @@ _embed_client: AsyncOpenAI | None = None
 def get_embed_client() -> AsyncOpenAI:
     """Return the singleton embed client pointed at the infinity-emb container.
 
-    Lazily constructed on first call using ``settings.VLLM_EMBED_BASE_URL``
+    Lazily constructed on first call using ``settings.embed_upstreams``
     and ``settings.LLM_API_KEY``.
 
     Returns:
@@ -84,10 +110,7 @@ def get_embed_client() -> AsyncOpenAI:
     """
     global _embed_client
     if _embed_client is None:
-        _embed_client = AsyncOpenAI(
-            api_key=settings.LLM_API_KEY,
-            base_url=settings.VLLM_EMBED_BASE_URL,
-        )
+        _embed_client = _balanced_client("infinity", settings.embed_upstreams)
     return _embed_client
 
 
@@ -99,3 +122,27 @@ def reset_embed_client() -> None:
     """
     global _embed_client
     _embed_client = None
+
+
+# ---------------------------------------------------------------------------
+# Upstream health probes
+# ---------------------------------------------------------------------------
+
+
+def upstream_transports() -> list[LoadBalancedTransport]:
+    """Return the load-balancing transports of both clients, constructing them if needed."""
+    get_chat_client()
+    get_embed_client()
+    return list(_transports.values())
+
+
+def start_upstream_probes() -> None:
+    """Start periodic health probes for both clients' upstreams."""
+    for transport in upstream_transports():
+        transport.start()
+
+
+async def stop_upstream_probes() -> None:
+    """Stop the health probes started by :func:`start_upstream_probes`."""
+    for transport in _transports.values():
+        await transport.aclose()
@@ -0,0 +1,323 @@
+"""Bulk AI metadata generation for the back catalogue.
+
+Provides :class:`MetadataService`, which runs a superuser-triggered
+background job over every post and project and fills in:
+
+- **Posts** — ``excerpt`` (via :data:`~app.services.ai.prompts.SUMMARISE_SYSTEM_PROMPT`),
+  ``reading_time_minutes`` (word count, no LLM call) and ``tags``.
+- **Projects** — ``tags``.
+
+Throughput
+----------
+``/ai/write`` serves one prompt per request.  The job instead keeps up to
+``AI_METADATA_CONCURRENCY`` completions in flight at once so vLLM's
+continuous batching stays saturated, and writes each batch back with a
+single executemany UPDATE.
+
+Progress and resume
+-------------------
+Rows are visited in ``id`` order, :data:`~app.core.constants.METADATA_JOB_BATCH_SIZE`
+at a time.  After each batch is committed the job's ``cursor`` advances to
+the last id written.  Passing a status' ``cursor`` back as ``resume_from``
+continues where a cancelled, failed or lost (e.g. worker restart) job left
+off.  With ``overwrite=False`` rows that already have metadata are skipped,
+so re-running a job is idempotent.
+
+Jobs are tracked in process memory; poll the worker that accepted the job.
+"""
+
+import asyncio
+import logging
+import re
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.constants import (
+    METADATA_EXCERPT_MAX_TOKENS,
+    METADATA_JOB_BATCH_SIZE,
+    METADATA_MAX_TAGS,
+    METADATA_TAGS_MAX_TOKENS,
+    READING_WORDS_PER_MINUTE,
+)
+from app.core.exceptions import ConflictError, JobNotFoundError
+from app.repositories.post_repository import PostRepository
+from app.repositories.project_repository import ProjectRepository
+from app.schemas.ai import (
+    MetadataJobCursor,
+    MetadataJobRequest,
+    MetadataJobState,
+    MetadataJobStatus,
+    MetadataTarget,
+)
+from app.services.ai.prompts import SUMMARISE_SYSTEM_PROMPT, TAG_SUGGEST_SYSTEM_PROMPT
+from app.services.ai.writing_service import WritingService
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_reading_time(text: str | None) -> int:
+    """Estimate reading time in whole minutes (minimum 1)."""
+    words = len((text or "").split())
+    return max(1, round(words / READING_WORDS_PER_MINUTE))
+
+
+def parse_tags(raw: str) -> list[str]:
+    """Normalise a comma-separated LLM answer into at most ``METADATA_MAX_TAGS`` slugs."""
+    tags: list[str] = []
+    for part in raw.replace("\n", ",").split(","):
+        tag = re.sub(r"[^a-z0-9-]+", "-", part.strip().strip("#").lower()).strip("-")
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags[:METADATA_MAX_TAGS]
+
+
+class _Job:
+    """Mutable state of a running metadata job."""
+
+    def __init__(self, request: MetadataJobRequest) -> None:
+        self.id = uuid.uuid4()
+        self.request = request
+        self.state = MetadataJobState.RUNNING
+        self.total = 0
+        self.processed = 0
+        self.updated = 0
+        self.errors = 0
+        self.cursor = request.resume_from or MetadataJobCursor()
+        self.started_at = datetime.now(UTC)
+        self.finished_at: datetime | None = None
+        self.detail: str | None = None
+        self.task: asyncio.Task[None] | None = None
+
+    def status(self) -> MetadataJobStatus:
+        return MetadataJobStatus(
+            id=self.id,
+            state=self.state,
+            total=self.total,
+            processed=self.processed,
+            updated=self.updated,
+            errors=self.errors,
+            cursor=self.cursor.model_copy(),
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            detail=self.detail,
+        )
+
+
+class MetadataService:
+    """Starts, tracks and cancels bulk metadata jobs.
+
+    Only one job runs per process at a time — a second job would compete
+    for the same vLLM capacity and the same rows.
+
+    Args:
+        writer: Writing service used for the non-streamed completions.
+        session_factory: Factory for the job's own database sessions (the
+            request-scoped session closes before the job finishes).
+        posts: Post repository.
+        projects: Project repository.
+    """
+
+    def __init__(
+        self,
+        writer: WritingService,
+        session_factory: async_sessionmaker[AsyncSession],
+        posts: PostRepository | None = None,
+        projects: ProjectRepository | None = None,
+    ) -> None:
+        self.writer = writer
+        self.session_factory = session_factory
+        self.posts = posts or PostRepository()
+        self.projects = projects or ProjectRepository()
+        self._jobs: dict[uuid.UUID, _Job] = {}
+
+    # ------------------------------------------------------------------
+    # Job control
+    # ------------------------------------------------------------------
+
+    def start(self, request: MetadataJobRequest) -> MetadataJobStatus:
+        """Start a job in the background and return its initial status.
+
+        Raises:
+            ConflictError: If another job is still running in this process.
+        """
+        if any(job.state is MetadataJobState.RUNNING for job in self._jobs.values()):
+            raise ConflictError("A metadata job is already running")
+        job = _Job(request)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job))
+        return job.status()
+
+    def get(self, job_id: uuid.UUID) -> MetadataJobStatus:
+        """Return the status of a job.
+
+        Raises:
+            JobNotFoundError: If no job with that id exists in this process.
+        """
+        return self._get_job(job_id).status()
+
+    async def cancel(self, job_id: uuid.UUID) -> MetadataJobStatus:
+        """Cancel a running job and wait for it to stop.  Already committed batches are kept.
+
+        Returns:
+            The job's final status — ``cancelled``, or ``completed`` /
+            ``failed`` if it ended first — with the ``cursor`` to resume from.
+
+        Raises:
+            JobNotFoundError: If no job with that id exists in this process.
+        """
+        job = self._get_job(job_id)
+        if job.state is MetadataJobState.RUNNING and job.task is not None:
+            job.task.cancel()
+            # ``wait`` rather than ``await``: if this request is cancelled,
+            # the job task is not cancelled a second time mid-cleanup.
+            await asyncio.wait({job.task})
+        return job.status()
+
+    def _get_job(self, job_id: uuid.UUID) -> _Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Job '{job_id}' not found")
+        return job
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def _run(self, job: _Job) -> None:
+        overwrite = job.request.overwrite
+        missing_only = not overwrite
+        semaphore = asyncio.Semaphore(settings.AI_METADATA_CONCURRENCY)
+        try:
+            async with self.session_factory() as db:
+                if MetadataTarget.POSTS in job.request.targets:
+                    job.total += await self.posts.count_metadata_candidates(
+                        db, after=job.cursor.posts, missing_only=missing_only
+                    )
+                if MetadataTarget.PROJECTS in job.request.targets:
+                    job.total += await self.projects.count_metadata_candidates(
+                        db, after=job.cursor.projects, missing_only=missing_only
+                    )
+
+                if MetadataTarget.POSTS in job.request.targets:
+                    await self._walk(
+                        job,
+                        db,
+                        target=MetadataTarget.POSTS,
+                        fetch=self.posts.get_metadata_batch,
+                        generate=lambda row: self._post_metadata(
+                            row, semaphore, overwrite=overwrite
+                        ),
+                        write=self.posts.bulk_update_metadata,
+                    )
+                if MetadataTarget.PROJECTS in job.request.targets:
+                    await self._walk(
+                        job,
+                        db,
+                        target=MetadataTarget.PROJECTS,
+                        fetch=self.projects.get_metadata_batch,
+                        generate=lambda row: self._project_metadata(
+                            row, semaphore, overwrite=overwrite
+                        ),
+                        write=self.projects.bulk_update_metadata,
+                    )
+            job.state = MetadataJobState.COMPLETED
+        except asyncio.CancelledError:
+            job.state = MetadataJobState.CANCELLED
+        except Exception as exc:
+            logger.exception("Metadata job %s failed", job.id)
+            job.state = MetadataJobState.FAILED
+            job.detail = str(exc)
+        finally:
+            job.finished_at = datetime.now(UTC)
+            logger.info(
+                "Metadata job %s %s: processed=%d updated=%d errors=%d",
+                job.id,
+                job.state.value,
+                job.processed,
+                job.updated,
+                job.errors,
+            )
+
+    async def _walk(
+        self,
+        job: _Job,
+        db: AsyncSession,
+        *,
+        target: MetadataTarget,
+        fetch: Callable[..., Awaitable[list[Row[Any]]]],
+        generate: Callable[[Row[Any]], Awaitable[dict[str, Any] | None]],
+        write: Callable[[AsyncSession, list[dict[str, Any]]], Awaitable[None]],
+    ) -> None:
+        """Process one table batch by batch, advancing the job cursor after each commit."""
+        while True:
+            rows = await fetch(
+                db,
+                after=getattr(job.cursor, target.value),
+                limit=METADATA_JOB_BATCH_SIZE,
+                missing_only=not job.request.overwrite,
+            )
+            if not rows:
+                return
+
+            results = await asyncio.gather(*(generate(row) for row in rows), return_exceptions=True)
+            values: list[dict[str, Any]] = []
+            for row, result in zip(rows, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "Metadata generation failed for %s/%s: %s", target, row.id, result
+                    )
+                    job.errors += 1
+                elif result:
+                    values.append(result)
+
+            await write(db, values)
+            job.processed += len(rows)
+            job.updated += len(values)
+            setattr(job.cursor, target.value, rows[-1].id)
+
+    async def _post_metadata(
+        self, row: Row[Any], semaphore: asyncio.Semaphore, *, overwrite: bool
+    ) -> dict[str, Any] | None:
+        values: dict[str, Any] = {}
+        source = row.body or row.excerpt or row.title
+
+        if (overwrite or not row.excerpt) and row.body:
+            async with semaphore:
+                values["excerpt"] = await self.writer.complete(
+                    system_prompt=SUMMARISE_SYSTEM_PROMPT,
+                    prompt=row.body,
+                    max_tokens=METADATA_EXCERPT_MAX_TOKENS,
+                )
+        if overwrite or row.reading_time_minutes is None:
+            values["reading_time_minutes"] = estimate_reading_time(row.body)
+        if overwrite or not row.tags:
+            async with semaphore:
+                answer = await self.writer.complete(
+                    system_prompt=TAG_SUGGEST_SYSTEM_PROMPT,
+                    prompt=f"{row.title}\n\n{source}",
+                    max_tokens=METADATA_TAGS_MAX_TOKENS,
+                )
+            if tags := parse_tags(answer):
+                values["tags"] = tags
+
+        return {"id": row.id, **values} if values else None
+
+    async def _project_metadata(
+        self, row: Row[Any], semaphore: asyncio.Semaphore, *, overwrite: bool
+    ) -> dict[str, Any] | None:
+        if row.tags and not overwrite:
+            return None
+        async with semaphore:
+            answer = await self.writer.complete(
+                system_prompt=TAG_SUGGEST_SYSTEM_PROMPT,
+                prompt=f"{row.title}\n\n{row.description}\n\n{row.content or ''}",
+                max_tokens=METADATA_TAGS_MAX_TOKENS,
+            )
+        tags = parse_tags(answer)
+        return {"id": row.id, "tags": tags} if tags else None
@@ -9,3 +9,6 @@ Return only the summary."""
 
 RAG_SYSTEM_PROMPT = """Answer the user's question using only the retrieved portfolio context.
 If context is insufficient, say so clearly."""
+
+TAG_SUGGEST_SYSTEM_PROMPT = """Suggest up to 5 short topic tags for the provided developer portfolio content.
+Return only the tags as a comma-separated list of lowercase words or hyphenated phrases."""
@@ -28,15 +28,21 @@ Usage example::
 """
 
 import logging
+import time
+from collections.abc import Awaitable
 
 from openai import AsyncOpenAI, OpenAIError
+from openai.types import CreateEmbeddingResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.constants import EMBEDDING_DIMENSIONS, RAG_TOP_K, VLLM_EMBED_MODEL
 from app.core.exceptions import AIServiceError
+from app.core.metrics import AI_CALL_ERRORS, AI_EMBED_BATCH_SIZE, AI_EMBED_SECONDS
+from app.core.timing import timed
 from app.schemas.ai import EmbedStatus, EmbedStatusItem, ReEmbedResult
+from app.services.ai.hedging import Hedger
 
 logger = logging.getLogger(__name__)
 
@@ -50,10 +56,16 @@ class RagService:
     Args:
         client: A configured :class:`openai.AsyncOpenAI` instance pointed
             at the infinity-emb ``/v1`` endpoint.
+        hedger: Optional :class:`~app.services.ai.hedging.Hedger` for
+            embedding calls.  Defaults to one built from
+            ``settings.AI_EMBED_HEDGE_*`` when hedging is enabled.
     """
 
-    def __init__(self, client: AsyncOpenAI) -> None:
+    def __init__(self, client: AsyncOpenAI, hedger: Hedger | None = None) -> None:
         self.client = client
+        if hedger is None and settings.AI_EMBED_HEDGE_ENABLED:
+            hedger = Hedger("embed", percentile=settings.AI_EMBED_HEDGE_PERCENTILE)
+        self.hedger = hedger
 
     # ------------------------------------------------------------------
     # Embedding
@@ -68,6 +80,13 @@ class RagService:
         and is normalised to unit length, making it suitable for cosine
         similarity queries with pgvector's ``<=>`` operator.
 
+        Call latency and batch size are recorded in
+        :data:`~app.core.metrics.AI_EMBED_SECONDS` and
+        :data:`~app.core.metrics.AI_EMBED_BATCH_SIZE`, and added to the
+        request's ``embed`` timing (``Server-Timing``).  When a hedger is
+        configured, a slow call is raced against a duplicate request and
+        the first answer wins.
+
         Args:
             text: The input string to embed.  Long texts are automatically
                 truncated by the model to its maximum token length (512 for
@@ -83,17 +102,27 @@ class RagService:
         if not text.strip():
             return [0.0] * EMBEDDING_DIMENSIONS
 
-        try:
-            response = await self.client.embeddings.create(
+        def call() -> Awaitable[CreateEmbeddingResponse]:
+            return self.client.embeddings.create(
                 model=settings.VLLM_EMBED_MODEL,
                 input=text.strip(),
             )
-            return response.data[0].embedding
+
+        started = time.perf_counter()
+        try:
+            with timed("embed"):
+                response = await (self.hedger.run(call) if self.hedger else call())
         except OpenAIError as exc:
+            AI_CALL_ERRORS.inc(operation="embed")
             raise AIServiceError(f"Embedding failed: {exc}") from exc
         except Exception as exc:
+            AI_CALL_ERRORS.inc(operation="embed")
             raise AIServiceError(f"Embedding failed (unexpected): {exc}") from exc
 
+        AI_EMBED_SECONDS.observe(time.perf_counter() - started)
+        AI_EMBED_BATCH_SIZE.observe(1)
+        return response.data[0].embedding
+
     # ------------------------------------------------------------------
     # Semantic search
     # ------------------------------------------------------------------
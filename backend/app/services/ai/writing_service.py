@@ -2,8 +2,14 @@
 
 This module provides the :class:`WritingService` which orchestrates calls
 to the OpenAI-compatible API for generating, improving, and summarising text.
+
+Every stream is instrumented (see :mod:`app.core.metrics`) so latency can be
+split into prefill (time-to-first-token) and decode (inter-token latency,
+tokens per second).  Token counts come from the server's ``usage`` block,
+requested via ``stream_options={"include_usage": True}``.
 """
 
+import time
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING
 
@@ -12,6 +18,15 @@ from openai import AsyncOpenAI, OpenAIError
 from app.core.config import settings
 from app.core.constants import WRITING_MAX_TOKENS
 from app.core.exceptions import AIServiceError
+from app.core.metrics import (
+    AI_CALL_ERRORS,
+    AI_CHAT_INTER_TOKEN_SECONDS,
+    AI_CHAT_STREAM_SECONDS,
+    AI_CHAT_TOKENS,
+    AI_CHAT_TOKENS_PER_SECOND,
+    AI_CHAT_TTFT_SECONDS,
+)
+from app.core.timing import record
 from app.schemas.ai import WriteRequest
 from app.services.ai.prompts import (
     IMPROVE_SYSTEM_PROMPT,
@@ -44,7 +59,10 @@ class WritingService:
         """Stream an AI response based on the requested mode and prompt.
 
         Constructs the appropriate system prompt and user messages, then
-        streams the completion chunks back to the caller.
+        streams the completion chunks back to the caller.  Time-to-first-token,
+        inter-token gaps, total duration and token usage are recorded as
+        histograms labelled with the request mode; the duration is also added
+        to the request's ``llm`` timing.
 
         Args:
             request: The :class:`~app.schemas.ai.WriteRequest` containing
@@ -68,18 +86,89 @@ class WritingService:
         else:
             messages.append({"role": "user", "content": request.prompt})
 
+        mode = request.mode.value
+        started = time.perf_counter()
+        first_token_at: float | None = None
+        last_token_at = started
+        completion_tokens: int | None = None
+
         try:
             stream = await self.client.chat.completions.create(
                 model=settings.VLLM_CHAT_MODEL,
                 messages=messages,
                 max_tokens=WRITING_MAX_TOKENS,
                 stream=True,
+                stream_options={"include_usage": True},
             )
             async for chunk in stream:
+                if chunk.usage is not None:
+                    completion_tokens = chunk.usage.completion_tokens
+                    AI_CHAT_TOKENS.observe(chunk.usage.prompt_tokens, mode=mode, kind="prompt")
+                    AI_CHAT_TOKENS.observe(completion_tokens, mode=mode, kind="completion")
                 if not chunk.choices:
                     continue
                 delta = chunk.choices[0].delta.content
                 if delta:
+                    now = time.perf_counter()
+                    if first_token_at is None:
+                        first_token_at = now
+                        AI_CHAT_TTFT_SECONDS.observe(now - started, mode=mode)
+                    else:
+                        AI_CHAT_INTER_TOKEN_SECONDS.observe(now - last_token_at, mode=mode)
+                    last_token_at = now
                     yield delta
         except OpenAIError as exc:
+            AI_CALL_ERRORS.inc(operation="chat")
             raise AIServiceError(f"AI stream failed: {exc}") from exc
+        finally:
+            record("llm", time.perf_counter() - started)
+
+        AI_CHAT_STREAM_SECONDS.observe(time.perf_counter() - started, mode=mode)
+        decode_seconds = last_token_at - (first_token_at or last_token_at)
+        if completion_tokens and decode_seconds > 0:
+            AI_CHAT_TOKENS_PER_SECOND.observe(completion_tokens / decode_seconds, mode=mode)
+
+    async def complete(self, *, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Return a single non-streamed completion.
+
+        Used by batch jobs (see :mod:`app.services.ai.metadata_service`)
+        that need the whole answer at once.  Latency and token usage are
+        recorded under the ``batch`` mode label.
+
+        Args:
+            system_prompt: System message steering the completion.
+            prompt: User message content.
+            max_tokens: Generation budget.
+
+        Returns:
+            The generated text, stripped of surrounding whitespace.
+
+        Raises:
+            AIServiceError: If the underlying API call fails.
+        """
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+        started = time.perf_counter()
+        try:
+            response = await self.client.chat.completions.create(
+                model=settings.VLLM_CHAT_MODEL,
+                messages=messages,
+                max_tokens=max_tokens,
+            )
+        except OpenAIError as exc:
+            AI_CALL_ERRORS.inc(operation="chat")
+            raise AIServiceError(f"AI completion failed: {exc}") from exc
+        finally:
+            record("llm", time.perf_counter() - started)
+
+        AI_CHAT_STREAM_SECONDS.observe(time.perf_counter() - started, mode="batch")
+        if response.usage is not None:
+            AI_CHAT_TOKENS.observe(response.usage.prompt_tokens, mode="batch", kind="prompt")
+            AI_CHAT_TOKENS.observe(
+                response.usage.completion_tokens, mode="batch", kind="completion"
+            )
+        if not response.choices:
+            return ""
+        return (response.choices[0].message.content or "").strip()
@@ -1,16 +1,32 @@
 """Business logic for authentication and user sessions.
 
 This module provides the :class:`AuthService` which orchestrates user
-login, password verification, and JWT token issuance.
+login, password verification, JWT token issuance and revocation.
 """
 
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import principal_cache
 from app.core.exceptions import NotFoundError, PortfolioError
-from app.core.security import create_access_token, verify_password
+from app.core.revocation import revoked_tokens
+from app.core.security import (
+    create_access_token,
+    decode_token_claims,
+    forget_access_token,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
+from app.repositories.revoked_token_repository import RevokedTokenRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import TokenResponse, UserResponse
 
+logger = logging.getLogger(__name__)
+
 
 class AuthenticationError(PortfolioError):
     """Raised when credentials are invalid."""
@@ -23,17 +39,23 @@ class InactiveUserError(PortfolioError):
 class AuthService:
     """Service layer for authentication operations."""
 
-    def __init__(self, repo: UserRepository) -> None:
+    def __init__(self, repo: UserRepository, revoked: RevokedTokenRepository | None = None) -> None:
         """Initialise the auth service.
 
         Args:
             repo: The user repository for database access.
+            revoked: The revoked-token repository used by :meth:`logout`.
         """
         self.repo = repo
+        self.revoked = revoked or RevokedTokenRepository()
 
     async def login(self, db: AsyncSession, *, email: str, password: str) -> TokenResponse:
         """Validate credentials and issue a JWT access token.
 
+        When the stored hash was created with a bcrypt cost other than
+        ``settings.BCRYPT_ROUNDS`` it is transparently replaced with a hash
+        at the configured cost — the plain password is only known here.
+
         Args:
             db: Active async database session.
             email: The user's email address.
@@ -47,19 +69,58 @@ class AuthService:
             InactiveUserError: If the account is disabled.
         """
         user = await self.repo.get_by_email(db, email)
-        if user is None or not verify_password(password, user.hashed_password):
+        if user is None or not await verify_password_async(password, user.hashed_password):
             # Deliberately vague — do not reveal whether the email exists.
             raise AuthenticationError("Invalid email or password")
 
         if not user.is_active:
             raise InactiveUserError("Account is disabled")
 
-        token = create_access_token(subject=str(user.id))
+        # Read before the rehash: a rollback expires ``user``, and reloading an
+        # expired attribute on an AsyncSession raises MissingGreenlet.
+        user_id = str(user.id)
+        if password_needs_rehash(user.hashed_password):
+            try:
+                await self.repo.update_password(db, user, await hash_password_async(password))
+            except SQLAlchemyError:
+                # Never fail a valid login over an opportunistic upgrade.
+                await db.rollback()
+                logger.exception("Could not rehash password for user %s", user_id)
+
+        token = create_access_token(subject=user_id)
         return TokenResponse(access_token=token)
 
+    async def logout(self, db: AsyncSession, *, token: str) -> None:
+        """Revoke ``token`` so it is rejected for the rest of its lifetime.
+
+        The ``jti`` is stored in the ``revoked_tokens`` table, which notifies
+        every worker, and added to this worker's deny-list immediately so
+        the next request cannot slip in before the notification arrives.
+        Tokens without a ``jti`` (issued before revocation existed) cannot
+        be revoked and stay valid until ``exp``.
+
+        Args:
+            db: Active async database session.
+            token: The raw JWT to revoke.
+
+        Raises:
+            ValueError: If the token is invalid, expired or already revoked.
+        """
+        claims = decode_token_claims(token)
+        if claims.jti is not None:
+            await self.revoked.revoke(
+                db, jti=claims.jti, expires_at=datetime.fromtimestamp(claims.exp, UTC)
+            )
+            revoked_tokens.add(claims.jti, claims.exp)
+        forget_access_token(token)
+
     async def get_current_user(self, db: AsyncSession, *, user_id: str) -> UserResponse:
         """Resolve a user by ID (extracted from a validated JWT).
 
+        Active users are served from :data:`~app.core.cache.principal_cache`
+        for up to ``settings.PRINCIPAL_CACHE_TTL`` seconds, so the admin
+        CMS does not repeat the same lookup on every request.
+
         Args:
             db: Active async database session.
             user_id: The UUID string of the user to resolve.
@@ -78,6 +139,10 @@ class AuthService:
         except ValueError as exc:
             raise NotFoundError("User not found") from exc
 
+        cached = principal_cache.get(uid)
+        if cached is not None:
+            return cached
+
         user = await self.repo.get_by_id(db, uid)
         if user is None:
             raise NotFoundError("User not found")
@@ -85,4 +150,6 @@ class AuthService:
         if not user.is_active:
             raise InactiveUserError("Account is disabled")
 
-        return UserResponse.model_validate(user)
+        resolved = UserResponse.model_validate(user)
+        principal_cache.set(uid, resolved)
+        return resolved
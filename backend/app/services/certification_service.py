@@ -15,16 +15,20 @@ Typical usage::
 """
 
 import uuid
+from datetime import date
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import CertificationNotFoundError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import validate_rows
 from app.repositories.certification_repository import CertificationRepository
 from app.schemas.certification import (
     CertificationCreate,
     CertificationResponse,
     CertificationUpdate,
 )
+from app.schemas.pagination import Page
 
 
 class CertificationService:
@@ -73,8 +77,46 @@ class CertificationService:
             objects ordered by ``issued_at`` descending (most recent first).
             Returns an empty list when no certifications match the filter.
         """
-        certs = await self.repo.get_all(db, featured_only=featured_only)
-        return [CertificationResponse.model_validate(cert) for cert in certs]
+        rows = await self.repo.get_all(db, featured_only=featured_only)
+        return validate_rows(CertificationResponse, rows)
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: str | None,
+        limit: int,
+        featured_only: bool = False,
+    ) -> Page[CertificationResponse]:
+        """Return one keyset-paginated page, in the :meth:`get_all` order.
+
+        Args:
+            db: Active async database session.
+            cursor: ``next_cursor`` of the previous page, or ``None`` for
+                the first page.
+            limit: Maximum number of items on the page.
+            featured_only: When ``True``, only featured certifications
+                are included.
+
+        Returns:
+            A :class:`~app.schemas.pagination.Page` whose ``next_cursor`` is
+            ``None`` on the last page.
+
+        Raises:
+            ValidationError: If ``cursor`` is malformed.
+        """
+        after = decode_cursor(cursor, date.fromisoformat, uuid.UUID) if cursor else None
+        rows = await self.repo.get_page(
+            db, after=after, limit=limit + 1, featured_only=featured_only
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.issued_at, last.id)
+        return Page[CertificationResponse](
+            items=validate_rows(CertificationResponse, rows), next_cursor=next_cursor
+        )
 
     async def get_by_id(self, db: AsyncSession, cert_id: uuid.UUID) -> CertificationResponse:
         """Return a single certification identified by its UUID.
@@ -137,11 +179,10 @@ class CertificationService:
             CertificationNotFoundError: If no certification with the given ID
                 exists.
         """
-        cert = await self.repo.get_by_id(db, cert_id)
-        if not cert:
+        row = await self.repo.update(db, cert_id, data)
+        if row is None:
             raise CertificationNotFoundError(f"Certification '{cert_id}' not found")
-        updated = await self.repo.update(db, cert, data)
-        return CertificationResponse.model_validate(updated)
+        return CertificationResponse.model_validate(row)
 
     async def delete(self, db: AsyncSession, cert_id: uuid.UUID) -> None:
         """Permanently delete a certification from the database.
@@ -154,7 +195,5 @@ class CertificationService:
             CertificationNotFoundError: If no certification with the given ID
                 exists.
         """
-        cert = await self.repo.get_by_id(db, cert_id)
-        if not cert:
+        if not await self.repo.delete(db, cert_id):
             raise CertificationNotFoundError(f"Certification '{cert_id}' not found")
-        await self.repo.delete(db, cert)
@@ -14,11 +14,20 @@ Typical usage::
     posts = await service.get_all(db, published_only=True)
 """
 
+import uuid
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import PostNotFoundError, SlugConflictError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import validate_rows
 from app.repositories.post_repository import PostRepository
-from app.schemas.post import PostCreate, PostResponse, PostUpdate
+from app.schemas.pagination import Page
+from app.schemas.post import PostCreate, PostResponse, PostSummary, PostUpdate
+
+_UNIQUE_VIOLATION = "23505"  # Postgres SQLSTATE
 
 
 class PostService:
@@ -61,8 +70,46 @@ class PostService:
             ordered by ``created_at`` descending (newest first).
             Returns an empty list when no posts match the filter.
         """
-        posts = await self.repo.get_all(db, published_only=published_only)
-        return [PostResponse.model_validate(post) for post in posts]
+        rows = await self.repo.get_all(db, published_only=published_only)
+        return validate_rows(PostResponse, rows)
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: str | None,
+        limit: int,
+        published_only: bool = True,
+    ) -> Page[PostSummary]:
+        """Return one keyset-paginated page, in the :meth:`get_all` order.
+
+        Args:
+            db: Active async database session.
+            cursor: ``next_cursor`` of the previous page, or ``None`` for
+                the first page.
+            limit: Maximum number of items on the page.
+            published_only: When ``True`` (default), only published
+                posts are included.
+
+        Returns:
+            A :class:`~app.schemas.pagination.Page` of
+            :class:`~app.schemas.post.PostSummary` items — list-view
+            columns only — whose ``next_cursor`` is ``None`` on the last
+            page.
+
+        Raises:
+            ValidationError: If ``cursor`` is malformed.
+        """
+        after = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID) if cursor else None
+        rows = await self.repo.get_page(
+            db, after=after, limit=limit + 1, published_only=published_only
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return Page[PostSummary](items=validate_rows(PostSummary, rows), next_cursor=next_cursor)
 
     async def get_by_slug(self, db: AsyncSession, slug: str) -> PostResponse:
         """Return a single post identified by its URL slug.
@@ -101,12 +148,9 @@ class PostService:
         Raises:
             SlugConflictError: If a post with the same slug already exists.
         """
-        slug = data.model_dump().get("slug")
-        if isinstance(slug, str) and slug:
-            existing = await self.repo.get_by_slug(db, slug)
-            if existing:
-                raise SlugConflictError(f"Post slug '{slug}' is already taken")
         post = await self.repo.create(db, data)
+        if post is None:
+            raise SlugConflictError(f"Post slug '{data.slug}' is already taken")
         return PostResponse.model_validate(post)
 
     async def update(self, db: AsyncSession, slug: str, data: PostUpdate) -> PostResponse:
@@ -125,12 +169,18 @@ class PostService:
 
         Raises:
             PostNotFoundError: If no post with the given slug exists.
+            SlugConflictError: If ``data`` renames the post to a slug that is
+                already taken.
         """
-        post = await self.repo.get_by_slug(db, slug)
-        if not post:
+        try:
+            row = await self.repo.update(db, slug, data)
+        except IntegrityError as exc:
+            if getattr(exc.orig, "pgcode", None) != _UNIQUE_VIOLATION:
+                raise
+            raise SlugConflictError(f"Post slug '{data.slug}' is already taken") from exc
+        if row is None:
             raise PostNotFoundError(f"Post '{slug}' not found")
-        updated = await self.repo.update(db, post, data)
-        return PostResponse.model_validate(updated)
+        return PostResponse.model_validate(row)
 
     async def delete(self, db: AsyncSession, slug: str) -> None:
         """Permanently delete a post from the database.
@@ -142,7 +192,5 @@ class PostService:
         Raises:
             PostNotFoundError: If no post with the given slug exists.
         """
-        post = await self.repo.get_by_slug(db, slug)
-        if not post:
+        if not await self.repo.delete(db, slug):
             raise PostNotFoundError(f"Post '{slug}' not found")
-        await self.repo.delete(db, post)
@@ -14,11 +14,29 @@ Typical usage::
     projects = await service.get_all(db, published_only=True)
 """
 
+import uuid
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ProjectNotFoundError, SlugConflictError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import validate_rows
 from app.repositories.project_repository import ProjectRepository
-from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.schemas.pagination import Page
+from app.schemas.project import ProjectCreate, ProjectResponse, ProjectSummary, ProjectUpdate
+
+_UNIQUE_VIOLATION = "23505"  # Postgres SQLSTATE
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1  # range of the INTEGER ``order`` column
+
+
+def _int32(value: str | int) -> int:
+    """Parse a cursor's ``order`` value, rejecting what Postgres cannot bind."""
+    parsed = int(value)
+    if not _INT32_MIN <= parsed <= _INT32_MAX:
+        raise ValueError(f"order out of range: {parsed}")
+    return parsed
 
 
 class ProjectService:
@@ -63,8 +81,48 @@ class ProjectService:
             ordered by ``order`` ascending, then ``created_at`` descending.
             Returns an empty list when no projects match the filter.
         """
-        projects = await self.repo.get_all(db, published_only=published_only)
-        return [ProjectResponse.model_validate(project) for project in projects]
+        rows = await self.repo.get_all(db, published_only=published_only)
+        return validate_rows(ProjectResponse, rows)
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: str | None,
+        limit: int,
+        published_only: bool = True,
+    ) -> Page[ProjectSummary]:
+        """Return one keyset-paginated page, in the :meth:`get_all` order.
+
+        Args:
+            db: Active async database session.
+            cursor: ``next_cursor`` of the previous page, or ``None`` for
+                the first page.
+            limit: Maximum number of items on the page.
+            published_only: When ``True`` (default), only published
+                projects are included.
+
+        Returns:
+            A :class:`~app.schemas.pagination.Page` of
+            :class:`~app.schemas.project.ProjectSummary` items — list-view
+            columns only — whose ``next_cursor`` is ``None`` on the last
+            page.
+
+        Raises:
+            ValidationError: If ``cursor`` is malformed.
+        """
+        after = decode_cursor(cursor, _int32, datetime.fromisoformat, uuid.UUID) if cursor else None
+        rows = await self.repo.get_page(
+            db, after=after, limit=limit + 1, published_only=published_only
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.order, last.created_at, last.id)
+        return Page[ProjectSummary](
+            items=validate_rows(ProjectSummary, rows), next_cursor=next_cursor
+        )
 
     async def get_by_slug(self, db: AsyncSession, slug: str) -> ProjectResponse:
         """Return a single project identified by its URL slug.
@@ -94,8 +152,8 @@ class ProjectService:
             A list of featured :class:`~app.schemas.project.ProjectResponse`
             objects.  Returns an empty list when none are marked featured.
         """
-        projects = await self.repo.get_featured(db)
-        return [ProjectResponse.model_validate(project) for project in projects]
+        rows = await self.repo.get_featured(db)
+        return validate_rows(ProjectResponse, rows)
 
     async def create(self, db: AsyncSession, data: ProjectCreate) -> ProjectResponse:
         """Create a new project and persist it to the database.
@@ -115,12 +173,9 @@ class ProjectService:
         Raises:
             SlugConflictError: If a project with the same slug already exists.
         """
-        slug = data.model_dump().get("slug")
-        if isinstance(slug, str) and slug:
-            existing = await self.repo.get_by_slug(db, slug)
-            if existing:
-                raise SlugConflictError(f"Project slug '{slug}' is already taken")
         project = await self.repo.create(db, data)
+        if project is None:
+            raise SlugConflictError(f"Project slug '{data.slug}' is already taken")
         return ProjectResponse.model_validate(project)
 
     async def update(self, db: AsyncSession, slug: str, data: ProjectUpdate) -> ProjectResponse:
@@ -139,12 +194,18 @@ class ProjectService:
 
         Raises:
             ProjectNotFoundError: If no project with the given slug exists.
+            SlugConflictError: If ``data`` renames the project to a slug that is
+                already taken.
         """
-        project = await self.repo.get_by_slug(db, slug)
-        if not project:
+        try:
+            row = await self.repo.update(db, slug, data)
+        except IntegrityError as exc:
+            if getattr(exc.orig, "pgcode", None) != _UNIQUE_VIOLATION:
+                raise
+            raise SlugConflictError(f"Project slug '{data.slug}' is already taken") from exc
+        if row is None:
             raise ProjectNotFoundError(f"Project '{slug}' not found")
-        updated = await self.repo.update(db, project, data)
-        return ProjectResponse.model_validate(updated)
+        return ProjectResponse.model_validate(row)
 
     async def delete(self, db: AsyncSession, slug: str) -> None:
         """Permanently delete a project from the database.
@@ -156,7 +217,5 @@ class ProjectService:
         Raises:
             ProjectNotFoundError: If no project with the given slug exists.
         """
-        project = await self.repo.get_by_slug(db, slug)
-        if not project:
+        if not await self.repo.delete(db, slug):
             raise ProjectNotFoundError(f"Project '{slug}' not found")
-        await self.repo.delete(db, project)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Measure event-loop lag during a burst of logins, before and after offloading bcrypt.
+
+A ticker task sleeps for a fixed interval in a loop and records how late it
+wakes up.  While it runs, a burst of concurrent password checks is executed
+either inline (``verify_password``, the old behaviour) or on the bcrypt
+thread pool (``verify_password_async``).  Inline checks hold the loop for the
+whole hash, so every other coroutine on the worker — SSE streams, queries —
+sees the same lag as the ticker.
+
+No database is needed.
+
+Usage::
+
+    uv run python scripts/bench_bcrypt_event_loop.py --logins 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+# Ensure the 'app' module can be imported when running as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.config import settings
+from app.core.security import hash_password, verify_password, verify_password_async
+
+TICK_SECONDS = 0.005
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _measure(label: str, logins: int, check: Callable[[], Awaitable[bool]]) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(TICK_SECONDS * 4)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(check() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{label:<8} burst={elapsed * 1000:8.1f} ms  "
+        f"lag p50={statistics.median(lags_ms):7.1f} ms  "
+        f"p99={p99:7.1f} ms  max={lags_ms[-1]:7.1f} ms  ticks={len(lags_ms)}"
+    )
+
+
+async def main(logins: int) -> None:
+    hashed = hash_password("correct horse battery staple")
+
+    async def inline() -> bool:
+        return verify_password("correct horse battery staple", hashed)
+
+    async def offloaded() -> bool:
+        return await verify_password_async("correct horse battery staple", hashed)
+
+    print(f"{logins} concurrent logins, BCRYPT_MAX_WORKERS={settings.BCRYPT_MAX_WORKERS}")
+    await _measure("inline", logins, inline)
+    await _measure("pool", logins, offloaded)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=20, help="logins in the burst")
+    asyncio.run(main(parser.parse_args().logins))
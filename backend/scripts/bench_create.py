@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Measure project-create latency against a real database.
+
+Compares, on the database at ``DATABASE_URL``:
+
+``legacy``
+    The previous service path: ``SELECT`` by slug, ``INSERT``, ``COMMIT``,
+    then ``db.refresh()`` — four round trips, and racy between the check and
+    the insert.
+
+``upsert``
+    The current :meth:`~app.repositories.project_repository.ProjectRepository.create`:
+    one ``INSERT ... ON CONFLICT (slug) DO NOTHING RETURNING`` plus ``COMMIT``.
+
+Also reports the statements each path issues.  Every row the benchmark
+creates uses a ``bench-create-`` slug and is deleted at the end.  Run it
+against a development database, never production.
+
+Usage::
+
+    uv run python scripts/bench_create.py --iterations 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy import delete, select
+
+# Ensure the 'app' module can be imported when running as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.db.instrumentation import count_queries
+from app.db.session import AsyncSessionLocal, engine
+from app.models.project import Project
+from app.repositories.project_repository import ProjectRepository
+from app.schemas.project import ProjectCreate
+
+SLUG_PREFIX = "bench-create-"
+
+
+def _payload() -> ProjectCreate:
+    return ProjectCreate(
+        title="Benchmark project",
+        slug=f"{SLUG_PREFIX}{uuid.uuid4().hex}",
+        description="Created by scripts/bench_create.py",
+        tags=["bench"],
+        tech_stack=["Python"],
+    )
+
+
+async def _legacy_create(data: ProjectCreate) -> None:
+    async with AsyncSessionLocal() as db:
+        existing = await db.execute(select(Project).where(Project.slug == data.slug))
+        if existing.scalar_one_or_none() is not None:
+            raise RuntimeError("slug collision")
+        project = Project(**data.model_dump())
+        db.add(project)
+        await db.commit()
+        await db.refresh(project)
+
+
+async def _upsert_create(data: ProjectCreate) -> None:
+    async with AsyncSessionLocal() as db:
+        if await ProjectRepository().create(db, data) is None:
+            raise RuntimeError("slug collision")
+
+
+async def _time(variant: str, iterations: int) -> tuple[list[float], int]:
+    create = _legacy_create if variant == "legacy" else _upsert_create
+    for _ in range(min(iterations, 20)):  # warm up connections and caches
+        await create(_payload())
+    samples = []
+    with count_queries() as queries:
+        for _ in range(iterations):
+            data = _payload()
+            started = time.perf_counter()
+            await create(data)
+            samples.append(time.perf_counter() - started)
+    return samples, queries.count // iterations
+
+
+async def main(iterations: int) -> None:
+    try:
+        print(f"{iterations} creates per variant")
+        for variant in ("legacy", "upsert"):
+            samples, statements = await _time(variant, iterations)
+            samples.sort()
+            p95 = samples[int(len(samples) * 0.95) - 1]
+            print(
+                f"{variant:<7} median {statistics.median(samples) * 1000:6.2f} ms  "
+                f"p95 {p95 * 1000:6.2f} ms  ({statements} statements/create)"
+            )
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Project).where(Project.slug.startswith(SLUG_PREFIX)))
+            await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    asyncio.run(main(parser.parse_args().iterations))
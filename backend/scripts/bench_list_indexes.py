@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Compare list-endpoint query plans and latency with and without the list indexes.
+
+For each public list query — published projects, featured projects,
+published posts, all and featured certifications — this script:
+
+1. runs the real repository method and captures the SQL it sends;
+2. reports the median latency of the repository call and the
+   ``EXPLAIN (ANALYZE, BUFFERS)`` plan and execution time of that SQL;
+
+first without the list indexes, then after creating the indexes declared on
+the models (migration ``a6789012345f``).
+
+The data lives in temporary tables named ``projects``, ``posts`` and
+``certifications``.  They shadow the real tables for this connection only
+and are rolled back at the end, so the database at ``DATABASE_URL`` is not
+modified.  Half of the generated projects and posts are published, 1 % of
+projects and 2 % of certifications are featured.
+
+Usage::
+
+    uv run python scripts/bench_list_indexes.py --rows 100000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.schema import CreateIndex
+
+# Ensure the 'app' module can be imported when running as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.db.session import engine
+from app.models.certification import Certification
+from app.models.post import Post
+from app.models.project import Project
+from app.repositories.certification_repository import CertificationRepository
+from app.repositories.post_repository import PostRepository
+from app.repositories.project_repository import ProjectRepository
+
+TABLES = (Project, Post, Certification)
+
+SEED = {
+    "projects": """
+        INSERT INTO projects (id, title, slug, description, tags, tech_stack,
+                              featured, published, "order", created_at, updated_at)
+        SELECT gen_random_uuid(), 'Project ' || i, 'bench-project-' || i, 'Description',
+               '{}', '{}', i % 100 = 0, i % 2 = 0, i % 10,
+               now() - i * interval '1 minute', now()
+        FROM generate_series(1, :rows) AS i
+    """,
+    "posts": """
+        INSERT INTO posts (id, title, slug, excerpt, tags, published, created_at, updated_at)
+        SELECT gen_random_uuid(), 'Post ' || i, 'bench-post-' || i, 'Excerpt', '{}',
+               i % 2 = 0, now() - i * interval '1 minute', now()
+        FROM generate_series(1, :rows) AS i
+    """,
+    "certifications": """
+        INSERT INTO certifications (id, name, issuer, issued_at, featured, created_at, updated_at)
+        SELECT gen_random_uuid(), 'Certification ' || i, 'Issuer',
+               current_date - (i % 3650), i % 50 = 0, now(), now()
+        FROM generate_series(1, :rows) AS i
+    """,
+}
+
+Case = tuple[str, Callable[[AsyncSession], Awaitable[Any]]]
+
+CASES: list[Case] = [
+    ("projects published", lambda db: ProjectRepository().get_all(db)),
+    ("projects featured", lambda db: ProjectRepository().get_featured(db)),
+    ("posts published", lambda db: PostRepository().get_all(db)),
+    ("certifications all", lambda db: CertificationRepository().get_all(db)),
+    (
+        "certifications featured",
+        lambda db: CertificationRepository().get_all(db, featured_only=True),
+    ),
+]
+
+
+async def _measure(conn: AsyncConnection, case: Case, repeat: int) -> tuple[float, list[str]]:
+    """Return the median repository latency and the EXPLAIN ANALYZE plan."""
+    _, call = case
+    statements: list[str] = []
+
+    def capture(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    samples = []
+    async with AsyncSession(bind=conn) as db:
+        event.listen(conn.sync_connection, "before_cursor_execute", capture)
+        try:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                await call(db)
+                samples.append(time.perf_counter() - started)
+                db.expunge_all()
+        finally:
+            event.remove(conn.sync_connection, "before_cursor_execute", capture)
+
+    plan = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statements[0]}")
+    return statistics.median(samples), [row[0] for row in plan]
+
+
+def _summary(plan: list[str]) -> str:
+    top = plan[0].split("  (")[0].strip()
+    execution = next((line for line in plan if line.startswith("Execution Time")), "")
+    return f"{top}; {execution.lower()}"
+
+
+async def main(rows: int, repeat: int, show_plans: bool) -> None:
+    async with engine.connect() as conn:
+        await conn.begin()
+        for table in TABLES:
+            name = table.__tablename__
+            await conn.exec_driver_sql(
+                f"CREATE TEMPORARY TABLE {name} (LIKE public.{name} INCLUDING DEFAULTS)"
+            )
+            await conn.execute(text(SEED[name]), {"rows": rows})
+            await conn.exec_driver_sql(f"ANALYZE {name}")
+
+        before = [await _measure(conn, case, repeat) for case in CASES]
+
+        for table in TABLES:
+            for index in table.metadata.tables[table.__tablename__].indexes:
+                await conn.execute(CreateIndex(index))
+            await conn.exec_driver_sql(f"ANALYZE {table.__tablename__}")
+
+        after = [await _measure(conn, case, repeat) for case in CASES]
+        await conn.rollback()
+    await engine.dispose()
+
+    print(f"{rows} rows per table, median of {repeat} repository calls")
+    for (label, _), (old, old_plan), (new, new_plan) in zip(CASES, before, after, strict=True):
+        print(f"\n{label}: {old * 1000:8.1f} ms -> {new * 1000:8.1f} ms")
+        print(f"  before: {_summary(old_plan)}")
+        print(f"  after:  {_summary(new_plan)}")
+        if show_plans:
+            print("\n".join(f"    {line}" for line in new_plan))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--show-plans", action="store_true", help="print full plans")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat, args.show_plans))
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Compare bytes read from Postgres and response size for list views.
+
+For published projects and posts, this script runs three queries:
+
+``full row``
+    ``SELECT *`` in the list order.  This is what ``select(Model)`` loaded
+    before the embedding column was deferred.
+``get_all``
+    The repository's ``get_all``.  It selects the ``*Response`` columns,
+    which exclude ``content_embedding``.
+``summary``
+    The repository's ``get_page`` for a single page holding every row.  It
+    selects only the :class:`~app.schemas.project.ProjectSummary` /
+    :class:`~app.schemas.post.PostSummary` columns.
+
+For each query it reports:
+
+- the total ``pg_column_size`` of the returned rows.  This is the stored
+  datum size, which is close to what the binary protocol sends;
+- the median latency;
+- the size of the JSON response built from the rows (``*Response`` for the
+  first two queries, ``*Summary`` for the last).
+
+The data is stored in temporary ``projects`` and ``posts`` tables.
+
+- They shadow the real tables for this connection only and are rolled back
+  at the end, so the database at ``DATABASE_URL`` is not modified.
+- Bodies are about ``--body-kb`` kB of incompressible text, so TOAST
+  compression does not hide their size.
+- Every row has an embedding.
+
+Usage::
+
+    uv run python scripts/bench_list_payload.py --rows 1000 --body-kb 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+# Ensure the 'app' module can be imported when running as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.constants import EMBEDDING_DIMENSIONS
+from app.db.session import engine
+from app.models.post import Post
+from app.models.project import Project
+from app.repositories.post_repository import PostRepository
+from app.repositories.project_repository import ProjectRepository
+from app.schemas.post import PostResponse, PostSummary
+from app.schemas.project import ProjectResponse, ProjectSummary
+
+# One 33-byte md5 chunk per ~33 bytes of body text: random, so TOAST cannot
+# compress it away.
+_TEXT = "(SELECT string_agg(md5(random()::text), ' ') FROM generate_series(1, :chunks))"
+_VECTOR = f"array_fill(0.5::real, ARRAY[{EMBEDDING_DIMENSIONS}])::vector"
+
+SEED = {
+    "projects": f"""
+        INSERT INTO projects (id, title, slug, description, content, tags, tech_stack,
+                              featured, published, "order", content_embedding,
+                              created_at, updated_at)
+        SELECT gen_random_uuid(), 'Project ' || i, 'bench-project-' || i,
+               'A short description shown on the project card.', {_TEXT},
+               '{{python,fastapi}}', '{{Python,PostgreSQL}}', false, true, i % 10,
+               {_VECTOR}, now() - i * interval '1 minute', now()
+        FROM generate_series(1, :rows) AS i
+    """,
+    "posts": f"""
+        INSERT INTO posts (id, title, slug, excerpt, body, tags, published,
+                           content_embedding, created_at, updated_at)
+        SELECT gen_random_uuid(), 'Post ' || i, 'bench-post-' || i,
+               'A short excerpt shown on the post card.', {_TEXT}, '{{python}}', true,
+               {_VECTOR}, now() - i * interval '1 minute', now()
+        FROM generate_series(1, :rows) AS i
+    """,
+}
+
+Call = Callable[[AsyncSession], Awaitable[list[Any]]]
+
+
+def _cases(rows: int) -> list[tuple[str, Call, TypeAdapter[Any]]]:
+    projects, posts = ProjectRepository(), PostRepository()
+
+    async def projects_full(db: AsyncSession) -> list[Any]:
+        query = (
+            select(Project.__table__)
+            .where(Project.published)
+            .order_by(Project.order, Project.created_at.desc(), Project.id.desc())
+        )
+        return list((await db.execute(query)).all())
+
+    async def posts_full(db: AsyncSession) -> list[Any]:
+        query = (
+            select(Post.__table__)
+            .where(Post.published)
+            .order_by(Post.created_at.desc(), Post.id.desc())
+        )
+        return list((await db.execute(query)).all())
+
+    project_list = TypeAdapter(list[ProjectResponse])
+    post_list = TypeAdapter(list[PostResponse])
+    return [
+        ("projects full row", projects_full, project_list),
+        ("projects get_all", projects.get_all, project_list),
+        (
+            "projects summary",
+            lambda db: projects.get_page(db, after=None, limit=rows),
+            TypeAdapter(list[ProjectSummary]),
+        ),
+        ("posts full row", posts_full, post_list),
+        ("posts get_all", posts.get_all, post_list),
+        (
+            "posts summary",
+            lambda db: posts.get_page(db, after=None, limit=rows),
+            TypeAdapter(list[PostSummary]),
+        ),
+    ]
+
+
+async def _measure(
+    conn: AsyncConnection, call: Call, adapter: TypeAdapter[Any], repeat: int
+) -> tuple[int, float, int]:
+    """Return (bytes from Postgres, median seconds, response bytes) for one query."""
+    captured: list[tuple[str, Any]] = []
+
+    def capture(_conn: Any, _cursor: Any, statement: str, parameters: Any, *_args: Any) -> None:
+        captured.append((statement, parameters))
+
+    samples = []
+    async with AsyncSession(bind=conn) as db:
+        event.listen(conn.sync_connection, "before_cursor_execute", capture)
+        try:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                rows = await call(db)
+                samples.append(time.perf_counter() - started)
+                db.expunge_all()
+        finally:
+            event.remove(conn.sync_connection, "before_cursor_execute", capture)
+        response = len(adapter.dump_json(adapter.validate_python(rows, from_attributes=True)))
+
+    statement, parameters = captured[0]
+    result = await conn.exec_driver_sql(
+        f"SELECT coalesce(sum(pg_column_size(q.*)), 0) FROM ({statement}) AS q", parameters
+    )
+    return result.scalar_one(), statistics.median(samples), response
+
+
+async def main(rows: int, body_kb: int, repeat: int) -> None:
+    async with engine.connect() as conn:
+        await conn.begin()
+        for name, seed in SEED.items():
+            await conn.exec_driver_sql(
+                f"CREATE TEMPORARY TABLE {name} (LIKE public.{name} INCLUDING DEFAULTS)"
+            )
+            await conn.execute(text(seed), {"rows": rows, "chunks": body_kb * 1024 // 33})
+            await conn.exec_driver_sql(f"ANALYZE {name}")
+
+        results = [
+            (label, await _measure(conn, call, adapter, repeat))
+            for label, call, adapter in _cases(rows)
+        ]
+        await conn.rollback()
+    await engine.dispose()
+
+    print(f"{rows} published rows per table, ~{body_kb} kB bodies, median of {repeat} calls")
+    print(f"{'query':<20} {'from postgres':>14} {'latency':>10} {'response':>12}")
+    for label, (db_bytes, seconds, response) in results:
+        print(
+            f"{label:<20} {db_bytes / 1024:11.0f} kB {seconds * 1000:7.1f} ms "
+            f"{response / 1024:9.0f} kB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--body-kb", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.body_kb, args.repeat))
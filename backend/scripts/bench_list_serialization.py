@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Measure list-endpoint throughput of the legacy and fast serialization paths.
+
+Both variants serve ``GET /posts/`` in-process, through FastAPI and an
+``httpx`` ASGI client:
+
+``legacy``
+    The previous handler.  It loads ``select(Post)`` ORM instances and runs
+    ``PostResponse.model_validate`` on each row.  It then returns the list,
+    and FastAPI validates it again against ``response_model`` before
+    encoding it.
+``fast``
+    The real route from :mod:`app.api.v1.routes.posts`.  The repository
+    returns Core rows of the response columns.  The service validates the
+    whole list in one ``TypeAdapter`` call.  The route then returns an
+    :class:`~app.core.responses.AdapterJSONResponse`, which is encoded
+    straight to JSON bytes.
+
+The script measures both variants at each ``--sizes`` item count.  For each
+one it reports requests per second, median and p95 latency, and response
+size.
+
+The posts are stored in a temporary ``posts`` table on a single connection.
+That table shadows the real one, and both variants' sessions are bound to
+that connection.  Everything is rolled back at the end, so the database at
+``DATABASE_URL`` is not modified.
+
+Usage::
+
+    uv run python scripts/bench_list_serialization.py --sizes 1000,10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+# Ensure the 'app' module can be imported when running as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.api.v1.routes import posts
+from app.db.session import engine, get_read_db
+from app.models.post import Post
+from app.schemas.post import PostResponse
+
+SEED = """
+    INSERT INTO posts (id, title, slug, excerpt, body, tags, published, reading_time_minutes,
+                       created_at, updated_at)
+    SELECT gen_random_uuid(), 'Post ' || i, 'bench-post-' || i,
+           'A short excerpt shown on the post card.',
+           (SELECT string_agg(md5(random()::text), ' ') FROM generate_series(1, :chunks)),
+           '{python,fastapi}', true, 5, now() - i * interval '1 minute', now()
+    FROM generate_series(:start, :stop) AS i
+"""
+
+
+def _bench_app(conn: AsyncConnection) -> FastAPI:
+    async def session() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(bind=conn) as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(posts.router, prefix="/fast")
+    app.dependency_overrides[get_read_db] = session
+
+    @app.get("/legacy/posts/", response_model=list[PostResponse])
+    async def legacy(db: AsyncSession = Depends(session, scope="function")) -> list[PostResponse]:
+        query = select(Post).where(Post.published).order_by(Post.created_at.desc(), Post.id.desc())
+        result = await db.execute(query)
+        return [PostResponse.model_validate(post) for post in result.scalars()]
+
+    return app
+
+
+async def _run(client: httpx.AsyncClient, path: str, requests: int) -> tuple[list[float], int]:
+    await client.get(path)  # warm up
+    samples = []
+    size = 0
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(path)
+        samples.append(time.perf_counter() - started)
+        response.raise_for_status()
+        size = len(response.content)
+    return samples, size
+
+
+async def main(sizes: list[int], requests: int, body_kb: int) -> None:
+    async with engine.connect() as conn:
+        await conn.begin()
+        await conn.exec_driver_sql(
+            "CREATE TEMPORARY TABLE posts (LIKE public.posts INCLUDING DEFAULTS)"
+        )
+        transport = httpx.ASGITransport(app=_bench_app(conn))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            seeded = 0
+            for size in sorted(sizes):
+                await conn.execute(
+                    text(SEED),
+                    {"start": seeded + 1, "stop": size, "chunks": body_kb * 1024 // 33},
+                )
+                await conn.exec_driver_sql("ANALYZE posts")
+                seeded = size
+
+                print(f"\n{size} posts, ~{body_kb} kB bodies, {requests} sequential requests")
+                for variant in ("legacy", "fast"):
+                    samples, response = await _run(client, f"/{variant}/posts/", requests)
+                    samples.sort()
+                    p95 = samples[max(int(len(samples) * 0.95) - 1, 0)]
+                    print(
+                        f"  {variant:<6} {len(samples) / sum(samples):7.1f} req/s  "
+                        f"median {statistics.median(samples) * 1000:7.1f} ms  "
+                        f"p95 {p95 * 1000:7.1f} ms  {response / 1024:8.0f} kB"
+                    )
+        await conn.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000", help="comma-separated item counts")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--body-kb", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main([int(n) for n in args.sizes.split(",")], args.requests, args.body_kb))
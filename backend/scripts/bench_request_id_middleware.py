@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Measure the per-request overhead of the request-ID middleware.
+
+Drives a trivial ASGI endpoint directly (no server, no HTTP client) through:
+
+``bare``
+    The endpoint alone — the baseline.
+
+``legacy``
+    The previous ``BaseHTTPMiddleware`` implementation, which added and
+    removed a filter on the root logger for every request.
+
+``asgi``
+    The current pure-ASGI :class:`~app.core.middleware.RequestIDMiddleware`.
+
+The endpoint logs one line per request through a handler carrying
+:class:`~app.core.middleware.RequestIDFilter`, so the legacy variant's
+filter churn is included.  Reported numbers are the overhead on top of
+``bare``.
+
+Usage::
+
+    uv run python scripts/bench_request_id_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Ensure the 'app' module can be imported when running as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.middleware import REQUEST_ID_HEADER, RequestIDFilter, RequestIDMiddleware
+
+bench_logger = logging.getLogger("bench")
+
+
+class _LegacyFilter(logging.Filter):
+    def __init__(self, request_id: str) -> None:
+        super().__init__()
+        self.request_id = request_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = self.request_id
+        return True
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """The ``BaseHTTPMiddleware`` version this benchmark compares against."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        request_id = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+        request.state.request_id = request_id
+        _filter = _LegacyFilter(request_id)
+        logging.getLogger().addFilter(_filter)
+        try:
+            response = await call_next(request)
+        finally:
+            logging.getLogger().removeFilter(_filter)
+        response.headers[REQUEST_ID_HEADER] = request_id
+        return response
+
+
+async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    bench_logger.info("handled")
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    pass
+
+
+def _scope() -> Scope:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+
+async def _time(app: ASGIApp, requests: int) -> float:
+    for _ in range(min(requests, 500)):  # warm up
+        await app(_scope(), _receive, _send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(_scope(), _receive, _send)
+    return (time.perf_counter() - started) / requests
+
+
+async def main(requests: int) -> None:
+    handler = logging.StreamHandler(io.StringIO())
+    handler.addFilter(RequestIDFilter())
+    bench_logger.addHandler(handler)
+    bench_logger.setLevel(logging.INFO)
+    bench_logger.propagate = False
+
+    bare = await _time(endpoint, requests)
+    legacy = await _time(LegacyRequestIDMiddleware(endpoint), requests)
+    current = await _time(RequestIDMiddleware(endpoint), requests)
+
+    print(f"{requests} requests, bare endpoint {bare * 1e6:.1f} µs/request")
+    print(f"legacy  +{(legacy - bare) * 1e6:7.1f} µs/request  (BaseHTTPMiddleware)")
+    print(f"asgi    +{(current - bare) * 1e6:7.1f} µs/request  (pure ASGI + ContextVar)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Recommend a bcrypt cost factor for a target verify latency on this machine.
+
+Benchmarks ``bcrypt.checkpw`` at increasing cost factors and recommends the
+highest cost whose median verify time stays within the target.  Run it on
+the hardware that serves the API, then set ``BCRYPT_ROUNDS`` to the
+recommended value; existing hashes are upgraded on each user's next login.
+
+Each step doubles the work, so the benchmark stops once a cost exceeds twice
+the target.
+
+Usage::
+
+    uv run python scripts/calibrate_bcrypt.py --target-ms 250
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import bcrypt
+
+# Ensure the 'app' module can be imported when running as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.config import settings
+
+MIN_COST = 4
+MAX_COST = 31
+PASSWORD = b"calibration-password"
+
+
+def measure(cost: int, samples: int) -> float:
+    """Return the median ``checkpw`` time in milliseconds at ``cost``."""
+    hashed = bcrypt.hashpw(PASSWORD, bcrypt.gensalt(rounds=cost))
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.checkpw(PASSWORD, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, start: int, samples: int) -> int:
+    """Print a latency table and return the recommended cost."""
+    recommended = start
+    print(f"{'cost':>4}  {'median verify':>14}")
+    for cost in range(start, MAX_COST + 1):
+        elapsed = measure(cost, samples)
+        marker = ""
+        if elapsed <= target_ms:
+            recommended = cost
+            marker = "  <= target"
+        print(f"{cost:>4}  {elapsed:>11.1f} ms{marker}")
+        if elapsed > target_ms * 2:
+            break
+    return recommended
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target-ms", type=float, default=250.0, help="target verify latency (default 250)"
+    )
+    parser.add_argument("--start", type=int, default=10, help="lowest cost to try (default 10)")
+    parser.add_argument("--samples", type=int, default=3, help="timings per cost (default 3)")
+    args = parser.parse_args()
+    if not MIN_COST <= args.start <= MAX_COST:
+        parser.error(f"--start must be between {MIN_COST} and {MAX_COST}")
+
+    recommended = calibrate(args.target_ms, args.start, args.samples)
+    print()
+    print(f"Recommended for {args.target_ms:.0f} ms: BCRYPT_ROUNDS={recommended}")
+    print(f"Currently configured:        BCRYPT_ROUNDS={settings.BCRYPT_ROUNDS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,9 @@ Fixtures provided:
     wrapped in a transaction that is rolled back on teardown so every test
     starts with a clean slate without dropping/recreating tables.
   - ``client`` (function-scoped) — ``httpx.AsyncClient`` wired to the
-    FastAPI app with the overridden DB session.
+    FastAPI app with the overridden DB session, authorised as a superuser.
+  - ``query_budget`` — context manager asserting that the wrapped block
+    (typically one request) executes at most ``n`` SQL statements.
 
 Usage
 -----
@@ -23,7 +25,10 @@ To skip integration tests in CI when Docker is unavailable::
     uv run pytest -m "not integration"
 """
 
-from collections.abc import AsyncGenerator, Generator
+import uuid
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from datetime import UTC, datetime
 from typing import Any
 
 import pytest
@@ -38,8 +43,11 @@ from sqlalchemy.ext.asyncio import (
 from testcontainers.postgres import PostgresContainer
 
 from alembic import command as alembic_command
-from app.db.session import get_db
+from app.core.deps import get_current_superuser
+from app.db.instrumentation import QueryCounter, count_queries, instrument_engine
+from app.db.session import get_db, get_read_db
 from app.main import app
+from app.schemas.auth import UserResponse
 
 # ---------------------------------------------------------------------------
 # Pytest markers
@@ -91,6 +99,7 @@ async def engine(postgres_container: PostgresContainer) -> AsyncGenerator[Any, N
     async_url = database_url.replace("postgresql+psycopg2://", "postgresql+asyncpg://")
 
     test_engine = create_async_engine(async_url, echo=False, pool_pre_ping=True)
+    instrument_engine(test_engine)
 
     # Run migrations synchronously (Alembic needs a sync connection under the hood)
     alembic_cfg = AlembicConfig("alembic.ini")
@@ -140,21 +149,36 @@ async def db(engine: Any) -> AsyncGenerator[AsyncSession, None]:
 
 
 # ---------------------------------------------------------------------------
-# HTTP client — function-scoped, overrides DB dependency
+# HTTP client — function-scoped, overrides DB and superuser dependencies
 # ---------------------------------------------------------------------------
 
+TEST_SUPERUSER = UserResponse(
+    id=uuid.UUID(int=1),
+    email="admin@example.com",
+    is_active=True,
+    is_superuser=True,
+    created_at=datetime(2024, 1, 1, tzinfo=UTC),
+    updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+)
+
 
 @pytest_asyncio.fixture()
 async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """
     Yield an ``httpx.AsyncClient`` wired to the FastAPI app with the test
-    DB session injected via dependency override.
+    DB session injected via dependency override.  Superuser-only routes are
+    authorised as :data:`TEST_SUPERUSER`, so CMS writes need no login.
     """
 
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db
 
+    async def override_get_current_superuser() -> UserResponse:
+        return TEST_SUPERUSER
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_current_superuser] = override_get_current_superuser
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -163,3 +187,30 @@ async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+# ---------------------------------------------------------------------------
+# Query budgets
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _assert_max_queries(limit: int) -> Iterator[QueryCounter]:
+    with count_queries() as queries:
+        yield queries
+    assert queries.count <= limit, (
+        f"Expected at most {limit} SQL statements, got {queries.count}:\n"
+        + "\n".join(f"  {n}x {shape}" for shape, n in queries.shapes.most_common())
+    )
+
+
+@pytest.fixture()
+def query_budget() -> Callable[[int], AbstractContextManager[QueryCounter]]:
+    """
+    Return a context manager that fails the test if the wrapped block runs
+    more than ``limit`` SQL statements (savepoints do not count)::
+
+        with query_budget(1):
+            await client.get("/api/v1/projects/")
+    """
+    return _assert_max_queries
@@ -0,0 +1,113 @@
+"""
+Integration tests — Auth domain.
+
+These tests hit the real FastAPI app with a real Postgres container (via the
+fixtures in ``tests/conftest.py``).
+
+Run with:
+    uv run pytest -m integration tests/integration/
+"""
+
+import time
+from datetime import UTC, datetime
+
+import bcrypt
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.revocation import load_revocations, revoked_tokens
+from app.main import app
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.user_repository import UserRepository
+
+pytestmark = pytest.mark.integration
+
+
+# ---------------------------------------------------------------------------
+# POST /api/v1/auth/login
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_login_succeeds_when_rehash_fails(
+    client: AsyncClient, db: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed opportunistic rehash rolls back but still logs the user in."""
+    # Hash at a cost other than BCRYPT_ROUNDS so login attempts a rehash.
+    stale_rounds = 4 if settings.BCRYPT_ROUNDS != 4 else 5
+    stale_hash = bcrypt.hashpw(b"correct-horse", bcrypt.gensalt(rounds=stale_rounds)).decode()
+    await UserRepository().create(db, email="rehash@example.com", hashed_password=stale_hash)
+
+    async def failing_update(*_args: object, **_kwargs: object) -> None:
+        raise SQLAlchemyError("simulated failure")
+
+    monkeypatch.setattr(UserRepository, "update_password", failing_update)
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "rehash@example.com", "password": "correct-horse"},
+    )
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_login_email_limit_is_per_client_ip(client: AsyncClient, db: AsyncSession) -> None:
+    """Failed attempts from one IP do not lock the account out for another IP."""
+    hashed = bcrypt.hashpw(b"correct-horse", bcrypt.gensalt(rounds=4)).decode()
+    await UserRepository().create(db, email="throttled@example.com", hashed_password=hashed)
+
+    def from_ip(ip: str) -> AsyncClient:
+        # Shares the ``client`` fixture's dependency overrides.
+        return AsyncClient(
+            transport=ASGITransport(app=app, client=(ip, 12345)), base_url="http://test"
+        )
+
+    async with from_ip("203.0.113.1") as attacker:
+        for _ in range(settings.LOGIN_MAX_ATTEMPTS_PER_EMAIL):
+            response = await attacker.post(
+                "/api/v1/auth/login",
+                json={"email": "throttled@example.com", "password": "wrong"},
+            )
+            assert response.status_code == 401
+        response = await attacker.post(
+            "/api/v1/auth/login",
+            json={"email": "throttled@example.com", "password": "wrong"},
+        )
+        assert response.status_code == 429
+
+    async with from_ip("203.0.113.2") as owner:
+        response = await owner.post(
+            "/api/v1/auth/login",
+            json={"email": "throttled@example.com", "password": "correct-horse"},
+        )
+    assert response.status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# Revocation list
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_revocation_notified_during_reload_is_kept(db: AsyncSession) -> None:
+    """A revocation notified while a reload's query is in flight survives the reload."""
+    expires_at = time.time() + 600
+    await RevokedTokenRepository().revoke(
+        db, jti="in-table", expires_at=datetime.fromtimestamp(expires_at, UTC)
+    )
+
+    class NotifiedMidReload(RevokedTokenRepository):
+        async def get_active(self, db: AsyncSession) -> list[tuple[str, datetime]]:
+            active = await super().get_active(db)
+            # The row for this jti committed after the snapshot was read.
+            revoked_tokens.add("notified-mid-reload", expires_at)
+            return active
+
+    await load_revocations(async_sessionmaker(bind=db.bind), repo=NotifiedMidReload())
+
+    assert revoked_tokens.is_revoked("in-table")
+    assert revoked_tokens.is_revoked("notified-mid-reload")
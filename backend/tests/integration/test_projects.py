@@ -9,9 +9,16 @@ Run with:
     uv run pytest -m integration tests/integration/
 """
 
+import base64
+import json
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
 import pytest
 from httpx import AsyncClient
 
+from app.db.instrumentation import QueryCounter
+
 pytestmark = pytest.mark.integration
 
 
@@ -28,6 +35,139 @@ async def test_list_projects_empty(client: AsyncClient) -> None:
     assert response.json() == []
 
 
+@pytest.mark.asyncio
+async def test_list_projects_query_budget(
+    client: AsyncClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryCounter]],
+) -> None:
+    """Listing projects is one SELECT no matter how many projects exist."""
+    for i in range(5):
+        created = await client.post(
+            "/api/v1/projects/", json={"title": f"Budget {i}", "description": "d"}
+        )
+        assert created.status_code == 201
+
+    with query_budget(1):
+        response = await client.get("/api/v1/projects/", params={"published_only": False})
+    assert response.status_code == 200
+    assert len(response.json()) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_projects_matches_detail(client: AsyncClient) -> None:
+    """List items are serialized exactly like the single-project response."""
+    await client.post(
+        "/api/v1/projects/",
+        json={"title": "Same Shape", "description": "d", "tags": ["a"], "published": True},
+    )
+
+    listed = await client.get("/api/v1/projects/")
+    detail = await client.get("/api/v1/projects/same-shape")
+    assert listed.headers["content-type"] == "application/json"
+    assert listed.json() == [detail.json()]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/projects/page
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_projects_page_follows_cursor(client: AsyncClient) -> None:
+    """Following ``next_cursor`` visits every project once, in list order."""
+    for i in range(5):
+        created = await client.post(
+            "/api/v1/projects/",
+            json={"title": f"Page {i}", "description": "d", "order": i % 2},
+        )
+        assert created.status_code == 201
+    expected = [
+        p["slug"]
+        for p in (await client.get("/api/v1/projects/", params={"published_only": False})).json()
+    ]
+
+    slugs: list[str] = []
+    cursor = None
+    for _ in range(3):
+        params = {"published_only": False, "limit": 2} | ({"cursor": cursor} if cursor else {})
+        page = (await client.get("/api/v1/projects/page", params=params)).json()
+        slugs += [p["slug"] for p in page["items"]]
+        cursor = page["next_cursor"]
+    assert slugs == expected
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_projects_page_items_are_summaries(client: AsyncClient) -> None:
+    """Page items carry the card fields but not the long-form ``content``."""
+    created = await client.post(
+        "/api/v1/projects/",
+        json={"title": "Summary", "description": "Card text.", "content": "x" * 5000},
+    )
+    assert created.status_code == 201
+    page = (await client.get("/api/v1/projects/page", params={"published_only": False})).json()
+    assert page["items"][0]["description"] == "Card text."
+    assert "content" not in page["items"][0]
+
+
+@pytest.mark.asyncio
+async def test_projects_page_invalid_cursor_returns_422(client: AsyncClient) -> None:
+    """A cursor that was not issued by the API is rejected with 422."""
+    response = await client.get("/api/v1/projects/page", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "key",
+    [
+        [1, "2024-01-01T00:00:00", 123],
+        [1, "2024-01-01T00:00:00", ["not", "a", "uuid"]],
+        [{"order": 1}, "2024-01-01T00:00:00", "00000000-0000-0000-0000-000000000001"],
+        [10**30, "2024-01-01T00:00:00", "00000000-0000-0000-0000-000000000001"],
+        [2**31, "2024-01-01T00:00:00", "00000000-0000-0000-0000-000000000001"],
+    ],
+)
+async def test_projects_page_wrong_typed_cursor_returns_422(
+    client: AsyncClient, key: list[object]
+) -> None:
+    """A well-formed cursor holding values of the wrong type is rejected with 422."""
+    cursor = base64.urlsafe_b64encode(json.dumps(key).encode()).rstrip(b"=").decode()
+    response = await client.get("/api/v1/projects/page", params={"cursor": cursor})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_projects_page_query_budget(
+    client: AsyncClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryCounter]],
+) -> None:
+    """Each page — first or later — is one SELECT."""
+    for i in range(3):
+        created = await client.post(
+            "/api/v1/projects/", json={"title": f"Budget Page {i}", "description": "d"}
+        )
+        assert created.status_code == 201
+
+    with query_budget(1) as queries:
+        first = await client.get(
+            "/api/v1/projects/page", params={"published_only": False, "limit": 1}
+        )
+    assert first.status_code == 200
+    assert queries.count == 1
+    cursor = first.json()["next_cursor"]
+    assert cursor is not None
+
+    with query_budget(1) as queries:
+        second = await client.get(
+            "/api/v1/projects/page",
+            params={"published_only": False, "limit": 1, "cursor": cursor},
+        )
+    assert second.status_code == 200
+    assert queries.count == 1
+    assert second.json()["items"][0]["slug"] != first.json()["items"][0]["slug"]
+
+
 # ---------------------------------------------------------------------------
 # POST /api/v1/projects/
 # ---------------------------------------------------------------------------
@@ -101,6 +241,29 @@ async def test_create_project_duplicate_slug_returns_409(client: AsyncClient) ->
     assert "slug" in r2.json()["detail"].lower()
 
 
+@pytest.mark.asyncio
+async def test_create_project_query_budget(
+    client: AsyncClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryCounter]],
+) -> None:
+    """Creating a project — or hitting a slug conflict — is one INSERT."""
+    payload = {"title": "Budget Create", "description": "d", "slug": "budget-create"}
+
+    # Pin the exact count as well: a request rejected before reaching the
+    # database (e.g. a 401) would otherwise pass the budget with zero.
+    with query_budget(1) as queries:
+        created = await client.post("/api/v1/projects/", json=payload)
+    assert created.status_code == 201
+    assert queries.count == 1
+    assert created.json()["id"]
+    assert created.json()["created_at"]
+
+    with query_budget(1) as queries:
+        conflict = await client.post("/api/v1/projects/", json=payload)
+    assert conflict.status_code == 409
+    assert queries.count == 1
+
+
 @pytest.mark.asyncio
 async def test_create_project_missing_required_fields_returns_422(client: AsyncClient) -> None:
     """Omitting required fields returns 422 Unprocessable Entity."""
@@ -130,6 +293,22 @@ async def test_get_project_by_slug(client: AsyncClient) -> None:
     assert response.json()["title"] == "Slug Fetch Test"
 
 
+@pytest.mark.asyncio
+async def test_get_project_by_slug_query_budget(
+    client: AsyncClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryCounter]],
+) -> None:
+    """Fetching a project by slug is a single SELECT."""
+    created = await client.post(
+        "/api/v1/projects/", json={"title": "Budget Slug", "description": "d"}
+    )
+    assert created.status_code == 201
+
+    with query_budget(1):
+        response = await client.get("/api/v1/projects/budget-slug")
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_get_project_not_found_returns_404(client: AsyncClient) -> None:
     """Fetching a non-existent slug returns 404 with a detail message."""
@@ -177,6 +356,43 @@ async def test_update_project_not_found_returns_404(client: AsyncClient) -> None
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_update_project_to_taken_slug_returns_409(client: AsyncClient) -> None:
+    """Renaming a project to another project's slug returns 409 Conflict."""
+    for slug in ("a", "b"):
+        created = await client.post(
+            "/api/v1/projects/", json={"title": slug.upper(), "description": "d", "slug": slug}
+        )
+        assert created.status_code == 201
+
+    response = await client.patch("/api/v1/projects/b", json={"slug": "a"})
+    assert response.status_code == 409
+    assert "slug" in response.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_project_query_budget(
+    client: AsyncClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryCounter]],
+) -> None:
+    """PATCH and DELETE are one statement each and never load the row first."""
+    payload = {"title": "Budget Write", "description": "d", "slug": "budget-write"}
+    created = await client.post("/api/v1/projects/", json=payload)
+    assert created.status_code == 201
+
+    with query_budget(1) as queries:
+        patched = await client.patch("/api/v1/projects/budget-write", json={"order": 3})
+    assert patched.status_code == 200
+    assert queries.count == 1
+    assert patched.json()["order"] == 3
+    assert patched.json()["title"] == "Budget Write"
+
+    with query_budget(1) as queries:
+        deleted = await client.delete("/api/v1/projects/budget-write")
+    assert deleted.status_code == 204
+    assert queries.count == 1
+
+
 # ---------------------------------------------------------------------------
 # DELETE /api/v1/projects/{slug}
 # ---------------------------------------------------------------------------
@@ -17,6 +17,7 @@
  *   onToken: (chunk) => { ... }, // called for every streamed token
  *   onDone: () => { ... },       // called when stream ends cleanly
  *   onError: (msg) => { ... },   // called on network or AI error
+ *   onQueue: (pos) => { ... },   // optional — called while waiting for a slot
  * });
  * ```
  *
@@ -43,6 +44,11 @@ export interface WriteOptions {
   onDone: () => void;
   /** Called if the stream ends with an error (network, HTTP, or AI service). */
   onError: (message: string) => void;
+  /**
+   * Called while the request waits in the backend admission queue, with the
+   * 1-based queue position.  Fires again every time the position changes.
+   */
+  onQueue?: (position: number) => void;
 }
 
 export interface UseAiWriteReturn {
@@ -83,7 +89,7 @@ export function useAiWrite(): UseAiWriteReturn {
   }, []);
 
   const write = useCallback(async (opts: WriteOptions): Promise<void> => {
-    const { prompt, mode, context, onToken, onDone, onError } = opts;
+    const { prompt, mode, context, onToken, onDone, onError, onQueue } = opts;
 
     // Cancel any previous in-flight request before starting a new one.
     abortRef.current?.abort();
@@ -128,6 +134,7 @@ export function useAiWrite(): UseAiWriteReturn {
       // ── SSE parsing ────────────────────────────────────────────────────────
       //
       // The backend emits:
+      //   event: queue\ndata: {"position": N}\n\n  ← while waiting for a slot
       //   data: <token text>\n\n     ← one or more of these
       //   data: [DONE]\n\n           ← terminal sentinel
       //   event: error\ndata: <msg>\n\n  ← on AI service error
@@ -138,7 +145,7 @@ export function useAiWrite(): UseAiWriteReturn {
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       let buffer = "";
-      let isErrorEvent = false;
+      let eventType = "message";
 
       outer: while (true) {
         const { done, value } = await reader.read();
@@ -151,8 +158,8 @@ export function useAiWrite(): UseAiWriteReturn {
         buffer = lines.pop() ?? "";
 
         for (const line of lines) {
-          if (line === "event: error") {
-            isErrorEvent = true;
+          if (line.startsWith("event: ")) {
+            eventType = line.slice(7);
             continue;
           }
 
@@ -164,19 +171,29 @@ export function useAiWrite(): UseAiWriteReturn {
               break outer;
             }
 
-            if (isErrorEvent) {
+            if (eventType === "error") {
               onError(data);
-              isErrorEvent = false;
+              eventType = "message";
               break outer;
             }
 
+            if (eventType === "queue") {
+              try {
+                const { position } = JSON.parse(data) as { position: number };
+                onQueue?.(position);
+              } catch {
+                // ignore malformed queue frames
+              }
+              continue;
+            }
+
             onToken(data);
             continue;
           }
 
           // Blank line resets the SSE event boundary.
           if (line === "") {
-            isErrorEvent = false;
+            eventType = "message";
           }
         }
       }